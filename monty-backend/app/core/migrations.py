@@ -0,0 +1,46 @@
+"""Alembic migration runner used at startup, by scripts and by the benchmarks."""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+
+from app.core.config import engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def alembic_config() -> Config:
+    cfg = Config(str(BACKEND_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    cfg.attributes["configure_logger"] = False
+    return cfg
+
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(bind: Engine = engine) -> str | None:
+    with bind.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def upgrade_to_head(bind: Engine = engine) -> None:
+    cfg = alembic_config()
+    with bind.begin() as conn:
+        cfg.attributes["connection"] = conn
+        command.upgrade(cfg, "head")
+
+
+def ensure_schema_current(bind: Engine = engine) -> None:
+    """Compare the stored schema version with the migration head; upgrade only when behind."""
+    head = head_revision()
+    current = current_revision(bind)
+    if current == head:
+        return
+    print(f"[migrations] schema at {current or 'unversioned'}, upgrading to {head}")
+    upgrade_to_head(bind)
@@ -0,0 +1,80 @@
+"""
+Process-wide cache of small reference tables (finance categories, food units, meal
+categories).
+
+A ``ReferenceTable`` loads the whole table in one query and keeps detached
+``RowSnapshot`` copies, ordered as loaded and indexed by id. The CRUD endpoints of a
+table call ``invalidate`` after committing; a load that started before an ``invalidate``
+is not cached, so it cannot replace the fresh data. ``REFERENCE_TTL_SECONDS`` bounds how long
+an edit made outside this process (another worker, manual SQL) goes unseen.
+Serializers without a session may call ``get`` / ``by_id`` with no ``db``; a miss then
+loads through a short-lived session of its own. Writes validate foreign keys against
+their own session, not against this cache.
+"""
+
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import SessionLocal
+
+REFERENCE_TTL_SECONDS = 300
+
+
+class RowSnapshot:
+    """Column values of one ORM row, safe to share across sessions and threads."""
+
+    def __init__(self, values: dict):
+        self.__dict__.update(values)
+
+    @classmethod
+    def from_row(cls, row) -> "RowSnapshot":
+        return cls({attr.key: getattr(row, attr.key) for attr in inspect(row).mapper.column_attrs})
+
+    def __repr__(self) -> str:
+        return f"RowSnapshot({self.__dict__!r})"
+
+
+class ReferenceTable:
+    def __init__(self, name: str, load: Callable[[Session], list]):
+        self.name = name
+        self._load = load
+        self._cache = LRUCache(maxsize=1, ttl_seconds=REFERENCE_TTL_SECONDS)
+        # bumped by ``invalidate``; a snapshot is cached only if no bump happened while loading
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _snapshot(self, db: Optional[Session]) -> tuple[list[RowSnapshot], dict[int, RowSnapshot]]:
+        snapshot = self._cache.get(self.name)
+        if snapshot is None:
+            generation = self._generation
+            if db is None:
+                with SessionLocal() as own_db:
+                    rows = [RowSnapshot.from_row(r) for r in self._load(own_db)]
+            else:
+                rows = [RowSnapshot.from_row(r) for r in self._load(db)]
+            snapshot = (rows, {r.id: r for r in rows})
+            with self._lock:
+                if self._generation == generation:
+                    self._cache.set(self.name, snapshot)
+        return snapshot
+
+    def rows(self, db: Optional[Session] = None) -> list[RowSnapshot]:
+        return self._snapshot(db)[0]
+
+    def by_id(self, db: Optional[Session] = None) -> dict[int, RowSnapshot]:
+        return self._snapshot(db)[1]
+
+    def get(self, row_id: Optional[int], db: Optional[Session] = None) -> Optional[RowSnapshot]:
+        return self.by_id(db).get(row_id) if row_id is not None else None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        return {"table": self.name, **self._cache.stats()}
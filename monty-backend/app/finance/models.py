@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, BigInteger, Boolean, ForeignKey, DateTime, Date, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, BigInteger, Boolean, ForeignKey, DateTime, Date, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from app.core.config import Base
 import enum
@@ -33,6 +33,8 @@ class Category(Base):
     group = Column(SQLEnum(CategoryGroup), nullable=False)
     type = Column(SQLEnum(TransactionType), nullable=False)
     icon = Column(String(10), nullable=False)
+    # set by DELETE /categories/{id}; rows are purged in the background (category_purges)
+    archived_at = Column(DateTime, nullable=True)
 
     transactions = relationship("Transaction", back_populates="category")
     budgets = relationship("MonthlyBudget", back_populates="category")
@@ -47,8 +49,31 @@ class MonthlyBudget(Base):
 
     category = relationship("Category", back_populates="budgets")
 
+class CategoryBudgetLimit(Base):
+    """Current limit per category, denormalized from the latest ``MonthlyBudget`` row."""
+
+    __tablename__ = "category_budget_limits"
+
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    limit_amount = Column(Integer, nullable=False)
+
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_category_id_transaction_date", "category_id", "transaction_date"),
+        # keyset pagination of GET /transactions on (transaction_date, id)
+        Index("ix_transactions_transaction_date_id", "transaction_date", "id"),
+        # delta sync: GET /transactions/changes walks (updated_at, id)
+        Index("ix_transactions_updated_at_id", "updated_at", "id"),
+        # covers the columnar analytics fetch so long windows are read index-only
+        Index(
+            "ix_transactions_transaction_date_columnar",
+            "transaction_date",
+            "category_id",
+            "user_id",
+            "amount",
+        ),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -56,10 +81,96 @@ class Transaction(Base):
     amount = Column(Integer, nullable=False)
     transaction_date = Column(DateTime, default=datetime.utcnow)
     comment = Column(String(255), nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     user = relationship("User", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
 
+class TransactionTombstone(Base):
+    """Ids of deleted transactions, kept for delta sync until ``sync_service`` purges them."""
+
+    __tablename__ = "transaction_tombstones"
+    __table_args__ = (
+        Index("ix_transaction_tombstones_deleted_at_transaction_id", "deleted_at", "transaction_id"),
+    )
+
+    transaction_id = Column(String(36), primary_key=True)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+class NotificationOutbox(Base):
+    """Telegram messages written with the change that caused them, delivered by a background job."""
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        # the delivery worker polls pending rows that are due
+        Index("ix_notification_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(30), nullable=False)
+    payload = Column(Text, nullable=False)
+    status = Column(String(10), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+class IdempotencyKey(Base):
+    """Stored response of a keyed ``POST``, replayed for retries until ``expires_at``."""
+
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=False)
+    response_body = Column(Text, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+class FinancialPeriod(Base):
+    """Salary-period calendar; ``id`` is ``YYYYMM`` of the month the period starts in."""
+
+    __tablename__ = "financial_periods"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    start_date = Column(Date, unique=True, nullable=False)
+    end_date = Column(Date, nullable=False)
+
+class TransactionDailyRollup(Base):
+    __tablename__ = "transaction_daily_rollups"
+    __table_args__ = (
+        # per-period sums are equality GROUP BYs on period_id
+        Index("ix_transaction_daily_rollups_period_id_category_id", "period_id", "category_id"),
+    )
+
+    day = Column(Date, primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_amount = Column(BigInteger, nullable=False, default=0)
+    tx_count = Column(Integer, nullable=False, default=0)
+    period_id = Column(Integer, ForeignKey("financial_periods.id"), nullable=True)
+
+class CategoryBalance(Base):
+    """All-time total per category, kept in step with ledger writes by ``rollup_service``."""
+
+    __tablename__ = "category_balances"
+
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    total_amount = Column(BigInteger, nullable=False, default=0)
+    tx_count = Column(Integer, nullable=False, default=0)
+
+class CategoryPurge(Base):
+    """Background removal of an archived category's transactions, with progress."""
+
+    __tablename__ = "category_purges"
+
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    total_count = Column(Integer, nullable=False, default=0)
+    purged_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
 class Settings(Base):
     __tablename__ = "settings"
 
@@ -1,18 +1,44 @@
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.core.config import get_db
-from app.finance.models import User, Transaction, TransactionType, CategoryGroup
-from app.finance.schemas import AnalyticsResponse
-from app.middleware.auth import get_current_user
+from app.finance.models import CategoryGroup, TransactionType
+from app.finance.schemas import (
+    AnalyticsResponse,
+    TrendCategorySeries,
+    TrendPeriod,
+    TrendResponse,
+)
+from app.middleware.auth import UserSnapshot, get_current_user
+from app.finance.services import columnar_analytics
+from app.finance.services.analytics_aggregates import (
+    COMPARISON_KINDS,
+    comparison_totals,
+    non_savings_expense_amounts,
+    period_category_totals,
+    reference_windows,
+    series_rows,
+    summarize_breakdown,
+    window_breakdown_rows,
+)
+from app.finance.services.analytics_cache import analytics_cache_stats, cached_analytics
 from app.finance.services.analytics_helpers import large_one_off_expense_total
 from app.finance.services.budget_period_service import build_budgets_with_spent, date_range_to_datetimes
+from app.finance.services.database import (
+    get_financial_periods_between,
+    get_recent_financial_periods,
+)
+from app.finance.services.settings_service import SettingsService
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+ComparisonKind = Literal["previous", "last_year", "trailing_avg"]
+Granularity = Literal["day", "week", "month", "period"]
+AnalyticsEngine = Literal["sql", "numpy"]
+
 
 def _parse_boundary_date(s: Optional[str], default: date) -> date:
     if not s:
@@ -23,142 +49,72 @@ def _parse_boundary_date(s: Optional[str], default: date) -> date:
     return date.fromisoformat(raw[:10])
 
 
+def _normalize_compare(compare: list[str]) -> list[str]:
+    return [kind for kind in COMPARISON_KINDS if kind in compare]
+
+
 def _build_analytics_response(
     db: Session,
-    transactions: list,
     window_start: datetime,
     window_end: datetime,
     period_start_str: str,
     period_end_str: str,
-    comparison_previous_period: Optional[dict],
+    compare: list[str],
+    granularity: str = "day",
+    salary_day: Optional[int] = None,
+    engine: str = "sql",
 ) -> AnalyticsResponse:
-    total_income = sum(
-        t.amount for t in transactions if t.category.type == TransactionType.INCOME
+    periods = (
+        get_financial_periods_between(window_start.date(), window_end.date(), salary_day)
+        if granularity == "period"
+        else None
     )
-    total_expenses = sum(
-        t.amount
-        for t in transactions
-        if t.category.type == TransactionType.EXPENSE
-        and t.category.group != CategoryGroup.SAVINGS
-    )
-    total_savings = sum(
-        t.amount
-        for t in transactions
-        if t.category.type == TransactionType.EXPENSE
-        and t.category.group == CategoryGroup.SAVINGS
-    )
-    balance = total_income - total_expenses
-
-    by_category = {}
-    for t in transactions:
-        cat_name = t.category.name
-        cat_icon = t.category.icon
-        cat_type = t.category.type
-        cat_group = t.category.group
-
-        if cat_name not in by_category:
-            by_category[cat_name] = {
-                "name": cat_name,
-                "icon": cat_icon,
-                "income": 0,
-                "expense": 0,
-                "savings": 0,
-            }
-        if cat_type == TransactionType.INCOME:
-            by_category[cat_name]["income"] += t.amount
-        elif cat_group == CategoryGroup.SAVINGS:
-            by_category[cat_name]["savings"] += t.amount
-        else:
-            by_category[cat_name]["expense"] += t.amount
+    if engine == "numpy":
+        columns = columnar_analytics.load_window(db, window_start, window_end)
+        summary = columnar_analytics.summarize(columns)
+        series = columnar_analytics.series(columns, granularity, periods)
+        large_one_off = columnar_analytics.large_one_off_total(
+            columnar_analytics.expense_amounts(columns)
+        )
+    else:
+        summary = summarize_breakdown(window_breakdown_rows(db, window_start, window_end))
+        series = series_rows(db, window_start, window_end, granularity, periods)
+        large_one_off = large_one_off_expense_total(
+            non_savings_expense_amounts(db, window_start, window_end)
+        )
 
-    def _cat_type(v):
-        if v["income"] > 0:
-            return "income"
-        if v["savings"] > 0:
-            return "savings"
-        return "expense"
+    by_category_list = summary["by_category"]
+    top_expenses = [x for x in by_category_list if x.get("type") in ("expense", "savings")][:5]
 
-    by_category_list = [
+    comparisons = comparison_totals(
+        db, reference_windows(window_start.date(), window_end.date(), compare)
+    )
+    previous = comparisons.get("previous")
+    comparison_previous_period = (
         {
-            "name": v["name"],
-            "icon": v["icon"],
-            "amount": v["expense"] or v["savings"] or v["income"],
-            "type": _cat_type(v),
+            "total_income": previous["total_income"],
+            "total_expenses": previous["total_expenses"],
+            "balance": previous["balance"],
         }
-        for v in by_category.values()
-    ]
-    by_category_list.sort(key=lambda x: x["amount"], reverse=True)
-
-    by_group = {}
-    for t in transactions:
-        group = t.category.group.value
-        if group not in by_group:
-            by_group[group] = {"group": group, "income": 0, "expense": 0, "savings": 0}
-        if t.category.type == TransactionType.INCOME:
-            by_group[group]["income"] += t.amount
-        elif t.category.group == CategoryGroup.SAVINGS:
-            by_group[group]["savings"] += t.amount
-        else:
-            by_group[group]["expense"] += t.amount
-
-    by_group_list = []
-    for g in by_group.values():
-        if g["income"] > 0:
-            by_group_list.append({"group": g["group"], "amount": g["income"], "type": "income"})
-        if g["expense"] > 0:
-            by_group_list.append({"group": g["group"], "amount": g["expense"], "type": "expense"})
-        if g["savings"] > 0:
-            by_group_list.append({"group": g["group"], "amount": g["savings"], "type": "savings"})
-    by_group_list.sort(key=lambda x: x["amount"], reverse=True)
-
-    daily_data = {}
-    for t in transactions:
-        day = t.transaction_date.date().isoformat()
-        if day not in daily_data:
-            daily_data[day] = {"date": day, "income": 0, "expense": 0}
-        if t.category.type == TransactionType.INCOME:
-            daily_data[day]["income"] += t.amount
-        elif t.category.group != CategoryGroup.SAVINGS:
-            daily_data[day]["expense"] += t.amount
-
-    daily_list = sorted(daily_data.values(), key=lambda x: x["date"])
-
-    top_expenses = [x for x in by_category_list if x.get("type") in ("expense", "savings")][:5]
-
-    by_user_map = {}
-    for t in transactions:
-        uid = t.user_id
-        name = t.user.first_name or "Без имени"
-        if uid not in by_user_map:
-            by_user_map[uid] = {
-                "user_id": uid,
-                "user_name": name,
-                "income": 0,
-                "expense": 0,
-                "savings": 0,
-            }
-        if t.category.type == TransactionType.INCOME:
-            by_user_map[uid]["income"] += t.amount
-        elif t.category.group == CategoryGroup.SAVINGS:
-            by_user_map[uid]["savings"] += t.amount
-        else:
-            by_user_map[uid]["expense"] += t.amount
-    by_user_list = list(by_user_map.values())
+        if previous
+        else None
+    )
 
     budgets_with_spent = build_budgets_with_spent(db, window_start, window_end)
-    large_one_off = large_one_off_expense_total(transactions)
 
     return AnalyticsResponse(
-        total_income=total_income,
-        total_expenses=total_expenses,
-        total_savings=total_savings,
-        balance=balance,
+        total_income=summary["total_income"],
+        total_expenses=summary["total_expenses"],
+        total_savings=summary["total_savings"],
+        balance=summary["total_income"] - summary["total_expenses"],
         by_category=by_category_list[:10],
-        by_group=by_group_list,
-        daily_data=daily_list,
+        by_group=summary["by_group"],
+        daily_data=series,
+        granularity=granularity,
         top_expenses=top_expenses,
-        by_user=by_user_list,
+        by_user=summary["by_user"],
         comparison_previous_period=comparison_previous_period,
+        comparisons=comparisons,
         period_start=period_start_str,
         period_end=period_end_str,
         large_one_off_total=large_one_off,
@@ -166,56 +122,83 @@ def _build_analytics_response(
     )
 
 
+def _build_trend_response(
+    db: Session,
+    salary_day: int,
+    windows: list[tuple[date, date]],
+) -> TrendResponse:
+    totals = [{"income": 0, "expense": 0, "savings": 0} for _ in windows]
+    series: dict[int, TrendCategorySeries] = {}
+
+    for r in period_category_totals(db, windows):
+        if r.bucket is None:
+            continue
+        amount = int(r.total or 0)
+        if r.category_type == TransactionType.INCOME:
+            kind = "income"
+        elif r.category_group == CategoryGroup.SAVINGS:
+            kind = "savings"
+        else:
+            kind = "expense"
+        totals[r.bucket][kind] += amount
+
+        item = series.get(r.category_id)
+        if item is None:
+            item = series[r.category_id] = TrendCategorySeries(
+                category_id=r.category_id,
+                name=r.category_name,
+                icon=r.category_icon,
+                group=r.category_group.value,
+                type=kind,
+                amounts=[0] * len(windows),
+            )
+        item.amounts[r.bucket] += amount
+
+    return TrendResponse(
+        salary_day=salary_day,
+        periods=[
+            TrendPeriod(
+                period_start=start_d.isoformat(),
+                period_end=end_d.isoformat(),
+                total_income=t["income"],
+                total_expenses=t["expense"],
+                total_savings=t["savings"],
+                balance=t["income"] - t["expense"],
+            )
+            for (start_d, end_d), t in zip(windows, totals)
+        ],
+        categories=sorted(series.values(), key=lambda c: sum(c.amounts), reverse=True),
+    )
+
+
 @router.get("", response_model=AnalyticsResponse)
 def get_analytics(
     months: int = Query(3, ge=1, le=12),
-    current_user: User = Depends(get_current_user),
+    compare: list[ComparisonKind] = Query(["previous"]),
+    granularity: Granularity = Query("day"),
+    engine: AnalyticsEngine = Query("sql"),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    end_date = datetime.utcnow()
-    start_date = end_date - timedelta(days=30 * months)
-
-    transactions = (
-        db.query(Transaction)
-        .options(joinedload(Transaction.user))
-        .filter(
-            Transaction.transaction_date >= start_date,
-            Transaction.transaction_date <= end_date,
-        )
-        .all()
-    )
-
-    prev_start = start_date - timedelta(days=30 * months)
-    prev_transactions = db.query(Transaction).filter(
-        Transaction.transaction_date >= prev_start,
-        Transaction.transaction_date < start_date,
-    ).all()
-    prev_income = sum(
-        t.amount for t in prev_transactions if t.category.type == TransactionType.INCOME
-    )
-    prev_expenses = sum(
-        t.amount
-        for t in prev_transactions
-        if t.category.type == TransactionType.EXPENSE
-        and t.category.group != CategoryGroup.SAVINGS
-    )
-    comparison_previous_period = {
-        "total_income": prev_income,
-        "total_expenses": prev_expenses,
-        "balance": prev_income - prev_expenses,
-    }
-
-    period_start_str = start_date.date().isoformat()
-    period_end_str = end_date.date().isoformat()
-
-    return _build_analytics_response(
-        db,
-        transactions,
-        start_date,
-        end_date,
-        period_start_str,
-        period_end_str,
-        comparison_previous_period,
+    end_d = datetime.utcnow().date()
+    start_d = end_d - timedelta(days=30 * months)
+    start_date, end_date = date_range_to_datetimes(start_d, end_d)
+    compare = _normalize_compare(compare)
+    salary_day = SettingsService.get_salary_day(db) if granularity == "period" else None
+
+    return cached_analytics(
+        ("months", months, end_d, tuple(compare), granularity, salary_day, engine),
+        lambda: _build_analytics_response(
+            db,
+            start_date,
+            end_date,
+            start_d.isoformat(),
+            end_d.isoformat(),
+            compare,
+            granularity,
+            salary_day,
+            engine,
+        ),
     )
 
 
@@ -223,7 +206,10 @@ def get_analytics(
 def get_analytics_for_period(
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
+    compare: list[ComparisonKind] = Query(["previous"]),
+    granularity: Granularity = Query("day"),
+    engine: AnalyticsEngine = Query("sql"),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     today = datetime.utcnow().date()
@@ -236,50 +222,39 @@ def get_analytics_for_period(
         start_d, end_d = end_d, start_d
 
     window_start, window_end = date_range_to_datetimes(start_d, end_d)
-
-    transactions = (
-        db.query(Transaction)
-        .options(joinedload(Transaction.user))
-        .filter(
-            Transaction.transaction_date >= window_start,
-            Transaction.transaction_date <= window_end,
-        )
-        .all()
+    compare = _normalize_compare(compare)
+    salary_day = SettingsService.get_salary_day(db) if granularity == "period" else None
+
+    return cached_analytics(
+        ("period", start_d, end_d, tuple(compare), granularity, salary_day, engine),
+        lambda: _build_analytics_response(
+            db,
+            window_start,
+            window_end,
+            start_d.isoformat(),
+            end_d.isoformat(),
+            compare,
+            granularity,
+            salary_day,
+            engine,
+        ),
     )
 
-    delta = window_end - window_start
-    comparison_previous_period = None
-    if delta.total_seconds() > 0:
-        prev_end_dt = window_start
-        prev_start_dt = window_start - delta
-        prev_transactions = db.query(Transaction).filter(
-            Transaction.transaction_date >= prev_start_dt,
-            Transaction.transaction_date < prev_end_dt,
-        ).all()
-        prev_income = sum(
-            t.amount for t in prev_transactions if t.category.type == TransactionType.INCOME
-        )
-        prev_expenses = sum(
-            t.amount
-            for t in prev_transactions
-            if t.category.type == TransactionType.EXPENSE
-            and t.category.group != CategoryGroup.SAVINGS
-        )
-        comparison_previous_period = {
-            "total_income": prev_income,
-            "total_expenses": prev_expenses,
-            "balance": prev_income - prev_expenses,
-        }
 
-    period_start_str = start_d.isoformat()
-    period_end_str = end_d.isoformat()
-
-    return _build_analytics_response(
-        db,
-        transactions,
-        window_start,
-        window_end,
-        period_start_str,
-        period_end_str,
-        comparison_previous_period,
+@router.get("/trend", response_model=TrendResponse)
+def get_analytics_trend(
+    periods: int = Query(6, ge=1, le=24),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    salary_day = SettingsService.get_salary_day(db)
+    windows = get_recent_financial_periods(periods, salary_day=salary_day)
+    return cached_analytics(
+        ("trend", salary_day, tuple(windows)),
+        lambda: _build_trend_response(db, salary_day, windows),
     )
+
+
+@router.get("/cache")
+def get_analytics_cache_stats(current_user: UserSnapshot = Depends(get_current_user)):
+    return analytics_cache_stats()
@@ -4,8 +4,7 @@ from pydantic import BaseModel
 
 from app.core.config import get_db
 from app.finance.services.auth_service import authenticate_telegram_user
-from app.middleware.auth import get_current_user
-from app.finance.models import User
+from app.middleware.auth import UserSnapshot, get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -34,7 +33,7 @@ def telegram_auth(
     return result
 
 @router.get("/me")
-def get_me(current_user: User = Depends(get_current_user)):
+def get_me(current_user: UserSnapshot = Depends(get_current_user)):
     return {
         "user_id": current_user.id,
         "telegram_id": current_user.telegram_id,
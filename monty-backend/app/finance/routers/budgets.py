@@ -1,33 +1,34 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.config import get_db
-from app.finance.models import User
 from app.finance.schemas import DashboardResponse
-from app.middleware.auth import get_current_user
+from app.middleware.auth import UserSnapshot, get_current_user
 from app.finance.services.database import get_financial_period
+from app.finance.services.period_calendar import period_id
 from app.finance.services.settings_service import SettingsService
-from app.finance.services.budget_period_service import build_budgets_with_spent, date_range_to_datetimes
+from app.finance.services.budget_period_service import build_period_budgets_with_spent
+from app.finance.services.budget_forecast import apply_forecast
 
 router = APIRouter(prefix="/budgets", tags=["Budgets"])
 
 @router.get("/current", response_model=DashboardResponse)
 def get_current_budgets(
-    current_user: User = Depends(get_current_user),
+    forecast: bool = Query(False, description="Add projected end-of-period spend and overspend date"),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    salary_day = SettingsService.get_salary_day(db)
-    period_start, period_end = get_financial_period(salary_day=salary_day)
-    window_start, window_end = date_range_to_datetimes(period_start, period_end)
-    budget_items = build_budgets_with_spent(db, window_start, window_end)
+    app_settings = SettingsService.load(db)
+    period = get_financial_period(salary_day=app_settings.salary_day)
+    budget_items = build_period_budgets_with_spent(db, period_id(period[0]))
+    if forecast:
+        apply_forecast(db, budget_items, period, app_settings.salary_day)
 
     savings_deposit = next((b for b in budget_items if b.group == "SAVINGS"), None)
     current_savings = savings_deposit.spent if savings_deposit else 0
 
-    target_amount = SettingsService.get_target_amount(db)
-
     return DashboardResponse(
-        total_savings_goal=target_amount,
+        total_savings_goal=app_settings.target_amount,
         current_savings=current_savings,
         budgets=budget_items,
     )
@@ -1,10 +1,11 @@
 from typing import List
 
 from app.core.config import get_db
-from app.finance.models import Category, MonthlyBudget, Transaction
-from app.finance.schemas import CategoryCreate, CategoryResponse, CategoryUpdate
-from app.finance.services.database import get_financial_period
-from app.finance.services.settings_service import SettingsService
+from app.finance.models import Category
+from app.finance.schemas import CategoryCreate, CategoryPurgeResponse, CategoryResponse, CategoryUpdate
+from app.finance.services import category_archive, reference_data
+from app.finance.services.analytics_cache import bump_data_version
+from app.finance.services.budget_period_service import set_current_limit
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -13,34 +14,22 @@ router = APIRouter(prefix="/categories", tags=["Categories"])
 
 @router.get("", response_model=List[CategoryResponse])
 def get_categories(db: Session = Depends(get_db)):
-    categories = db.query(Category).all()
-    return categories
+    return reference_data.categories.rows(db)
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 def create_category(category_data: CategoryCreate, db: Session = Depends(get_db)):
     category = Category(**category_data.model_dump())
     db.add(category)
-    db.commit()
-    db.refresh(category)
+    db.flush()
 
     # Automatically create a budget entry for the new category with zero limit (constant budget per category)
-    from datetime import date
-
-    existing_budget = (
-        db.query(MonthlyBudget)
-        .filter(MonthlyBudget.category_id == category.id)
-        .first()
-    )
-    if not existing_budget:
-        budget = MonthlyBudget(
-            category_id=category.id,
-            period=date.today(),
-            limit_amount=0,
-        )
-        db.add(budget)
-        db.commit()
+    set_current_limit(db, category.id, 0)
+    db.commit()
+    db.refresh(category)
 
+    reference_data.categories.invalidate()
+    bump_data_version()
     return category
 
 
@@ -48,7 +37,11 @@ def create_category(category_data: CategoryCreate, db: Session = Depends(get_db)
 def update_category(
     category_id: int, category_data: CategoryUpdate, db: Session = Depends(get_db)
 ):
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = (
+        db.query(Category)
+        .filter(Category.id == category_id, Category.archived_at.is_(None))
+        .first()
+    )
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
@@ -59,20 +52,41 @@ def update_category(
         setattr(category, key, value)
 
     db.commit()
+    reference_data.categories.invalidate()
+    bump_data_version()
     db.refresh(category)
     return category
 
 
-@router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{category_id}", response_model=CategoryPurgeResponse, status_code=status.HTTP_202_ACCEPTED
+)
 def delete_category(category_id: int, db: Session = Depends(get_db)):
-    category = db.query(Category).filter(Category.id == category_id).first()
+    """
+    Archives the category at once; its transactions are purged by a background job.
+    Poll ``GET /categories/{id}/purge`` for progress.
+    """
+    category = (
+        db.query(Category)
+        .filter(Category.id == category_id, Category.archived_at.is_(None))
+        .first()
+    )
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
         )
-    # Remove related records first (foreign key constraints)
-    db.query(MonthlyBudget).filter(MonthlyBudget.category_id == category_id).delete()
-    db.query(Transaction).filter(Transaction.category_id == category_id).delete()
-    db.delete(category)
+    purge = category_archive.archive(db, category)
     db.commit()
-    return None
+    reference_data.categories.invalidate()
+    bump_data_version()
+    return purge
+
+
+@router.get("/{category_id}/purge", response_model=CategoryPurgeResponse)
+def get_category_purge(category_id: int, db: Session = Depends(get_db)):
+    purge = category_archive.purge_status(db, category_id)
+    if not purge:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No purge for this category"
+        )
+    return purge
@@ -2,15 +2,14 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.core.config import get_db, settings
-from app.middleware.auth import get_current_user
-from app.finance.models import User
+from app.middleware.auth import UserSnapshot, get_current_user
 from app.finance.services.digest_service import generate_ai_digest, send_digest_to_telegram
 
 router = APIRouter(prefix="/digest", tags=["Digest"])
 
 @router.post("/send")
 def send_digest(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     digest = generate_ai_digest(db)
@@ -1,42 +1,29 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import date
+from typing import Optional
 
 from app.core.config import get_db
-from app.finance.models import User, Transaction, Category, CategoryGroup
-from app.middleware.auth import get_current_user
+from app.finance.schemas import GoalProjectionResponse
+from app.middleware.auth import UserSnapshot, get_current_user
+from app.finance.services import goal_projection
+from app.finance.services.analytics_cache import cached_analytics
 from app.finance.services.settings_service import SettingsService
 
 router = APIRouter(prefix="/goals", tags=["Goals"])
 
 @router.get("")
 def get_goals(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    target_amount = SettingsService.get_target_amount(db)
-    target_date_str = SettingsService.get_target_date(db)
-    if not target_date_str:
-        target_date = date.today()
-    else:
-        try:
-            target_date = date.fromisoformat(target_date_str)
-        except ValueError:
-            target_date = date.today()
+    app_settings = SettingsService.load(db)
+    target_amount = app_settings.target_amount
+    target_date = app_settings.target_date or date.today()
 
     today = date.today()
     
-    savings_category_ids = [
-        c.id for c in db.query(Category).filter(Category.group == CategoryGroup.SAVINGS).all()
-    ]
-    
-    if savings_category_ids:
-        total_savings = db.query(func.coalesce(func.sum(Transaction.amount), 0)).filter(
-            Transaction.category_id.in_(savings_category_ids)
-        ).scalar() or 0
-    else:
-        total_savings = 0
+    total_savings = goal_projection.savings_balance(db)
     
     days_remaining = (target_date - today).days if today < target_date else 0
     days_passed = (today - target_date).days if today >= target_date else 0
@@ -49,5 +36,31 @@ def get_goals(
         "progress_percent": round(progress_percent, 1),
         "days_remaining": days_remaining,
         "days_passed": days_passed,
-        "daily_needed": round((target_amount - total_savings) / days_remaining) if days_remaining > 0 else 0
+        "daily_needed": max(0, round((target_amount - total_savings) / days_remaining)) if days_remaining > 0 else 0
     }
+
+
+@router.get("/projection", response_model=GoalProjectionResponse)
+def get_goal_projection(
+    paths: int = Query(goal_projection.DEFAULT_PATHS, ge=100, le=goal_projection.MAX_PATHS),
+    seed: Optional[int] = Query(None, description="Fix the random draws for reproducible output"),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Monte Carlo savings trajectories toward ``target_amount`` by ``target_date``:
+    percentile bands and the probability of having reached the goal at each period end.
+    """
+    app_settings = SettingsService.load(db)
+    return cached_analytics(
+        (
+            "goal_projection",
+            paths,
+            seed,
+            date.today(),
+            app_settings.target_amount,
+            app_settings.target_date,
+            app_settings.salary_day,
+        ),
+        lambda: goal_projection.project(db, app_settings, paths, seed),
+    )
@@ -1,11 +1,10 @@
 from app.core.config import get_db
-from app.middleware.auth import get_current_user
-from app.finance.models import Category, MonthlyBudget, User
-from app.finance.services.database import get_financial_period
+from app.finance.services.analytics_cache import bump_data_version
+from app.finance.services.budget_period_service import current_limits, set_current_limit
+from app.finance.services import period_calendar, reference_data
 from app.finance.services.settings_service import SettingsService
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/settings", tags=["Settings"])
@@ -55,80 +54,50 @@ def update_setting(setting: SettingUpdate, db: Session = Depends(get_db)):
     if setting.key not in allowed_keys:
         return {"error": f"Key must be one of: {allowed_keys}"}
 
-    SettingsService.set_setting(db, setting.key, setting.value)
+    if setting.key == "salary_day":
+        # period boundaries moved: rebuild the calendar and re-stamp the rollups in the same commit
+        SettingsService.set_setting(
+            db,
+            setting.key,
+            setting.value,
+            before_commit=lambda updated: period_calendar.regenerate(db, updated.salary_day),
+        )
+        bump_data_version()
+    else:
+        SettingsService.set_setting(db, setting.key, setting.value)
 
     return {"success": True, "key": setting.key, "value": setting.value}
 
 
 @router.get("/budgets", response_model=list[BudgetConfigResponse])
 def get_budget_config(db: Session = Depends(get_db)):
-    # Постоянные лимиты: берём по одному бюджетному лимиту на категорию (последний по period)
-    latest_budgets_subquery = (
-        db.query(
-            MonthlyBudget.category_id,
-            func.max(MonthlyBudget.period).label("max_period"),
-        )
-        .group_by(MonthlyBudget.category_id)
-        .subquery()
-    )
-
-    budgets = (
-        db.query(MonthlyBudget)
-        .join(
-            latest_budgets_subquery,
-            (MonthlyBudget.category_id == latest_budgets_subquery.c.category_id)
-            & (MonthlyBudget.period == latest_budgets_subquery.c.max_period),
-        )
-        .all()
-    )
-
-    result: list[BudgetConfigResponse] = []
-    for budget in budgets:
-        result.append(
-            BudgetConfigResponse(
-                category_id=budget.category_id,
-                category_name=budget.category.name,
-                category_icon=budget.category.icon,
-                group=budget.category.group.value,
-                type=budget.category.type.value,
-                limit_amount=budget.limit_amount,
-            )
+    # Постоянные лимиты: один актуальный лимит на категорию (category_budget_limits)
+    return [
+        BudgetConfigResponse(
+            category_id=row.category_id,
+            category_name=row.name,
+            category_icon=row.icon,
+            group=row.group.value,
+            type=row.type.value,
+            limit_amount=row.limit_amount,
         )
-
-    return result
+        for row in current_limits(db)
+    ]
 
 
 @router.post("/budgets")
 def update_budget_config(config: BudgetConfig, db: Session = Depends(get_db)):
     # Обновляем/создаём один актуальный лимит на категорию (игнорируя период как текущий)
-    latest_budget = (
-        db.query(MonthlyBudget)
-        .filter(MonthlyBudget.category_id == config.category_id)
-        .order_by(MonthlyBudget.period.desc())
-        .first()
-    )
-
-    if latest_budget:
-        latest_budget.limit_amount = config.limit_amount
-    else:
-        # Используем сегодняшнюю дату как period для совместимости, но далее period не имеет значения
-        from datetime import date
-
-        budget = MonthlyBudget(
-            category_id=config.category_id,
-            period=date.today(),
-            limit_amount=config.limit_amount,
-        )
-        db.add(budget)
-
+    set_current_limit(db, config.category_id, config.limit_amount)
     db.commit()
+    bump_data_version()
 
     return {"success": True}
 
 
 @router.get("/categories", response_model=list)
 def get_all_categories(db: Session = Depends(get_db)):
-    categories = db.query(Category).all()
+    categories = reference_data.categories.rows(db)
     return [
         {
             "id": c.id,
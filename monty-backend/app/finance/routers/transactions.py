@@ -1,28 +1,92 @@
 from datetime import datetime
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Iterator, Literal, Optional, List
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, tuple_
+from sqlalchemy.exc import IntegrityError
 import io
 import csv
+import zlib
 
-from app.core.config import get_db
-from app.finance.models import User, Category, Transaction
-from app.finance.schemas import TransactionCreate, TransactionResponse, TransactionUpdate
-from app.middleware.auth import get_current_user
+from app.core.config import SessionLocal, get_db
+from app.finance.models import IdempotencyKey, User, Category, CategoryGroup, Transaction, TransactionType
+from app.finance.schemas import (
+    TransactionBatchRequest,
+    TransactionBatchResponse,
+    TransactionChangesResponse,
+    TransactionCreate,
+    TransactionImportResult,
+    TransactionResponse,
+    TransactionTotalsResponse,
+    TransactionUpdate,
+)
+from app.middleware.auth import UserSnapshot, get_current_user
+from app.finance.services import (
+    category_archive,
+    idempotency_service,
+    notification_outbox,
+    rollup_service,
+    sync_service,
+    transaction_batch,
+    transaction_import,
+    transaction_search,
+)
+from app.finance.services.analytics_cache import bump_data_version
 from app.finance.services.database import get_financial_period
-from app.finance.services.digest_service import send_transaction_notification
+from app.finance.services.keyset import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def _replay(stored: IdempotencyKey, fingerprint: str) -> Response:
+    if stored.request_hash != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{idempotency_service.IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+        )
+    return Response(
+        content=stored.response_body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers={idempotency_service.REPLAYED_HEADER: "true"},
+    )
+
 @router.post("", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 def create_transaction(
     transaction_data: TransactionCreate,
-    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=idempotency_service.IDEMPOTENCY_KEY_HEADER,
+        min_length=1,
+        max_length=idempotency_service.KEY_MAX_LENGTH,
+    ),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    category = db.query(Category).filter(Category.id == transaction_data.category_id).first()
+    """
+    With an ``Idempotency-Key`` header a retry of the same request returns the stored
+    response (``Idempotent-Replayed: true``) instead of creating another transaction.
+    """
+    fingerprint = None
+    if idempotency_key:
+        fingerprint = idempotency_service.request_hash(transaction_data.model_dump())
+        stored = idempotency_service.find(db, current_user.id, idempotency_key)
+        if stored is not None:
+            return _replay(stored, fingerprint)
+
+    category = category_archive.active_categories(db, [transaction_data.category_id]).get(
+        transaction_data.category_id
+    )
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -38,30 +102,45 @@ def create_transaction(
     )
     
     db.add(transaction)
-    db.commit()
-    db.refresh(transaction)
-    
-    send_transaction_notification(
-        db=db,
-        category_icon=category.icon,
-        category_name=category.name,
-        amount=transaction_data.amount,
-        user_name=current_user.first_name or "Пользователь",
-        comment=transaction_data.comment
+    rollup_service.add_transaction(db, transaction)
+    notification_outbox.enqueue_transaction(
+        db, transaction, category, current_user.first_name or "Пользователь"
     )
+    if idempotency_key:
+        db.flush()
+        idempotency_service.store(
+            db,
+            current_user.id,
+            idempotency_key,
+            fingerprint,
+            status.HTTP_201_CREATED,
+            TransactionResponse.model_validate(transaction).model_dump_json(),
+        )
+    try:
+        db.commit()
+    except IntegrityError:
+        # a concurrent request with the same key committed first; ours is rolled back whole
+        db.rollback()
+        stored = idempotency_service.find(db, current_user.id, idempotency_key) if idempotency_key else None
+        if stored is None:
+            raise
+        return _replay(stored, fingerprint)
+    bump_data_version()
+    db.refresh(transaction)
     
     return transaction
 
-@router.get("", response_model=List[TransactionResponse])
-def get_transactions(
-    category_id: Optional[int] = Query(None),
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
-    search: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+def _filter_transactions(
+    db: Session,
+    query,
+    category_id: Optional[int],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    search: Optional[str],
+    by_relevance: bool = False,
 ):
-    query = db.query(Transaction)
+    """The list filters of ``GET /transactions``, shared with ``GET /transactions/totals``."""
+    query = query.filter(Transaction.category_id.not_in(category_archive.archived_category_ids()))
 
     if category_id:
         query = query.filter(Transaction.category_id == category_id)
@@ -81,24 +160,159 @@ def get_transactions(
             pass
 
     if search and search.strip():
-        term = f"%{search.strip()}%"
-        query = query.join(Category).filter(
-            or_(
-                Transaction.comment.ilike(term),
-                Category.name.ilike(term),
-            )
+        query = transaction_search.apply_search(db, query, search, by_relevance=by_relevance)
+    return query
+
+
+@router.get("", response_model=List[TransactionResponse])
+def get_transactions(
+    response: Response,
+    category_id: Optional[int] = Query(None),
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    sort: Literal["date", "relevance"] = Query("date"),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Newest first, ``limit`` per page. When more rows exist, the ``X-Next-Cursor``
+    response header holds an opaque cursor for the next page (pass it as ``cursor``).
+    ``search`` uses the full-text index; ``sort=relevance`` returns the best ``limit``
+    matches by text rank instead (no cursor).
+    """
+    by_relevance = sort == "relevance" and bool(search and search.strip())
+    query = _filter_transactions(
+        db, db.query(Transaction), category_id, start_date, end_date, search, by_relevance
+    )
+
+    if cursor and not by_relevance:
+        # keyset on (transaction_date, id): a range scan on ix_transactions_transaction_date_id
+        query = query.filter(
+            tuple_(Transaction.transaction_date, Transaction.id) < tuple_(*_decode_cursor(cursor))
         )
 
-    transactions = query.order_by(Transaction.transaction_date.desc()).all()
+    transactions = (
+        query.order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    if len(transactions) > limit:
+        transactions = transactions[:limit]
+        if not by_relevance:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(transactions[-1].transaction_date, transactions[-1].id)
 
     return transactions
 
 
+@router.get("/totals", response_model=TransactionTotalsResponse)
+def get_transaction_totals(
+    category_id: Optional[int] = Query(None),
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Income / expense / savings over every row matching the ``GET /transactions`` filters."""
+    query = (
+        db.query(Category.type, Category.group, func.sum(Transaction.amount), func.count(Transaction.id))
+        .select_from(Transaction)
+        .join(Category, Transaction.category_id == Category.id)
+    )
+    rows = (
+        _filter_transactions(db, query, category_id, start_date, end_date, search)
+        .group_by(Category.type, Category.group)
+        .all()
+    )
+    totals = {"income": 0, "expense": 0, "savings": 0}
+    count = 0
+    for category_type, group, amount, rows_count in rows:
+        if category_type == TransactionType.INCOME:
+            totals["income"] += int(amount or 0)
+        elif group == CategoryGroup.SAVINGS:
+            totals["savings"] += int(amount or 0)
+        else:
+            totals["expense"] += int(amount or 0)
+        count += rows_count
+    return TransactionTotalsResponse(
+        **totals, balance=totals["income"] - totals["expense"], count=count
+    )
+
+
+@router.post("/batch", response_model=TransactionBatchResponse)
+def batch_transactions(
+    data: TransactionBatchRequest,
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Mixed create / update / delete in one DB transaction. If any operation is invalid
+    nothing is applied and the per-operation errors come back as a 422.
+    """
+    categories, transactions, errors = transaction_batch.validate_batch(db, data.operations)
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+
+    results = transaction_batch.apply_batch(db, current_user, data.operations, categories, transactions)
+    bump_data_version()
+    return TransactionBatchResponse(results=results)
+
+
+@router.post("/import", response_model=TransactionImportResult)
+async def import_transactions(
+    request: Request,
+    format: Optional[Literal["csv", "json"]] = Query(None),
+    dry_run: bool = Query(False),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Body: CSV in the export layout, or a JSON array of objects with the same keys.
+    Rows with errors are reported and skipped; no notifications are sent.
+    """
+    text = (await request.body()).decode("utf-8-sig")
+    if format is None and "json" in request.headers.get("content-type", ""):
+        format = "json"
+    try:
+        records = transaction_import.read_records(text, format)
+    except transaction_import.ImportFormatError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = await run_in_threadpool(
+        transaction_import.import_records, db, records, current_user.id, dry_run
+    )
+    if result["imported"]:
+        bump_data_version()
+    return result
+
+
+@router.get("/changes", response_model=TransactionChangesResponse)
+def get_transaction_changes(
+    since: Optional[str] = Query(None),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Rows created / modified and ids deleted after ``since`` (a previous ``next_cursor``).
+    Without ``since`` the full ledger is returned page by page. Keep calling with
+    ``next_cursor`` while ``has_more``; on ``reset`` drop local state and start over.
+    """
+    try:
+        cursor = sync_service.decode_sync_cursor(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return sync_service.changes_since(db, cursor, limit)
+
+
 @router.patch("/{transaction_id}", response_model=TransactionResponse)
 def update_transaction(
     transaction_id: str,
     data: TransactionUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
@@ -106,16 +320,20 @@ def update_transaction(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
 
     if data.category_id is not None:
-        category = db.query(Category).filter(Category.id == data.category_id).first()
-        if not category:
+        if not category_archive.active_categories(db, [data.category_id]):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+
+    rollup_service.remove_transaction(db, transaction)
+    if data.category_id is not None:
         transaction.category_id = data.category_id
     if data.amount is not None:
         transaction.amount = data.amount
     if data.comment is not None:
         transaction.comment = data.comment
+    rollup_service.add_transaction(db, transaction)
 
     db.commit()
+    bump_data_version()
     db.refresh(transaction)
     return transaction
 
@@ -123,55 +341,118 @@ def update_transaction(
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_transaction(
     transaction_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
     if not transaction:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
+    rollup_service.remove_transaction(db, transaction)
+    sync_service.record_deletions(db, [transaction.id])
     db.delete(transaction)
     db.commit()
+    bump_data_version()
     return None
 
 
-@router.get("/export/csv")
-def export_transactions_csv(
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    query = db.query(Transaction).join(Category).join(User)
-    if start_date:
-        try:
-            start = datetime.fromisoformat(start_date)
+EXPORT_HEADER = ["Дата", "Категория", "Сумма", "Тип", "Кто", "Комментарий"]
+EXPORT_CHUNK_ROWS = 1000
+
+
+def _export_rows(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    category_id: Optional[int],
+) -> Iterator[tuple]:
+    # The request's session is closed before the body streams, so the generator owns one.
+    db = SessionLocal()
+    try:
+        query = (
+            db.query(
+                Transaction.transaction_date,
+                Category.name,
+                Transaction.amount,
+                Category.type,
+                User.first_name,
+                Transaction.comment,
+            )
+            .join(Category, Transaction.category_id == Category.id)
+            .join(User, Transaction.user_id == User.id)
+            .filter(Category.archived_at.is_(None))
+        )
+        if start:
             query = query.filter(Transaction.transaction_date >= start)
-        except ValueError:
-            pass
-    if end_date:
-        try:
-            end = datetime.fromisoformat(end_date)
+        if end:
             query = query.filter(Transaction.transaction_date <= end)
-        except ValueError:
-            pass
-    rows = query.order_by(Transaction.transaction_date.desc()).all()
+        if category_id:
+            query = query.filter(Transaction.category_id == category_id)
+        # yield_per streams from a server-side cursor where the driver supports it
+        yield from query.order_by(
+            Transaction.transaction_date.desc(), Transaction.id.desc()
+        ).yield_per(EXPORT_CHUNK_ROWS)
+    finally:
+        db.close()
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["Дата", "Категория", "Сумма", "Тип", "Кто", "Комментарий"])
-    for t in rows:
+
+def _csv_chunks(rows: Iterator[tuple]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_HEADER)
+    for count, (tx_date, category_name, amount, category_type, user_name, comment) in enumerate(rows, 1):
         writer.writerow([
-            t.transaction_date.strftime("%Y-%m-%d %H:%M"),
-            t.category.name,
-            t.amount,
-            t.category.type.value,
-            t.user.first_name or "",
-            (t.comment or ""),
+            tx_date.strftime("%Y-%m-%d %H:%M"),
+            category_name,
+            amount,
+            category_type.value,
+            user_name or "",
+            (comment or ""),
         ])
-    output.seek(0)
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _gzip_chunks(chunks: Iterator[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _parse_export_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@router.get("/export/csv")
+def export_transactions_csv(
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    category_id: Optional[int] = Query(None),
+    gzip: bool = Query(False),
+    current_user: UserSnapshot = Depends(get_current_user),
+):
+    """Streams the CSV row chunk by row chunk; ``gzip=true`` returns ``.csv.gz``."""
+    chunks = _csv_chunks(
+        _export_rows(_parse_export_date(start_date), _parse_export_date(end_date), category_id)
+    )
     filename = f"transactions_{datetime.utcnow().strftime('%Y-%m-%d')}.csv"
+    if gzip:
+        return StreamingResponse(
+            _gzip_chunks(chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f"attachment; filename={filename}.gz"}
+        )
     return StreamingResponse(
-        iter([output.getvalue()]),
+        chunks,
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
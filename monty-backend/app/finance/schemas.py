@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 class UserBase(BaseModel):
@@ -58,10 +58,61 @@ class TransactionResponse(TransactionBase):
     id: str
     user_id: int
     transaction_date: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+class TransactionTotalsResponse(BaseModel):
+    income: int
+    expense: int
+    savings: int
+    balance: int
+    count: int
+
+class TransactionChangesResponse(BaseModel):
+    upserted: list[TransactionResponse]
+    deleted: list[str]
+    next_cursor: Optional[str] = None
+    has_more: bool
+    reset: bool = False
+
+
+class TransactionBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[str] = None
+    category_id: Optional[int] = None
+    amount: Optional[int] = None
+    comment: Optional[str] = None
+
+
+class TransactionBatchRequest(BaseModel):
+    operations: list[TransactionBatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class TransactionBatchResult(BaseModel):
+    index: int
+    op: str
+    id: str
+    transaction: Optional[TransactionResponse] = None
+
+
+class TransactionBatchResponse(BaseModel):
+    results: list[TransactionBatchResult]
+
+
+class TransactionImportError(BaseModel):
+    row: int
+    error: str
+
+
+class TransactionImportResult(BaseModel):
+    total_rows: int
+    imported: int
+    dry_run: bool
+    errors: list[TransactionImportError]
+
+
 class BudgetWithSpent(BaseModel):
     category_id: int
     category_name: str
@@ -70,6 +121,8 @@ class BudgetWithSpent(BaseModel):
     limit_amount: int
     spent: int
     remaining: int
+    projected_spend: Optional[int] = None
+    overspend_date: Optional[date] = None
 
 class DashboardResponse(BaseModel):
     total_savings_goal: int
@@ -90,6 +143,17 @@ class CategoryUpdate(BaseModel):
     icon: Optional[str] = None
 
 
+class CategoryPurgeResponse(BaseModel):
+    category_id: int
+    total_count: int
+    purged_count: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class AnalyticsResponse(BaseModel):
     total_income: int
     total_expenses: int
@@ -98,10 +162,58 @@ class AnalyticsResponse(BaseModel):
     by_category: list[dict]
     by_group: list[dict]
     daily_data: list[dict]
+    granularity: str = "day"
     top_expenses: list[dict] = []
     by_user: list[dict] = []
     comparison_previous_period: Optional[dict] = None
+    comparisons: dict[str, dict] = Field(default_factory=dict)
     period_start: str = ""
     period_end: str = ""
     large_one_off_total: int = 0
     budgets_with_spent: list[BudgetWithSpent] = Field(default_factory=list)
+
+
+class TrendPeriod(BaseModel):
+    period_start: str
+    period_end: str
+    total_income: int
+    total_expenses: int
+    total_savings: int
+    balance: int
+
+
+class TrendCategorySeries(BaseModel):
+    category_id: int
+    name: str
+    icon: str
+    group: str
+    type: str
+    amounts: list[int]
+
+
+class TrendResponse(BaseModel):
+    salary_day: int
+    periods: list[TrendPeriod]
+    categories: list[TrendCategorySeries]
+
+
+class GoalProjectionPoint(BaseModel):
+    period_end: str
+    p10: int
+    p25: int
+    p50: int
+    p75: int
+    p90: int
+    probability: float
+
+
+class GoalProjectionResponse(BaseModel):
+    target_amount: int
+    target_date: str
+    current_savings: int
+    paths: int
+    history_periods: int
+    mean_period_savings: int
+    probability: float
+    expected_completion: Optional[str] = None
+    bands: list[GoalProjectionPoint]
@@ -0,0 +1,365 @@
+"""Aggregate reads backing the analytics endpoints (daily rollups, no per-transaction ORM loads)."""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Date, and_, case, cast, func
+from sqlalchemy.orm import Session
+
+from app.finance.models import (
+    Category,
+    CategoryGroup,
+    Transaction,
+    TransactionDailyRollup,
+    TransactionType,
+    User,
+)
+from app.core.reference_data import RowSnapshot
+from app.finance.services import reference_data
+from app.finance.services.period_calendar import period_id
+
+
+def _with_category(db: Session, rows) -> list[RowSnapshot]:
+    """Attach ``category_*`` attributes from the reference-data cache to rows keyed by ``category_id``."""
+    categories = reference_data.categories.by_id(db)
+    result = []
+    for r in rows:
+        c = categories.get(r.category_id)
+        if c is None:
+            continue
+        result.append(
+            RowSnapshot(
+                {
+                    **r._asdict(),
+                    "category_name": c.name,
+                    "category_icon": c.icon,
+                    "category_type": c.type,
+                    "category_group": c.group,
+                }
+            )
+        )
+    return result
+
+
+def window_breakdown_rows(db: Session, start: datetime, end: datetime) -> list:
+    """
+    One row per (category, user) with the summed amount inside the window, read
+    from the daily rollups. Category and user attributes ride along so callers
+    never touch relationships.
+    """
+    rows = (
+        db.query(
+            TransactionDailyRollup.category_id,
+            User.id.label("user_id"),
+            User.first_name.label("user_name"),
+            func.sum(TransactionDailyRollup.total_amount).label("total"),
+        )
+        .join(User, TransactionDailyRollup.user_id == User.id)
+        .filter(
+            TransactionDailyRollup.day >= start.date(),
+            TransactionDailyRollup.day <= end.date(),
+        )
+        .group_by(
+            TransactionDailyRollup.category_id,
+            User.id,
+            User.first_name,
+        )
+        .all()
+    )
+    return _with_category(db, rows)
+
+
+GRANULARITIES = ("day", "week", "month", "period")
+
+
+def _bucket_expression(db: Session, granularity: str):
+    """SQL expression mapping a rollup day to its bucket (the first day, or the period id)."""
+    day = TransactionDailyRollup.day
+    if granularity == "period":
+        return TransactionDailyRollup.period_id
+    if granularity in ("week", "month"):
+        if db.get_bind().dialect.name == "sqlite":
+            if granularity == "week":
+                return func.date(day, "weekday 0", "-6 days")
+            return func.strftime("%Y-%m-01", day)
+        return cast(func.date_trunc(granularity, day), Date)
+    return day
+
+
+def series_rows(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    granularity: str = "day",
+    periods: list[tuple[date, date]] | None = None,
+) -> list[dict]:
+    """
+    Income / non-savings expense per time bucket, bucketed by the database
+    (``date_trunc`` on Postgres, ``strftime`` / ``date`` modifiers on SQLite, the
+    rollups' ``period_id`` for salary periods). ``periods`` lists the salary periods
+    covering the window for ``granularity="period"``; buckets are keyed by their start.
+    """
+    bucket = _bucket_expression(db, granularity).label("bucket")
+    amount = TransactionDailyRollup.total_amount
+    rows = (
+        db.query(
+            bucket,
+            func.coalesce(
+                func.sum(case((Category.type == TransactionType.INCOME, amount), else_=0)), 0
+            ).label("income"),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (
+                            and_(
+                                Category.type == TransactionType.EXPENSE,
+                                Category.group != CategoryGroup.SAVINGS,
+                            ),
+                            amount,
+                        ),
+                        else_=0,
+                    )
+                ),
+                0,
+            ).label("expense"),
+        )
+        .join(Category, TransactionDailyRollup.category_id == Category.id)
+        .filter(
+            TransactionDailyRollup.day >= start.date(),
+            TransactionDailyRollup.day <= end.date(),
+            Category.archived_at.is_(None),
+        )
+        .group_by(bucket)
+        .all()
+    )
+    if granularity == "period":
+        starts = {period_id(start_d): start_d for start_d, _ in periods or []}
+        buckets = [starts.get(r.bucket) for r in rows]
+    else:
+        buckets = [r.bucket for r in rows]
+    series = [
+        {"date": day_key(b), "income": int(r.income), "expense": int(r.expense)}
+        for b, r in zip(buckets, rows)
+        if b is not None
+    ]
+    series.sort(key=lambda x: x["date"])
+    return series
+
+
+COMPARISON_KINDS = ("previous", "last_year", "trailing_avg")
+TRAILING_WINDOWS = 3
+
+
+def _shift_year_back(d: date) -> date:
+    try:
+        return d.replace(year=d.year - 1)
+    except ValueError:  # 29 Feb
+        return d.replace(year=d.year - 1, day=28)
+
+
+def reference_windows(start_d: date, end_d: date, kinds) -> dict[str, tuple[date, date, int]]:
+    """
+    Reference windows for comparison, as ``{kind: (start, end, divisor)}``.
+
+    ``previous`` is the equally long window right before ``start_d``;
+    ``last_year`` is the same dates a year earlier; ``trailing_avg`` spans the
+    ``TRAILING_WINDOWS`` previous windows and is averaged by ``divisor``.
+    """
+    length = (end_d - start_d).days + 1
+    windows: dict[str, tuple[date, date, int]] = {}
+    for kind in kinds:
+        if kind == "previous":
+            windows[kind] = (start_d - timedelta(days=length), start_d - timedelta(days=1), 1)
+        elif kind == "last_year":
+            windows[kind] = (_shift_year_back(start_d), _shift_year_back(end_d), 1)
+        elif kind == "trailing_avg":
+            windows[kind] = (
+                start_d - timedelta(days=length * TRAILING_WINDOWS),
+                start_d - timedelta(days=1),
+                TRAILING_WINDOWS,
+            )
+    return windows
+
+
+def comparison_totals(db: Session, windows: dict[str, tuple[date, date, int]]) -> dict[str, dict]:
+    """Income / expense totals for every reference window in one conditional-SUM query."""
+    if not windows:
+        return {}
+    is_income = Category.type == TransactionType.INCOME
+    is_expense = and_(
+        Category.type == TransactionType.EXPENSE,
+        Category.group != CategoryGroup.SAVINGS,
+    )
+    amount = TransactionDailyRollup.total_amount
+    columns = []
+    for kind, (start_d, end_d, _) in windows.items():
+        in_window = TransactionDailyRollup.day.between(start_d, end_d)
+        columns.append(
+            func.coalesce(
+                func.sum(case((and_(in_window, is_income), amount), else_=0)), 0
+            ).label(f"{kind}_income")
+        )
+        columns.append(
+            func.coalesce(
+                func.sum(case((and_(in_window, is_expense), amount), else_=0)), 0
+            ).label(f"{kind}_expenses")
+        )
+
+    row = (
+        db.query(*columns)
+        .select_from(TransactionDailyRollup)
+        .join(Category, TransactionDailyRollup.category_id == Category.id)
+        .filter(
+            TransactionDailyRollup.day >= min(w[0] for w in windows.values()),
+            TransactionDailyRollup.day <= max(w[1] for w in windows.values()),
+            Category.archived_at.is_(None),
+        )
+        .one()
+    )
+
+    result: dict[str, dict] = {}
+    for kind, (start_d, end_d, divisor) in windows.items():
+        income = round(int(getattr(row, f"{kind}_income")) / divisor)
+        expenses = round(int(getattr(row, f"{kind}_expenses")) / divisor)
+        result[kind] = {
+            "total_income": income,
+            "total_expenses": expenses,
+            "balance": income - expenses,
+            "period_start": start_d.isoformat(),
+            "period_end": end_d.isoformat(),
+        }
+    return result
+
+
+def period_category_totals(db: Session, periods: list[tuple[date, date]]) -> list:
+    """
+    Sums per (period, category) for consecutive salary periods in one query grouped
+    on the rollups' ``period_id``; ``bucket`` is the period's index in ``periods``.
+    """
+    if not periods:
+        return []
+    index_by_id = {period_id(start_d): index for index, (start_d, _) in enumerate(periods)}
+    bucket = case(index_by_id, value=TransactionDailyRollup.period_id, else_=None).label("bucket")
+    rows = (
+        db.query(
+            bucket,
+            TransactionDailyRollup.category_id,
+            func.sum(TransactionDailyRollup.total_amount).label("total"),
+        )
+        .filter(TransactionDailyRollup.period_id.in_(index_by_id))
+        .group_by(TransactionDailyRollup.period_id, TransactionDailyRollup.category_id)
+        .all()
+    )
+    return _with_category(db, rows)
+
+
+def non_savings_expense_amounts(db: Session, start: datetime, end: datetime) -> list[int]:
+    """Bare amounts of non-savings expenses in the window (for median-based heuristics)."""
+    rows = (
+        db.query(Transaction.amount)
+        .join(Category, Transaction.category_id == Category.id)
+        .filter(
+            Transaction.transaction_date >= start,
+            Transaction.transaction_date <= end,
+            Category.type == TransactionType.EXPENSE,
+            Category.group != CategoryGroup.SAVINGS,
+            Category.archived_at.is_(None),
+        )
+        .all()
+    )
+    return [int(r.amount) for r in rows]
+
+
+def day_key(value) -> str:
+    """Normalize a day value (``date`` or ISO string, depending on the driver) to ``YYYY-MM-DD``."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+def summarize_breakdown(rows: list) -> dict:
+    """Fold breakdown rows into totals, by_category, by_group and by_user."""
+    total_income = 0
+    total_expenses = 0
+    total_savings = 0
+    by_category: dict[str, dict] = {}
+    by_group: dict[str, dict] = {}
+    by_user_map: dict[int, dict] = {}
+
+    for r in rows:
+        amount = int(r.total or 0)
+        if r.category_type == TransactionType.INCOME:
+            bucket = "income"
+            total_income += amount
+        elif r.category_group == CategoryGroup.SAVINGS:
+            bucket = "savings"
+            total_savings += amount
+        else:
+            bucket = "expense"
+            total_expenses += amount
+
+        cat = by_category.setdefault(
+            r.category_name,
+            {
+                "name": r.category_name,
+                "icon": r.category_icon,
+                "income": 0,
+                "expense": 0,
+                "savings": 0,
+            },
+        )
+        cat[bucket] += amount
+
+        group = r.category_group.value
+        grp = by_group.setdefault(
+            group, {"group": group, "income": 0, "expense": 0, "savings": 0}
+        )
+        grp[bucket] += amount
+
+        usr = by_user_map.setdefault(
+            r.user_id,
+            {
+                "user_id": r.user_id,
+                "user_name": r.user_name or "Без имени",
+                "income": 0,
+                "expense": 0,
+                "savings": 0,
+            },
+        )
+        usr[bucket] += amount
+
+    def _cat_type(v):
+        if v["income"] > 0:
+            return "income"
+        if v["savings"] > 0:
+            return "savings"
+        return "expense"
+
+    by_category_list = [
+        {
+            "name": v["name"],
+            "icon": v["icon"],
+            "amount": v["expense"] or v["savings"] or v["income"],
+            "type": _cat_type(v),
+        }
+        for v in by_category.values()
+    ]
+    by_category_list.sort(key=lambda x: x["amount"], reverse=True)
+
+    by_group_list = []
+    for g in by_group.values():
+        if g["income"] > 0:
+            by_group_list.append({"group": g["group"], "amount": g["income"], "type": "income"})
+        if g["expense"] > 0:
+            by_group_list.append({"group": g["group"], "amount": g["expense"], "type": "expense"})
+        if g["savings"] > 0:
+            by_group_list.append({"group": g["group"], "amount": g["savings"], "type": "savings"})
+    by_group_list.sort(key=lambda x: x["amount"], reverse=True)
+
+    return {
+        "total_income": total_income,
+        "total_expenses": total_expenses,
+        "total_savings": total_savings,
+        "by_category": by_category_list,
+        "by_group": by_group_list,
+        "by_user": list(by_user_map.values()),
+    }
@@ -0,0 +1,53 @@
+"""
+Analytics responses cached per window and finance data version.
+
+Every transaction, category or budget write calls ``bump_data_version`` after its
+commit; cached responses built against an older version are never served again.
+
+The cache and the version are process-local, which assumes the API runs as a single
+uvicorn worker. Writes the process does not see (another worker, the import / rollup
+CLIs, manual SQL) show up once entries expire after ``ANALYTICS_TTL_SECONDS``.
+"""
+
+import threading
+from typing import Callable, Hashable, TypeVar
+
+from app.core.cache import LRUCache
+
+T = TypeVar("T")
+
+ANALYTICS_CACHE_SIZE = 64
+# bounds staleness after writes made outside this process
+ANALYTICS_TTL_SECONDS = 60
+
+_analytics_cache = LRUCache(maxsize=ANALYTICS_CACHE_SIZE, ttl_seconds=ANALYTICS_TTL_SECONDS)
+_version_lock = threading.Lock()
+_data_version = 0
+
+
+def get_data_version() -> int:
+    return _data_version
+
+
+def bump_data_version() -> int:
+    global _data_version
+    with _version_lock:
+        _data_version += 1
+        _analytics_cache.clear()
+        return _data_version
+
+
+def cached_analytics(
+    key: tuple[Hashable, ...],
+    build: Callable[[], T],
+) -> T:
+    versioned_key = (get_data_version(), *key)
+    response = _analytics_cache.get(versioned_key)
+    if response is None:
+        response = build()
+        _analytics_cache.set(versioned_key, response)
+    return response
+
+
+def analytics_cache_stats() -> dict:
+    return {"data_version": get_data_version(), **_analytics_cache.stats()}
@@ -1,20 +1,12 @@
 """Heuristics for analytics (large one-off expenses, etc.)."""
 
-from app.finance.models import CategoryGroup, Transaction, TransactionType
 
-
-def large_one_off_expense_total(transactions: list[Transaction]) -> int:
+def large_one_off_expense_total(amounts: list[int]) -> int:
     """
-    Sum of non-savings expense transactions at or above a dynamic threshold.
+    Sum of non-savings expense amounts at or above a dynamic threshold.
     Threshold = max(30_000, 3 * median amount) when there are at least 3 such
     transactions; otherwise 30_000 only.
     """
-    amounts = [
-        t.amount
-        for t in transactions
-        if t.category.type == TransactionType.EXPENSE
-        and t.category.group != CategoryGroup.SAVINGS
-    ]
     if not amounts:
         return 0
     sorted_amts = sorted(amounts)
@@ -0,0 +1,83 @@
+"""
+In-process cache behind ``get_current_user``.
+
+``token hash → claims`` skips JWT decoding for a token seen before (an entry never
+outlives the token's ``exp``); ``user id → UserSnapshot`` skips the ``users`` lookup.
+A snapshot is dropped when ``authenticate_telegram_user`` updates the user and on any
+ORM update / delete of a ``User`` (e.g. ``is_active`` flipped). ``USER_TTL_SECONDS``
+bounds how long a change made outside this process (another worker, manual SQL) goes
+unseen.
+"""
+
+import hashlib
+import time
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.core.cache import LRUCache
+from app.finance.models import User
+
+TOKEN_CACHE_SIZE = 1024
+USER_CACHE_SIZE = 256
+USER_TTL_SECONDS = 60
+
+
+class UserSnapshot:
+    """The ``User`` columns endpoints read from ``current_user``; not bound to a session."""
+
+    __slots__ = ("id", "telegram_id", "first_name", "is_active")
+
+    def __init__(self, id: int, telegram_id: int, first_name: str, is_active: bool):
+        self.id = id
+        self.telegram_id = telegram_id
+        self.first_name = first_name
+        self.is_active = is_active
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(user.id, user.telegram_id, user.first_name, bool(user.is_active))
+
+
+_claims = LRUCache(maxsize=TOKEN_CACHE_SIZE)
+_users = LRUCache(maxsize=USER_CACHE_SIZE, ttl_seconds=USER_TTL_SECONDS)
+
+
+def _token_key(token: str) -> str:
+    # raw bearer tokens are never kept in memory as dict keys
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_claims(token: str) -> Optional[dict]:
+    return _claims.get(_token_key(token))
+
+
+def put_claims(token: str, claims: dict) -> None:
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)) and exp > time.time():
+        _claims.set(_token_key(token), claims, ttl_seconds=exp - time.time())
+
+
+def get_user(user_id: int) -> Optional[UserSnapshot]:
+    return _users.get(user_id)
+
+
+def put_user(user: User) -> UserSnapshot:
+    snapshot = UserSnapshot.from_user(user)
+    _users.set(snapshot.id, snapshot)
+    return snapshot
+
+
+def invalidate_user(user_id: int) -> None:
+    _users.pop(user_id)
+
+
+def clear() -> None:
+    _claims.clear()
+    _users.clear()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _drop_changed_user(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
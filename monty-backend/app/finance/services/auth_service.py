@@ -7,6 +7,7 @@ from typing import Optional
 import httpx
 from app.core.config import settings
 from app.finance.models import User
+from app.finance.services import auth_cache
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
@@ -97,6 +98,7 @@ def authenticate_telegram_user(db: Session, init_data: str) -> Optional[dict]:
         user.first_name = telegram_data["first_name"]
         user.is_active = True
         db.commit()
+        auth_cache.invalidate_user(user.id)
 
     access_token = create_access_token(
         {"sub": str(user.id), "telegram_id": user.telegram_id}
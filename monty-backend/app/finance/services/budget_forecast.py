@@ -0,0 +1,216 @@
+"""
+Burn-rate forecast for the current salary period.
+
+A category's spend so far is projected to the period end along its historical
+intra-period curve F(k): the average share of a period's spend made by day k, taken
+over the last ``HISTORY_PERIODS`` completed periods (days are scaled when period
+lengths differ). The projection is ``spent / F(today)``. With too little history the
+curve falls back to the curve of all expense categories, then to a straight line.
+The overspend date is the first day the projected running total passes the limit
+(or the day it actually did).
+
+Incremental: each completed period's daily profile is read from the rollups once and
+cached by period. A new period adds one small query instead of a history rescan. The
+current period is one ``period_id`` equality read, and the finished forecast is cached
+per period and data version (``cached_analytics``).
+"""
+
+from datetime import date, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.finance.models import TransactionDailyRollup
+from app.finance.schemas import BudgetWithSpent
+from app.finance.services.analytics_cache import cached_analytics
+from app.finance.services.database import get_recent_financial_periods
+from app.finance.services.period_calendar import period_id
+
+HISTORY_PERIODS = 6
+MIN_HISTORY_PERIODS = 2
+# below this share of the usual spend the curve is too flat to extrapolate from
+MIN_CURVE_SHARE = 0.05
+OVERSPEND_GROUPS = ("BASE", "COMFORT")
+
+PROFILE_CACHE_SIZE = 64
+# closed periods rarely change; the TTL picks up back-dated edits eventually
+PROFILE_TTL_SECONDS = 6 * 3600
+
+_profiles = LRUCache(maxsize=PROFILE_CACHE_SIZE, ttl_seconds=PROFILE_TTL_SECONDS)
+
+
+def _daily_amounts(db: Session, periods: list[tuple[date, date]]) -> dict[int, dict[int, list[int]]]:
+    """``{period_id: {category_id: [amount per day of the period]}}`` in one grouped read."""
+    starts = {period_id(start_d): (start_d, end_d) for start_d, end_d in periods}
+    rows = (
+        db.query(
+            TransactionDailyRollup.period_id,
+            TransactionDailyRollup.category_id,
+            TransactionDailyRollup.day,
+            func.sum(TransactionDailyRollup.total_amount).label("total"),
+        )
+        .filter(TransactionDailyRollup.period_id.in_(starts))
+        .group_by(
+            TransactionDailyRollup.period_id,
+            TransactionDailyRollup.category_id,
+            TransactionDailyRollup.day,
+        )
+        .all()
+    )
+    result: dict[int, dict[int, list[int]]] = {pid: {} for pid in starts}
+    for r in rows:
+        start_d, end_d = starts[r.period_id]
+        length = (end_d - start_d).days + 1
+        day = r.day if isinstance(r.day, date) else date.fromisoformat(str(r.day)[:10])
+        index = (day - start_d).days
+        if 0 <= index < length:
+            amounts = result[r.period_id].setdefault(r.category_id, [0] * length)
+            amounts[index] += int(r.total or 0)
+    return result
+
+
+def _cumulative_shares(amounts: list[int]) -> Optional[list[float]]:
+    total = sum(amounts)
+    if total <= 0:
+        return None
+    running = 0
+    shares = []
+    for amount in amounts:
+        running += amount
+        shares.append(running / total)
+    return shares
+
+
+def _history(db: Session, periods: list[tuple[date, date]]) -> list[dict[int, list[float]]]:
+    """Cumulative share curves per category for each completed period (cached per period)."""
+    profiles: dict[tuple[date, date], dict[int, list[float]]] = {}
+    missing = []
+    for period in periods:
+        cached = _profiles.get(period)
+        if cached is None:
+            missing.append(period)
+        else:
+            profiles[period] = cached
+    if missing:
+        daily = _daily_amounts(db, missing)
+        for period in missing:
+            curves = {}
+            for category_id, amounts in daily[period_id(period[0])].items():
+                shares = _cumulative_shares(amounts)
+                if shares is not None:
+                    curves[category_id] = shares
+            _profiles.set(period, curves)
+            profiles[period] = curves
+    return [profiles[period] for period in periods]
+
+
+def _share_at(curves: list[list[float]], day_index: int, length: int) -> float:
+    """Average share spent by ``day_index`` of a ``length``-day period across ``curves``."""
+    values = []
+    for shares in curves:
+        k = min(len(shares) - 1, max(0, round((day_index + 1) * len(shares) / length) - 1))
+        values.append(shares[k])
+    return sum(values) / len(values)
+
+
+def _linear(length: int) -> Callable[[int], float]:
+    return lambda k: (k + 1) / length
+
+
+def _curve_for(
+    category_id: int, history: list[dict[int, list[float]]], pooled: list[list[float]], length: int
+) -> Callable[[int], float]:
+    own = [profile[category_id] for profile in history if category_id in profile]
+    curves = own if len(own) >= MIN_HISTORY_PERIODS else pooled
+    if len(curves) < MIN_HISTORY_PERIODS:
+        return _linear(length)
+    return lambda k: _share_at(curves, k, length)
+
+
+def _forecast_category(
+    amounts: list[int],
+    today_index: int,
+    limit_amount: int,
+    curve: Callable[[int], float],
+    start_d: date,
+    check_overspend: bool,
+) -> tuple[int, Optional[date]]:
+    """``(projected_spend, overspend_date)`` for one category's daily amounts this period."""
+    length = len(amounts)
+    running = []
+    total = 0
+    for amount in amounts:
+        total += amount
+        running.append(total)
+    spent = running[today_index]
+
+    if curve(today_index) < MIN_CURVE_SHARE:
+        curve = _linear(length)
+    share = curve(today_index)
+    projected = max(round(spent / share), total)
+
+    if not check_overspend or limit_amount <= 0:
+        return projected, None
+    for index in range(today_index + 1):
+        if running[index] > limit_amount:
+            return projected, start_d + timedelta(days=index)
+    if projected <= limit_amount or share >= 1:
+        return projected, None
+    for index in range(today_index + 1, length):
+        progress = (curve(index) - share) / (1 - share)
+        if spent + (projected - spent) * progress > limit_amount:
+            return projected, start_d + timedelta(days=index)
+    return projected, None
+
+
+def _build_forecast(
+    db: Session, items: list[BudgetWithSpent], period: tuple[date, date], salary_day: int, today: date
+) -> dict[int, tuple[int, Optional[date]]]:
+    start_d, end_d = period
+    length = (end_d - start_d).days + 1
+    today_index = min(max((today - start_d).days, 0), length - 1)
+
+    completed = get_recent_financial_periods(
+        HISTORY_PERIODS, salary_day, ref_date=start_d - timedelta(days=1)
+    )
+    history = _history(db, completed)
+    expense_ids = {item.category_id for item in items if item.group != "INCOME"}
+    pooled = [
+        curve
+        for profile in history
+        for category_id, curve in profile.items()
+        if category_id in expense_ids
+    ]
+    current = _daily_amounts(db, [period])[period_id(start_d)]
+
+    return {
+        item.category_id: _forecast_category(
+            current.get(item.category_id, [0] * length),
+            today_index,
+            item.limit_amount,
+            _curve_for(item.category_id, history, pooled, length),
+            start_d,
+            item.group in OVERSPEND_GROUPS,
+        )
+        for item in items
+    }
+
+
+def apply_forecast(
+    db: Session,
+    items: list[BudgetWithSpent],
+    period: tuple[date, date],
+    salary_day: int,
+    today: Optional[date] = None,
+) -> None:
+    """Fill ``projected_spend`` and ``overspend_date`` on the current period's budget items."""
+    today = today or date.today()
+    forecast = cached_analytics(
+        ("budget_forecast", period, today),
+        lambda: _build_forecast(db, items, period, salary_day, today),
+    )
+    for item in items:
+        if item.category_id in forecast:
+            item.projected_spend, item.overspend_date = forecast[item.category_id]
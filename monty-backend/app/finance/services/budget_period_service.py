@@ -1,52 +1,65 @@
-"""Latest monthly budget rows + spent per category for an arbitrary datetime window."""
+"""
+Current budget limits + spent per category for a salary period or an arbitrary datetime window.
+
+Limits live in ``category_budget_limits`` (one row per category), kept in step with
+``monthly_budgets`` by ``set_current_limit``; the budget list with spent and remaining
+is a single limits ⋈ categories ⟕ rollups aggregate.
+"""
 
 from datetime import date, datetime, time
 from typing import List
 
-from sqlalchemy import func
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
-from app.finance.models import MonthlyBudget, Transaction
+from app.finance.models import Category, CategoryBudgetLimit, MonthlyBudget, TransactionDailyRollup
 from app.finance.schemas import BudgetWithSpent
 
 
-def latest_monthly_budgets_subquery(db: Session):
-    return (
-        db.query(
-            MonthlyBudget.category_id,
-            func.max(MonthlyBudget.period).label("max_period"),
-        )
-        .group_by(MonthlyBudget.category_id)
-        .subquery()
+def set_current_limit(db: Session, category_id: int, limit_amount: int) -> None:
+    """
+    Make ``limit_amount`` the category's current limit: updates its latest
+    ``MonthlyBudget`` row (or adds one) and the denormalized row. Caller commits.
+    """
+    latest_budget = (
+        db.query(MonthlyBudget)
+        .filter(MonthlyBudget.category_id == category_id)
+        .order_by(MonthlyBudget.period.desc(), MonthlyBudget.id)
+        .first()
     )
+    if latest_budget:
+        latest_budget.limit_amount = limit_amount
+    else:
+        # period is kept for compatibility; limits are constant per category
+        db.add(MonthlyBudget(category_id=category_id, period=date.today(), limit_amount=limit_amount))
 
+    current = db.get(CategoryBudgetLimit, category_id)
+    if current:
+        current.limit_amount = limit_amount
+    else:
+        db.add(CategoryBudgetLimit(category_id=category_id, limit_amount=limit_amount))
 
-def query_latest_budgets(db: Session):
-    subq = latest_monthly_budgets_subquery(db)
-    return (
-        db.query(MonthlyBudget)
-        .join(
-            subq,
-            (MonthlyBudget.category_id == subq.c.category_id)
-            & (MonthlyBudget.period == subq.c.max_period),
-        )
-    )
 
+def drop_category_limits(db: Session, category_id: int) -> None:
+    db.query(CategoryBudgetLimit).filter(CategoryBudgetLimit.category_id == category_id).delete()
+    db.query(MonthlyBudget).filter(MonthlyBudget.category_id == category_id).delete()
 
-def spent_by_category_between(db: Session, start: datetime, end: datetime) -> dict[int, int]:
-    rows = (
+
+def current_limits(db: Session) -> list:
+    """``(category_id, name, icon, group, type, limit_amount)`` rows, one per category with a limit."""
+    return (
         db.query(
-            Transaction.category_id,
-            func.coalesce(func.sum(Transaction.amount), 0).label("spent"),
-        )
-        .filter(
-            Transaction.transaction_date >= start,
-            Transaction.transaction_date <= end,
+            Category.id.label("category_id"),
+            Category.name,
+            Category.icon,
+            Category.group,
+            Category.type,
+            CategoryBudgetLimit.limit_amount,
         )
-        .group_by(Transaction.category_id)
+        .join(Category, CategoryBudgetLimit.category_id == Category.id)
+        .order_by(Category.id)
         .all()
     )
-    return {int(r.category_id): int(r.spent) for r in rows}
 
 
 def date_range_to_datetimes(start_d: date, end_d: date) -> tuple[datetime, datetime]:
@@ -55,27 +68,58 @@ def date_range_to_datetimes(start_d: date, end_d: date) -> tuple[datetime, datet
     return start_dt, end_dt
 
 
+def _budgets_with_spent(db: Session, rollups_in_window) -> List[BudgetWithSpent]:
+    spent = func.coalesce(func.sum(TransactionDailyRollup.total_amount), 0).label("spent")
+    rows = (
+        db.query(
+            Category.id,
+            Category.name,
+            Category.icon,
+            Category.group,
+            CategoryBudgetLimit.limit_amount,
+            spent,
+        )
+        .select_from(CategoryBudgetLimit)
+        .join(Category, CategoryBudgetLimit.category_id == Category.id)
+        .outerjoin(
+            TransactionDailyRollup,
+            and_(TransactionDailyRollup.category_id == CategoryBudgetLimit.category_id, rollups_in_window),
+        )
+        .group_by(
+            Category.id,
+            Category.name,
+            Category.icon,
+            Category.group,
+            CategoryBudgetLimit.limit_amount,
+        )
+        .order_by(Category.id)
+        .all()
+    )
+    return [
+        BudgetWithSpent(
+            category_id=r.id,
+            category_name=r.name,
+            category_icon=r.icon,
+            group=r.group.value,
+            limit_amount=r.limit_amount,
+            spent=int(r.spent),
+            remaining=r.limit_amount - int(r.spent),
+        )
+        for r in rows
+    ]
+
+
 def build_budgets_with_spent(
     db: Session,
     window_start: datetime,
     window_end: datetime,
 ) -> List[BudgetWithSpent]:
-    budgets = query_latest_budgets(db).all()
-    spent_map = spent_by_category_between(db, window_start, window_end)
-    items: List[BudgetWithSpent] = []
-    for budget in budgets:
-        category = budget.category
-        spent = spent_map.get(budget.category_id, 0)
-        remaining = budget.limit_amount - spent
-        items.append(
-            BudgetWithSpent(
-                category_id=category.id,
-                category_name=category.name,
-                category_icon=category.icon,
-                group=category.group.value,
-                limit_amount=budget.limit_amount,
-                spent=spent,
-                remaining=remaining,
-            )
-        )
-    return items
+    return _budgets_with_spent(
+        db,
+        TransactionDailyRollup.day.between(window_start.date(), window_end.date()),
+    )
+
+
+def build_period_budgets_with_spent(db: Session, period_id: int) -> List[BudgetWithSpent]:
+    """``build_budgets_with_spent`` for a whole salary period, by ``period_id`` equality."""
+    return _budgets_with_spent(db, TransactionDailyRollup.period_id == period_id)
@@ -0,0 +1,100 @@
+"""
+Category removal as a soft-archive plus a chunked background purge.
+
+``archive`` runs in the request. It stamps ``categories.archived_at``, drops the
+category's limits, rollups and balance (all bounded by days, not by ledger size) and
+opens a ``category_purges`` row. From then on the category is hidden from lists,
+budgets and analytics, and its transactions are hidden from reads via
+``archived_category_ids``.
+
+``purge_archived`` is the scheduler job. It deletes the archived transactions in
+``PURGE_CHUNK_SIZE`` batches, one commit per batch, and leaves sync tombstones. At most
+``PURGE_CHUNKS_PER_RUN`` batches run per call, so no run holds a long transaction.
+Progress is ``purged_count`` / ``total_count``. The archived category row itself is
+kept.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.finance.models import Category, CategoryBalance, CategoryPurge, Transaction
+from app.finance.services import rollup_service, sync_service
+from app.finance.services.budget_period_service import drop_category_limits
+
+PURGE_CHUNK_SIZE = 500
+PURGE_CHUNKS_PER_RUN = 20
+PURGE_INTERVAL_SECONDS = 60
+
+
+def archived_category_ids():
+    """Subquery for ``Transaction.category_id.not_in(...)`` filters on ledger reads."""
+    return select(Category.id).where(Category.archived_at.is_not(None))
+
+
+def active_categories(db: Session, category_ids) -> dict[int, Category]:
+    """Not-archived categories among ``category_ids``, read through ``db`` (for validating writes)."""
+    ids = set(category_ids)
+    if not ids:
+        return {}
+    rows = db.query(Category).filter(Category.id.in_(ids), Category.archived_at.is_(None)).all()
+    return {c.id: c for c in rows}
+
+
+def archive(db: Session, category: Category) -> CategoryPurge:
+    """Hide ``category`` at once and queue its transactions for purging. Caller commits."""
+    balance = db.get(CategoryBalance, category.id)
+    category.archived_at = datetime.utcnow()
+    drop_category_limits(db, category.id)
+    rollup_service.drop_category(db, category.id)
+    purge = CategoryPurge(category_id=category.id, total_count=balance.tx_count if balance else 0, purged_count=0)
+    db.add(purge)
+    return purge
+
+
+def _purge_chunk(db: Session, category_id: int) -> int:
+    ids = [
+        row.id
+        for row in db.query(Transaction.id)
+        .filter(Transaction.category_id == category_id)
+        .limit(PURGE_CHUNK_SIZE)
+    ]
+    if ids:
+        sync_service.record_deletions(db, ids)
+        db.execute(delete(Transaction.__table__).where(Transaction.__table__.c.id.in_(ids)))
+    return len(ids)
+
+
+def purge_archived(db: Session, max_chunks: int = PURGE_CHUNKS_PER_RUN) -> int:
+    """Run up to ``max_chunks`` purge batches over open purges; returns rows deleted."""
+    deleted = 0
+    chunks = 0
+    for purge in (
+        db.query(CategoryPurge)
+        .filter(CategoryPurge.finished_at.is_(None))
+        .order_by(CategoryPurge.created_at)
+        .all()
+    ):
+        while chunks < max_chunks:
+            count = _purge_chunk(db, purge.category_id)
+            chunks += 1
+            if count == 0:
+                # a write that raced the archive may have re-created rollup rows
+                rollup_service.drop_category(db, purge.category_id)
+                purge.finished_at = datetime.utcnow()
+                db.commit()
+                break
+            purge.purged_count += count
+            # rows written after the total was taken (e.g. an in-flight create) still count
+            purge.total_count = max(purge.total_count, purge.purged_count)
+            db.commit()
+            deleted += count
+        if chunks >= max_chunks:
+            break
+    return deleted
+
+
+def purge_status(db: Session, category_id: int) -> Optional[CategoryPurge]:
+    return db.get(CategoryPurge, category_id)
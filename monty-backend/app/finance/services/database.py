@@ -1,4 +1,5 @@
-from datetime import date
+import calendar
+from datetime import date, timedelta
 
 from app.core.config import Base, engine
 
@@ -7,28 +8,56 @@ def init_db():
     Base.metadata.create_all(bind=engine)
 
 
+def _salary_date(year: int, month: int, salary_day: int) -> date:
+    return date(year, month, min(salary_day, calendar.monthrange(year, month)[1]))
+
+
 def get_financial_period(
     ref_date: date = None, salary_day: int = None
 ) -> tuple[date, date]:
-    from datetime import timedelta
-
     if ref_date is None:
         ref_date = date.today()
 
     if salary_day is None:
         salary_day = 10
 
-    if ref_date.day >= salary_day:
-        start = ref_date.replace(day=salary_day)
+    this_month_start = _salary_date(ref_date.year, ref_date.month, salary_day)
+    if ref_date >= this_month_start:
+        start = this_month_start
         if ref_date.month == 12:
-            end = date(ref_date.year + 1, 1, salary_day - 1)
+            next_start = _salary_date(ref_date.year + 1, 1, salary_day)
         else:
-            end = date(ref_date.year, ref_date.month + 1, salary_day - 1)
+            next_start = _salary_date(ref_date.year, ref_date.month + 1, salary_day)
     else:
         if ref_date.month == 1:
-            start = date(ref_date.year - 1, 12, salary_day)
+            start = _salary_date(ref_date.year - 1, 12, salary_day)
         else:
-            start = date(ref_date.year, ref_date.month - 1, salary_day)
-        end = ref_date.replace(day=salary_day - 1)
+            start = _salary_date(ref_date.year, ref_date.month - 1, salary_day)
+        next_start = this_month_start
+    end = next_start - timedelta(days=1)
 
     return start, end
+
+
+def get_recent_financial_periods(
+    count: int, salary_day: int = None, ref_date: date = None
+) -> list[tuple[date, date]]:
+    """The ``count`` financial periods ending with the one containing ``ref_date``, oldest first."""
+    periods = [get_financial_period(ref_date, salary_day)]
+    while len(periods) < count:
+        periods.append(get_financial_period(periods[-1][0] - timedelta(days=1), salary_day))
+    periods.reverse()
+    return periods
+
+
+def get_financial_periods_between(
+    start_d: date, end_d: date, salary_day: int = None
+) -> list[tuple[date, date]]:
+    """Financial periods overlapping ``[start_d, end_d]``, oldest first."""
+    periods = []
+    ref = start_d
+    while ref <= end_d:
+        period = get_financial_period(ref, salary_day)
+        periods.append(period)
+        ref = period[1] + timedelta(days=1)
+    return periods
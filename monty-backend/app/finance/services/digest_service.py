@@ -6,6 +6,7 @@ from sqlalchemy import func
 
 from app.core.config import settings, SessionLocal
 from app.finance.models import Transaction, Category, User
+from app.finance.services import reference_data
 from app.finance.services.database import get_financial_period
 
 _openai_client: OpenAI | None = None
@@ -114,8 +115,7 @@ def get_today_transactions_detail(db: Session) -> list:
     end_of_day = datetime.combine(today, datetime.max.time())
     
     transactions = (
-        db.query(Transaction)
-        .join(Category)
+        db.query(Transaction.category_id, Transaction.amount, Transaction.comment)
         .filter(
             Transaction.transaction_date >= start_of_day,
             Transaction.transaction_date <= end_of_day,
@@ -123,17 +123,20 @@ def get_today_transactions_detail(db: Session) -> list:
         .order_by(Transaction.transaction_date.desc())
         .all()
     )
+    # archived categories are not in the cache, which also hides their transactions
+    categories = reference_data.categories.by_id(db)
     
     return [
         {
-            "icon": t.category.icon,
-            "name": t.category.name,
+            "icon": categories[t.category_id].icon,
+            "name": categories[t.category_id].name,
             "amount": t.amount,
-            "type": t.category.type.value,
-            "group": t.category.group.value,
+            "type": categories[t.category_id].type.value,
+            "group": categories[t.category_id].group.value,
             "comment": t.comment
         }
         for t in transactions
+        if t.category_id in categories
     ]
 
 def send_reminder_notification() -> bool:
@@ -264,47 +267,3 @@ def generate_ai_summary(db: Session, transactions: list, total_expenses: int, to
         return response.choices[0].message.content or ""
     except Exception as e:
         return "Хорошего дня! 🌟"
-
-def send_transaction_notification(
-    db: Session,
-    category_icon: str,
-    category_name: str,
-    amount: int,
-    user_name: str,
-    comment: str | None = None
-) -> bool:
-    import asyncio
-    from telegram import Bot
-    
-    print(f"[Telegram] Attempting to send notification...")
-    print(f"[Telegram] TELEGRAM_CHAT_ID: {settings.TELEGRAM_CHAT_ID}")
-    print(f"[Telegram] TELEGRAM_BOT_TOKEN set: {bool(settings.TELEGRAM_BOT_TOKEN)}")
-    
-    if not settings.TELEGRAM_CHAT_ID or not settings.TELEGRAM_BOT_TOKEN:
-        print(f"[Telegram] SKIPPED - missing chat_id or bot_token")
-        return False
-    
-    async def _send():
-        today_total = get_today_total(db)
-        bot = Bot(token=settings.TELEGRAM_BOT_TOKEN)
-        text = f"{category_icon} <b>{category_name}</b>\n"
-        text += f"💰 {amount:,} ₸\n"
-        text += f"👤 {user_name}"
-        if comment:
-            text += f"\n📝 {comment}"
-        text += f"\n\n📊 Потрачено за день: {today_total:,} ₸"
-        
-        print(f"[Telegram] Sending message to {settings.TELEGRAM_CHAT_ID}...")
-        await bot.send_message(
-            chat_id=settings.TELEGRAM_CHAT_ID,
-            text=text,
-            parse_mode="HTML"
-        )
-        print(f"[Telegram] SUCCESS - message sent")
-    
-    try:
-        asyncio.run(_send())
-        return True
-    except Exception as e:
-        print(f"[Telegram] ERROR: {e}")
-        return False
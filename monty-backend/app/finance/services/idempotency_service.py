@@ -0,0 +1,63 @@
+"""
+``Idempotency-Key`` support for ``POST /transactions``.
+
+The response of a keyed request is stored in ``idempotency_keys`` in the same commit as
+the transaction it created, so a key either has a stored response or had no effect.
+A retry with the same key (per user) within ``TTL_HOURS`` gets the stored response back
+without touching the ledger or the notification outbox; reusing a key for a different
+payload is rejected. Expired keys are purged daily.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.finance.models import IdempotencyKey
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+KEY_MAX_LENGTH = 255
+TTL_HOURS = 24
+
+
+def request_hash(payload: dict) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode()
+    ).hexdigest()
+
+
+def find(db: Session, user_id: int, key: str) -> Optional[IdempotencyKey]:
+    """The live stored response for ``key``; an expired one is dropped so the key can be reused."""
+    row = db.get(IdempotencyKey, (user_id, key))
+    if row is not None and row.expires_at <= datetime.utcnow():
+        db.delete(row)
+        db.flush()
+        return None
+    return row
+
+
+def store(db: Session, user_id: int, key: str, fingerprint: str, status_code: int, body: str) -> None:
+    """Remember the response; call before the commit that applies the request."""
+    db.add(
+        IdempotencyKey(
+            user_id=user_id,
+            key=key,
+            request_hash=fingerprint,
+            status_code=status_code,
+            response_body=body,
+            expires_at=datetime.utcnow() + timedelta(hours=TTL_HOURS),
+        )
+    )
+
+
+def purge_expired(db: Session) -> int:
+    deleted = (
+        db.query(IdempotencyKey)
+        .filter(IdempotencyKey.expires_at <= datetime.utcnow())
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
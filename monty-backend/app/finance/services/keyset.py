@@ -0,0 +1,20 @@
+"""Opaque keyset cursors: a ``(timestamp, id)`` pair, base64url-encoded JSON."""
+
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(moment: datetime, key: str) -> str:
+    raw = json.dumps([moment.isoformat(), key])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Raises ``ValueError`` for anything that is not a cursor produced by ``encode_cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        moment, key = json.loads(raw)
+        return datetime.fromisoformat(moment), str(key)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,207 @@
+"""
+Transactional outbox for Telegram notifications.
+
+Endpoints only add a ``NotificationOutbox`` row in the same commit as the transaction,
+so the HTTP response never waits on Telegram. ``deliver_pending`` (a scheduler job
+every few seconds) claims due rows with a short lease, sends them through one shared
+``Bot`` and either marks them sent or reschedules with exponential backoff. Delivery
+is at-least-once: a row whose worker died mid-send is retried once its lease expires.
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import SessionLocal, settings
+from app.finance.models import Category, NotificationOutbox, Transaction
+
+KIND_TRANSACTION = "transaction"
+
+STATUS_PENDING = "pending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+DELIVERY_INTERVAL_SECONDS = 5
+BATCH_SIZE = 20
+LEASE_SECONDS = 60
+MAX_ATTEMPTS = 8
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 3600
+SENT_RETENTION_DAYS = 7
+
+_bot = None
+
+
+def telegram_configured() -> bool:
+    return bool(settings.TELEGRAM_CHAT_ID and settings.TELEGRAM_BOT_TOKEN)
+
+
+def _get_bot():
+    global _bot
+    if _bot is None:
+        from telegram import Bot
+
+        _bot = Bot(token=settings.TELEGRAM_BOT_TOKEN)
+    return _bot
+
+
+def enqueue_transaction(db: Session, transaction: Transaction, category: Category, user_name: str) -> None:
+    """Queue the "new transaction" message; call before the commit that saves ``transaction``."""
+    if not telegram_configured():
+        return
+    payload = {
+        "icon": category.icon,
+        "category_name": category.name,
+        "amount": transaction.amount,
+        "user_name": user_name,
+        "comment": transaction.comment,
+        "transaction_date": transaction.transaction_date.isoformat(),
+    }
+    db.add(
+        NotificationOutbox(
+            kind=KIND_TRANSACTION,
+            payload=json.dumps(payload, ensure_ascii=False),
+            status=STATUS_PENDING,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+        )
+    )
+
+
+def _day_total_until(db: Session, moment: datetime) -> int:
+    """Non-savings expenses of ``moment``'s day up to and including ``moment``."""
+    start_of_day = datetime.combine(moment.date(), datetime.min.time())
+    total = (
+        db.query(func.sum(Transaction.amount))
+        .join(Category)
+        .filter(
+            Transaction.transaction_date >= start_of_day,
+            Transaction.transaction_date <= moment,
+            Category.type == "EXPENSE",
+            Category.group != "SAVINGS",
+        )
+        .scalar()
+    )
+    return total or 0
+
+
+def render_transaction_message(db: Session, payload: dict) -> str:
+    today_total = _day_total_until(db, datetime.fromisoformat(payload["transaction_date"]))
+    text = f"{payload['icon']} <b>{payload['category_name']}</b>\n"
+    text += f"💰 {payload['amount']:,} ₸\n"
+    text += f"👤 {payload['user_name']}"
+    if payload.get("comment"):
+        text += f"\n📝 {payload['comment']}"
+    text += f"\n\n📊 Потрачено за день: {today_total:,} ₸"
+    return text
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before the next try after ``attempts`` failures: 5 s, 10 s, 20 s … capped at 1 h, ±20 %."""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def claim_due(db: Session, limit: int = BATCH_SIZE) -> list[tuple[int, str]]:
+    """
+    Lease up to ``limit`` due rows (``attempts`` + 1, retry pushed ``LEASE_SECONDS`` out)
+    and return ``(id, message text)`` pairs. Rows locked by another worker are skipped.
+    """
+    now = datetime.utcnow()
+    query = (
+        db.query(NotificationOutbox)
+        .filter(
+            NotificationOutbox.status == STATUS_PENDING,
+            NotificationOutbox.next_attempt_at <= now,
+        )
+        .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+        .limit(limit)
+    )
+    if db.get_bind().dialect.name != "sqlite":
+        query = query.with_for_update(skip_locked=True)
+
+    claimed = []
+    for row in query.all():
+        row.attempts += 1
+        row.next_attempt_at = now + timedelta(seconds=LEASE_SECONDS)
+        try:
+            claimed.append((row.id, render_transaction_message(db, json.loads(row.payload))))
+        except (ValueError, KeyError) as e:
+            row.status = STATUS_FAILED
+            row.last_error = f"Bad payload: {e}"[:255]
+    db.commit()
+    return claimed
+
+
+def record_result(
+    db: Session,
+    outbox_id: int,
+    error: Optional[str] = None,
+    retry_after: Optional[float] = None,
+    permanent: bool = False,
+) -> None:
+    row = db.get(NotificationOutbox, outbox_id)
+    if row is None:
+        return
+    now = datetime.utcnow()
+    if error is None:
+        row.status = STATUS_SENT
+        row.sent_at = now
+        row.last_error = None
+    else:
+        row.last_error = error[:255]
+        if permanent or row.attempts >= MAX_ATTEMPTS:
+            row.status = STATUS_FAILED
+        else:
+            delay = max(backoff_seconds(row.attempts), retry_after or 0)
+            row.next_attempt_at = now + timedelta(seconds=delay)
+    db.commit()
+
+
+async def deliver_pending() -> int:
+    """Send due outbox messages; returns how many were delivered."""
+    if not telegram_configured():
+        return 0
+    from telegram.error import BadRequest, Forbidden, RetryAfter
+
+    db = SessionLocal()
+    delivered = 0
+    try:
+        # DB work runs off the event loop so requests are not blocked behind it
+        claimed = await asyncio.to_thread(claim_due, db)
+        bot = _get_bot()
+        for outbox_id, text in claimed:
+            error, retry_after, permanent = None, None, False
+            try:
+                await bot.send_message(chat_id=settings.TELEGRAM_CHAT_ID, text=text, parse_mode="HTML")
+                delivered += 1
+            except RetryAfter as e:
+                error = str(e)
+                retry_after = e.retry_after.total_seconds() if isinstance(e.retry_after, timedelta) else e.retry_after
+            except (BadRequest, Forbidden) as e:
+                # malformed message or the bot was removed from the chat: retrying will not help
+                error, permanent = str(e), True
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            if error:
+                print(f"[Telegram] outbox #{outbox_id} failed: {error}")
+            await asyncio.to_thread(record_result, db, outbox_id, error, retry_after, permanent)
+    finally:
+        db.close()
+    return delivered
+
+
+def purge_sent(db: Session) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=SENT_RETENTION_DAYS)
+    deleted = (
+        db.query(NotificationOutbox)
+        .filter(NotificationOutbox.status == STATUS_SENT, NotificationOutbox.sent_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
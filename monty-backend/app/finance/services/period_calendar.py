@@ -0,0 +1,101 @@
+"""
+Salary-period calendar behind ``transaction_daily_rollups.period_id``.
+
+``financial_periods`` holds one row per salary period. Its ``id`` is ``YYYYMM`` of the
+month the period starts in, so ids survive a ``salary_day`` change and only the
+boundaries move. Every rollup row carries the ``period_id`` of its day. That turns
+"spent this period", period-over-period comparisons and per-period trends into
+equality ``GROUP BY period_id`` reads.
+
+``regenerate`` rebuilds the calendar and re-stamps all rollups; it runs whenever
+``salary_day`` is saved. Rollup writers call ``period_ids_for`` and get missing
+periods (old imports, dates past the horizon) added on the fly.
+"""
+
+import threading
+from datetime import date, timedelta
+from typing import Iterable
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.finance.models import FinancialPeriod, TransactionDailyRollup
+from app.finance.services.database import get_financial_period, get_financial_periods_between
+
+HORIZON_DAYS = 366
+
+_periods = FinancialPeriod.__table__
+_rollups = TransactionDailyRollup.__table__
+
+# ids confirmed to exist in the table; only read back from the DB, never assumed after an insert
+_known_ids: set[int] = set()
+_known_lock = threading.Lock()
+
+
+def period_id(start: date) -> int:
+    return start.year * 100 + start.month
+
+
+def period_ids_for(db: Session, days: Iterable[date], salary_day: int) -> dict[date, int]:
+    """``{day: period_id}``, inserting calendar rows that are missing; caller commits."""
+    ids: dict[date, int] = {}
+    needed: dict[int, tuple[date, date]] = {}
+    for day in set(days):
+        start, end = get_financial_period(day, salary_day)
+        ids[day] = pid = period_id(start)
+        if pid not in _known_ids:
+            needed[pid] = (start, end)
+    if needed:
+        present = {
+            row.id for row in db.query(FinancialPeriod.id).filter(FinancialPeriod.id.in_(needed)).all()
+        }
+        with _known_lock:
+            _known_ids.update(present)
+        missing = [
+            {"id": pid, "start_date": start, "end_date": end}
+            for pid, (start, end) in needed.items()
+            if pid not in present
+        ]
+        if missing:
+            # a concurrent first write may add the same period; its row is identical
+            db.execute(_insert_missing(db.get_bind().dialect.name), missing)
+    return ids
+
+
+def _insert_missing(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(_periods)
+    return dialect_insert(_periods).on_conflict_do_nothing(index_elements=[_periods.c.id])
+
+
+def regenerate(db: Session, salary_day: int) -> int:
+    """
+    Rebuild the calendar for ``salary_day`` (from the oldest rollup day to a year ahead)
+    and re-stamp every rollup row. Caller commits; returns the number of periods.
+    """
+    today = date.today()
+    first = db.query(func.min(TransactionDailyRollup.day)).scalar() or today
+    periods = get_financial_periods_between(
+        min(first, today), today + timedelta(days=HORIZON_DAYS), salary_day
+    )
+
+    db.execute(update(_rollups).values(period_id=None))
+    db.execute(delete(_periods))
+    db.execute(
+        insert(_periods),
+        [{"id": period_id(start), "start_date": start, "end_date": end} for start, end in periods],
+    )
+    db.execute(
+        update(_rollups).values(
+            period_id=select(_periods.c.id)
+            .where(_rollups.c.day.between(_periods.c.start_date, _periods.c.end_date))
+            .scalar_subquery()
+        )
+    )
+    with _known_lock:
+        _known_ids.clear()
+    return len(periods)
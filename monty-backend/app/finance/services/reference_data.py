@@ -0,0 +1,10 @@
+"""Finance reference tables cached in process (see ``app.core.reference_data``)."""
+
+from app.core.reference_data import ReferenceTable
+from app.finance.models import Category
+
+# active (not archived) categories only; invalidated by the /categories endpoints
+categories = ReferenceTable(
+    "categories",
+    lambda db: db.query(Category).filter(Category.archived_at.is_(None)).order_by(Category.id).all(),
+)
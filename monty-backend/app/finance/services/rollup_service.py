@@ -0,0 +1,230 @@
+"""
+Per-day (category, user) sums of transactions, kept in step with ledger writes.
+
+Handlers call ``add_transaction`` / ``remove_transaction`` before committing so the
+rollup row changes in the same DB transaction as the ledger row. New rows are stamped
+with their salary period (``period_calendar``). The same hooks keep the all-time
+per-category totals in ``category_balances`` (the savings balance of ``/goals``). Run
+``python -m app.finance.services.rollup_service`` to rebuild from scratch.
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.finance.models import CategoryBalance, Transaction, TransactionDailyRollup
+from app.finance.services import period_calendar
+from app.finance.services.settings_service import SettingsService
+
+_rollups = TransactionDailyRollup.__table__
+_balances = CategoryBalance.__table__
+
+
+def _upsert_statement(dialect: str, table=_rollups):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(table.primary_key.columns),
+        set_={
+            "total_amount": table.c.total_amount + stmt.excluded.total_amount,
+            "tx_count": table.c.tx_count + stmt.excluded.tx_count,
+        },
+    )
+
+
+def _add_to_balances(db: Session, deltas: dict[int, list[int]]) -> None:
+    """Apply ``{category_id: [amount, count]}`` to ``category_balances``."""
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        db.execute(
+            _upsert_statement(dialect, _balances),
+            [
+                {"category_id": category_id, "total_amount": amount, "tx_count": count}
+                for category_id, (amount, count) in deltas.items()
+            ],
+        )
+        return
+    for category_id, (amount, count) in deltas.items():
+        row = db.get(CategoryBalance, category_id)
+        if row is None:
+            db.add(CategoryBalance(category_id=category_id, total_amount=amount, tx_count=count))
+        else:
+            row.total_amount += amount
+            row.tx_count += count
+    db.flush()
+
+
+def _period_ids(db: Session, days) -> dict[date, int]:
+    return period_calendar.period_ids_for(db, days, SettingsService.get_salary_day(db))
+
+
+def _upsert_delta(
+    db: Session, day: date, category_id: int, user_id: int, amount: int, count: int, period_id: int
+) -> None:
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        db.execute(
+            _upsert_statement(dialect).values(
+                day=day,
+                category_id=category_id,
+                user_id=user_id,
+                total_amount=amount,
+                tx_count=count,
+                period_id=period_id,
+            )
+        )
+    else:
+        row = db.get(TransactionDailyRollup, (day, category_id, user_id))
+        if row is None:
+            db.add(
+                TransactionDailyRollup(
+                    day=day,
+                    category_id=category_id,
+                    user_id=user_id,
+                    total_amount=amount,
+                    tx_count=count,
+                    period_id=period_id,
+                )
+            )
+        else:
+            row.total_amount += amount
+            row.tx_count += count
+        db.flush()
+
+    if count < 0:
+        db.execute(
+            delete(_rollups).where(
+                _rollups.c.day == day,
+                _rollups.c.category_id == category_id,
+                _rollups.c.user_id == user_id,
+                _rollups.c.tx_count <= 0,
+            )
+        )
+    _add_to_balances(db, {category_id: [amount, count]})
+
+
+def _transaction_day(value: datetime | None) -> date:
+    return (value or datetime.utcnow()).date()
+
+
+def add_transaction(db: Session, transaction: Transaction) -> None:
+    day = _transaction_day(transaction.transaction_date)
+    _upsert_delta(
+        db,
+        day,
+        transaction.category_id,
+        transaction.user_id,
+        transaction.amount,
+        1,
+        _period_ids(db, [day])[day],
+    )
+
+
+def remove_transaction(db: Session, transaction: Transaction) -> None:
+    day = _transaction_day(transaction.transaction_date)
+    _upsert_delta(
+        db,
+        day,
+        transaction.category_id,
+        transaction.user_id,
+        -transaction.amount,
+        -1,
+        _period_ids(db, [day])[day],
+    )
+
+
+def add_rows(db: Session, rows: list[dict]) -> None:
+    """Bulk counterpart of ``add_transaction`` for plain ``transactions`` row dicts."""
+    deltas: dict[tuple[date, int, int], list[int]] = {}
+    for row in rows:
+        key = (_transaction_day(row["transaction_date"]), row["category_id"], row["user_id"])
+        delta = deltas.setdefault(key, [0, 0])
+        delta[0] += row["amount"]
+        delta[1] += 1
+    if not deltas:
+        return
+
+    period_ids = _period_ids(db, {day for day, _, _ in deltas})
+    dialect = db.get_bind().dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        for (day, category_id, user_id), (amount, count) in deltas.items():
+            _upsert_delta(db, day, category_id, user_id, amount, count, period_ids[day])
+        return
+
+    by_category: dict[int, list[int]] = {}
+    for (_, category_id, _), (amount, count) in deltas.items():
+        balance = by_category.setdefault(category_id, [0, 0])
+        balance[0] += amount
+        balance[1] += count
+    _add_to_balances(db, by_category)
+    db.execute(
+        _upsert_statement(dialect),
+        [
+            {
+                "day": day,
+                "category_id": category_id,
+                "user_id": user_id,
+                "total_amount": amount,
+                "tx_count": count,
+                "period_id": period_ids[day],
+            }
+            for (day, category_id, user_id), (amount, count) in deltas.items()
+        ],
+    )
+
+
+def drop_category(db: Session, category_id: int) -> None:
+    db.execute(delete(_rollups).where(_rollups.c.category_id == category_id))
+    db.execute(delete(_balances).where(_balances.c.category_id == category_id))
+
+
+def rebuild_daily_rollups(db: Session) -> int:
+    """
+    Recreate every rollup row and category balance from ``transactions``; returns the
+    number of rollup rows written.
+    """
+    day = func.date(Transaction.transaction_date)
+    source = select(
+        day,
+        Transaction.category_id,
+        Transaction.user_id,
+        func.sum(Transaction.amount),
+        func.count(Transaction.id),
+    ).group_by(day, Transaction.category_id, Transaction.user_id)
+
+    db.execute(delete(_rollups))
+    db.execute(
+        insert(_rollups).from_select(
+            ["day", "category_id", "user_id", "total_amount", "tx_count"],
+            source,
+        )
+    )
+    db.execute(delete(_balances))
+    db.execute(
+        insert(_balances).from_select(
+            ["category_id", "total_amount", "tx_count"],
+            select(
+                Transaction.category_id, func.sum(Transaction.amount), func.count(Transaction.id)
+            ).group_by(Transaction.category_id),
+        )
+    )
+    period_calendar.regenerate(db, SettingsService.get_salary_day(db))
+    db.commit()
+    return db.query(func.count()).select_from(_rollups).scalar() or 0
+
+
+if __name__ == "__main__":
+    from app.core.config import SessionLocal
+    from app.finance.services.analytics_cache import ANALYTICS_TTL_SECONDS
+
+    session = SessionLocal()
+    try:
+        written = rebuild_daily_rollups(session)
+        print(f"[rollups] rebuilt transaction_daily_rollups: {written} rows")
+        print(f"[rollups] a running API picks this up once its analytics cache expires ({ANALYTICS_TTL_SECONDS}s)")
+    finally:
+        session.close()
@@ -1,10 +1,20 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 import pytz
 
 from app.core.config import SessionLocal
+from app.finance.services.category_archive import PURGE_INTERVAL_SECONDS, purge_archived
 from app.finance.services.digest_service import generate_ai_digest, send_digest_to_telegram, send_reminder_notification, send_daily_summary
+from app.finance.services.idempotency_service import purge_expired as purge_expired_idempotency_keys
+from app.finance.services.notification_outbox import (
+    DELIVERY_INTERVAL_SECONDS,
+    deliver_pending,
+    purge_sent,
+    telegram_configured,
+)
+from app.finance.services.sync_service import purge_tombstones
 from app.food.services.telegram_reminder import send_tomorrow_food_telegram_reminder
 from app.core.config import settings
 
@@ -48,6 +58,60 @@ def send_food_tomorrow_reminder():
         print(f"[{datetime.now()}] Error sending food tomorrow reminder: {e}")
 
 
+def purge_sync_tombstones():
+    db = SessionLocal()
+    try:
+        purged = purge_tombstones(db)
+        print(f"[{datetime.now()}] Purged {purged} transaction tombstones")
+    except Exception as e:
+        print(f"[{datetime.now()}] Error purging transaction tombstones: {e}")
+    finally:
+        db.close()
+
+
+async def deliver_notifications():
+    try:
+        delivered = await deliver_pending()
+        if delivered:
+            print(f"[{datetime.now()}] Delivered {delivered} outbox notifications")
+    except Exception as e:
+        print(f"[{datetime.now()}] Error delivering outbox notifications: {e}")
+
+
+def purge_sent_notifications():
+    db = SessionLocal()
+    try:
+        purged = purge_sent(db)
+        print(f"[{datetime.now()}] Purged {purged} sent outbox notifications")
+    except Exception as e:
+        print(f"[{datetime.now()}] Error purging sent outbox notifications: {e}")
+    finally:
+        db.close()
+
+
+def purge_idempotency_keys():
+    db = SessionLocal()
+    try:
+        purged = purge_expired_idempotency_keys(db)
+        print(f"[{datetime.now()}] Purged {purged} expired idempotency keys")
+    except Exception as e:
+        print(f"[{datetime.now()}] Error purging idempotency keys: {e}")
+    finally:
+        db.close()
+
+
+def purge_archived_categories():
+    db = SessionLocal()
+    try:
+        purged = purge_archived(db)
+        if purged:
+            print(f"[{datetime.now()}] Purged {purged} transactions of archived categories")
+    except Exception as e:
+        print(f"[{datetime.now()}] Error purging archived categories: {e}")
+    finally:
+        db.close()
+
+
 def setup_scheduler():
     reminder_trigger = CronTrigger(
         hour=21,
@@ -90,7 +154,56 @@ def setup_scheduler():
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        purge_sync_tombstones,
+        trigger=CronTrigger(hour=4, minute=0, timezone=pytz.timezone("Asia/Almaty")),
+        id="purge_sync_tombstones",
+        name="Purge expired transaction tombstones",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        deliver_notifications,
+        trigger=IntervalTrigger(seconds=DELIVERY_INTERVAL_SECONDS),
+        id="deliver_notifications",
+        name="Telegram: deliver queued notifications",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    scheduler.add_job(
+        purge_sent_notifications,
+        trigger=CronTrigger(hour=4, minute=10, timezone=pytz.timezone("Asia/Almaty")),
+        id="purge_sent_notifications",
+        name="Purge delivered outbox notifications",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        purge_idempotency_keys,
+        trigger=CronTrigger(hour=4, minute=20, timezone=pytz.timezone("Asia/Almaty")),
+        id="purge_idempotency_keys",
+        name="Purge expired idempotency keys",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        purge_archived_categories,
+        trigger=IntervalTrigger(seconds=PURGE_INTERVAL_SECONDS),
+        id="purge_archived_categories",
+        name="Purge transactions of archived categories",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
     print("Scheduler configured:")
     print("  - Reminder at 21:00 (Almaty time)")
     print("  - Food tomorrow menu at 20:00 (Almaty time)")
     print("  - Daily summary at 23:50 (Almaty time)")
+    print(f"  - Outbox delivery every {DELIVERY_INTERVAL_SECONDS}s")
+    print(f"  - Archived category purge every {PURGE_INTERVAL_SECONDS}s")
+    print("  - Tombstone purge at 04:00, sent outbox purge at 04:10, idempotency keys at 04:20 (Almaty time)")
+    if not telegram_configured():
+        print("[Telegram] Notifications disabled - missing chat_id or bot_token")
@@ -1,55 +1,107 @@
-from typing import Optional
+from datetime import date
+from typing import Callable, Optional
 
+from app.core.cache import LRUCache
 from app.finance.models import Settings
 from sqlalchemy.orm import Session
 
+# Bounds staleness if the table is edited outside the API process (manual SQL, scripts).
+SETTINGS_TTL_SECONDS = 300
+
+
+class AppSettings:
+    """All settings parsed once: raw strings for the UI plus typed values for the code."""
+
+    def __init__(self, raw: dict[str, str]):
+        self.raw = raw
+        self.target_amount = _parse_int(raw.get("target_amount"), 0)
+        self.total_budget = _parse_int(raw.get("total_budget"), 0)
+        self.salary_day = _parse_int(raw.get("salary_day"), 1)
+        self.target_date = _parse_date(raw.get("target_date"))
+
+
+def _parse_int(value: Optional[str], default: int) -> int:
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
 
 class SettingsService:
     # Список ключей настройки — всё хранится только в БД (таблица settings).
     # Значения задаются через UI (настройки), в коде дефолтов нет.
     SETTINGS_KEYS = ("target_amount", "target_date", "salary_day", "total_budget")
 
+    # Вся таблица settings читается одним запросом и держится в памяти процесса;
+    # set_setting обновляет кэш сразу после коммита (write-through).
+    _cache = LRUCache(maxsize=1, ttl_seconds=SETTINGS_TTL_SECONDS)
+
+    @staticmethod
+    def load(db: Session) -> AppSettings:
+        snapshot = SettingsService._cache.get("settings")
+        if snapshot is None:
+            raw = {s.key: s.value for s in db.query(Settings.key, Settings.value).all()}
+            snapshot = AppSettings(raw)
+            SettingsService._cache.set("settings", snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate() -> None:
+        SettingsService._cache.clear()
+
     @staticmethod
     def get_setting(db: Session, key: str) -> Optional[str]:
-        setting = db.query(Settings).filter(Settings.key == key).first()
-        return setting.value if setting else None
+        return SettingsService.load(db).raw.get(key)
 
     @staticmethod
-    def set_setting(db: Session, key: str, value: str) -> Settings:
+    def set_setting(
+        db: Session,
+        key: str,
+        value: str,
+        before_commit: Optional[Callable[[AppSettings], None]] = None,
+    ) -> Settings:
+        """
+        Save one setting. ``before_commit`` gets the updated settings and may stage
+        dependent writes, which then land in the same commit as the setting.
+        """
+        updated = AppSettings({**SettingsService.load(db).raw, key: value})
         setting = db.query(Settings).filter(Settings.key == key).first()
         if setting:
             setting.value = value
         else:
             setting = Settings(key=key, value=value)
             db.add(setting)
+        if before_commit is not None:
+            before_commit(updated)
         db.commit()
         db.refresh(setting)
+        SettingsService._cache.set("settings", updated)
         return setting
 
     @staticmethod
     def get_all_settings(db: Session) -> dict:
-        result = {}
-        for key in SettingsService.SETTINGS_KEYS:
-            val = SettingsService.get_setting(db, key)
-            result[key] = val if val is not None else ""
-        return result
+        raw = SettingsService.load(db).raw
+        return {key: raw.get(key) or "" for key in SettingsService.SETTINGS_KEYS}
 
     @staticmethod
     def get_target_amount(db: Session) -> int:
-        val = SettingsService.get_setting(db, "target_amount")
-        return int(val) if val else 0
+        return SettingsService.load(db).target_amount
 
     @staticmethod
-    def get_target_date(db: Session) -> str:
-        val = SettingsService.get_setting(db, "target_date")
-        return val or ""
+    def get_target_date(db: Session) -> Optional[date]:
+        return SettingsService.load(db).target_date
 
     @staticmethod
     def get_salary_day(db: Session) -> int:
-        val = SettingsService.get_setting(db, "salary_day")
-        return int(val) if val else 1
+        return SettingsService.load(db).salary_day
 
     @staticmethod
     def get_total_budget(db: Session) -> int:
-        val = SettingsService.get_setting(db, "total_budget")
-        return int(val) if val else 0
+        return SettingsService.load(db).total_budget
@@ -0,0 +1,121 @@
+"""
+Delta sync of the transaction ledger.
+
+Rows carry ``updated_at`` (set on insert and every ORM update); deletes leave a
+``TransactionTombstone``. ``changes_since`` merges both streams in ``(timestamp, id)``
+order behind an opaque keyset cursor. Tombstones older than
+``TOMBSTONE_RETENTION_DAYS`` are purged daily; a client whose cursor is older than
+that gets ``reset=True`` and must refetch everything.
+
+Timestamps are stamped at flush, not at commit, so a change can become visible after
+a later-stamped one was already served. The cursor therefore carries two positions:
+the last change served and a *settled* point that never passes
+``now - SYNC_OVERLAP_SECONDS`` of the page that first reached that window. Pages move
+forward from the served position (``has_more`` is exact); the last page of a pull
+hands out a cursor at the settled point, so the next pull serves the overlap window
+again. Clients apply changes idempotently (upsert / delete by id).
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.finance.models import Category, Transaction, TransactionTombstone
+from app.finance.services.keyset import decode_cursor, encode_cursor
+
+TOMBSTONE_RETENTION_DAYS = 90
+# longest a write may sit between stamping ``updated_at`` / ``deleted_at`` and its commit
+SYNC_OVERLAP_SECONDS = 30
+
+Position = tuple[datetime, str]
+
+
+def record_deletions(db: Session, transaction_ids: Iterable[str]) -> None:
+    """Leave tombstones for deleted transactions; call in the deleting DB transaction."""
+    now = datetime.utcnow()
+    rows = [{"transaction_id": tid, "deleted_at": now} for tid in transaction_ids]
+    if rows:
+        db.execute(insert(TransactionTombstone.__table__), rows)
+
+
+def encode_sync_cursor(settled: Position, position: Position) -> str:
+    if settled == position:
+        return encode_cursor(*position)
+    return f"{encode_cursor(*position)}.{encode_cursor(*settled)}"
+
+
+def decode_sync_cursor(cursor: str) -> tuple[Position, Position]:
+    """``(settled, position)``; raises ``ValueError`` for anything ``encode_sync_cursor`` did not produce."""
+    parts = cursor.split(".")
+    if len(parts) > 2:
+        raise ValueError("Invalid cursor")
+    position = decode_cursor(parts[0])
+    return (decode_cursor(parts[1]) if len(parts) == 2 else position), position
+
+
+def changes_since(db: Session, since: Optional[tuple[Position, Position]], limit: int) -> dict:
+    """
+    Up to ``limit`` changes after ``since`` (a decoded cursor; ``None`` = full snapshot,
+    no tombstones). Returns upserted ``Transaction`` objects, deleted ids,
+    ``next_cursor`` and ``has_more``.
+    """
+    now = datetime.utcnow()
+    reset = since is not None and since[0][0] < now - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+    settled, position = (None, None) if since is None or reset else since
+
+    rows_query = db.query(Transaction).filter(
+        Transaction.category_id.not_in(select(Category.id).where(Category.archived_at.is_not(None)))
+    )
+    if position is not None:
+        rows_query = rows_query.filter(tuple_(Transaction.updated_at, Transaction.id) > tuple_(*position))
+    rows = (
+        rows_query.order_by(Transaction.updated_at, Transaction.id)
+        .limit(limit + 1)
+        .all()
+    )
+
+    tombstones = []
+    if position is not None:
+        tombstones = (
+            db.query(TransactionTombstone)
+            .filter(
+                tuple_(TransactionTombstone.deleted_at, TransactionTombstone.transaction_id)
+                > tuple_(*position)
+            )
+            .order_by(TransactionTombstone.deleted_at, TransactionTombstone.transaction_id)
+            .limit(limit + 1)
+            .all()
+        )
+
+    merged = sorted(
+        [(t.updated_at, t.id, t) for t in rows]
+        + [(t.deleted_at, t.transaction_id, None) for t in tombstones],
+        key=lambda item: (item[0], item[1]),
+    )
+    has_more = len(merged) > limit
+    merged = merged[:limit]
+
+    served = (merged[-1][0], merged[-1][1]) if merged else position
+    if served is None:
+        next_cursor = None
+    else:
+        if settled is None or settled == position:
+            settled = min(served, (now - timedelta(seconds=SYNC_OVERLAP_SECONDS), ""))
+        # else an earlier page of this pull reached the overlap window: keep its settled point
+        next_cursor = encode_sync_cursor(settled, served if has_more else settled)
+    return {
+        "upserted": [t for _, _, t in merged if t is not None],
+        "deleted": [key for _, key, t in merged if t is None],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "reset": reset,
+    }
+
+
+def purge_tombstones(db: Session) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+    result = db.execute(delete(TransactionTombstone).where(TransactionTombstone.deleted_at < cutoff))
+    db.commit()
+    return result.rowcount or 0
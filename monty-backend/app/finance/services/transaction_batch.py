@@ -0,0 +1,100 @@
+"""
+Mixed create / update / delete of transactions applied in one DB transaction.
+
+Categories and target transactions are each read with one ``IN`` query; the whole batch is validated before anything is written, so it either applies
+completely or not at all.
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.finance.models import Category, Transaction
+from app.finance.schemas import TransactionBatchOperation, TransactionResponse
+from app.finance.services import category_archive, notification_outbox, rollup_service, sync_service
+from app.finance.services.auth_cache import UserSnapshot
+
+
+def validate_batch(db: Session, operations: list[TransactionBatchOperation]) -> tuple[dict, dict, list[dict]]:
+    """Returns ``(categories by id, transactions by id, errors)``; errors carry the op index."""
+    category_ids = {op.category_id for op in operations if op.category_id is not None}
+    transaction_ids = {op.id for op in operations if op.id is not None}
+    categories = category_archive.active_categories(db, category_ids)
+    transactions = (
+        {t.id: t for t in db.query(Transaction).filter(Transaction.id.in_(transaction_ids)).all()}
+        if transaction_ids
+        else {}
+    )
+
+    errors: list[dict] = []
+    deleted: set[str] = set()
+    for index, op in enumerate(operations):
+        if op.op == "create":
+            if op.category_id is None or op.amount is None:
+                errors.append({"index": index, "error": "category_id and amount are required"})
+                continue
+        elif op.id is None:
+            errors.append({"index": index, "error": "id is required"})
+            continue
+        elif op.id not in transactions or op.id in deleted:
+            errors.append({"index": index, "error": "Transaction not found"})
+            continue
+        if op.category_id is not None and op.category_id not in categories:
+            errors.append({"index": index, "error": "Category not found"})
+            continue
+        if op.op == "delete":
+            deleted.add(op.id)
+    return categories, transactions, errors
+
+
+def apply_batch(
+    db: Session,
+    current_user: UserSnapshot,
+    operations: list[TransactionBatchOperation],
+    categories: dict[int, Category],
+    transactions: dict[str, Transaction],
+) -> list[dict]:
+    """
+    Apply validated operations and commit once, queueing a notification per create.
+    Returns per-operation results.
+    """
+    results: list[dict] = []
+    user_name = current_user.first_name or "Пользователь"
+    now = datetime.utcnow()
+    for index, op in enumerate(operations):
+        if op.op == "create":
+            transaction = Transaction(
+                user_id=current_user.id,
+                category_id=op.category_id,
+                amount=op.amount,
+                comment=op.comment,
+                transaction_date=now,
+            )
+            db.add(transaction)
+            rollup_service.add_transaction(db, transaction)
+            notification_outbox.enqueue_transaction(db, transaction, categories[op.category_id], user_name)
+        elif op.op == "update":
+            transaction = transactions[op.id]
+            rollup_service.remove_transaction(db, transaction)
+            if op.category_id is not None:
+                transaction.category_id = op.category_id
+            if op.amount is not None:
+                transaction.amount = op.amount
+            if op.comment is not None:
+                transaction.comment = op.comment
+            rollup_service.add_transaction(db, transaction)
+        else:
+            transaction = transactions[op.id]
+            rollup_service.remove_transaction(db, transaction)
+            sync_service.record_deletions(db, [transaction.id])
+            db.delete(transaction)
+        results.append({"index": index, "op": op.op, "transaction": transaction})
+
+    db.flush()
+    for result in results:
+        transaction = result.pop("transaction")
+        result["id"] = transaction.id
+        if result["op"] != "delete":
+            result["transaction"] = TransactionResponse.model_validate(transaction)
+    db.commit()
+    return results
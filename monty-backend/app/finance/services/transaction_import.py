@@ -0,0 +1,210 @@
+"""
+Bulk import of transactions in the CSV export layout (or JSON objects with the same keys).
+
+Categories and users are resolved with one lookup each, rows are validated up front,
+valid rows are inserted with chunked ``executemany`` and the daily rollups are bumped
+once per (day, category, user). No Telegram notifications are sent.
+
+    python -m app.finance.services.transaction_import history.csv --user-id 1 [--dry-run]
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.finance.models import Transaction, TransactionType, User
+from app.finance.services import reference_data, rollup_service
+
+COLUMN_DATE = "Дата"
+COLUMN_CATEGORY = "Категория"
+COLUMN_AMOUNT = "Сумма"
+COLUMN_TYPE = "Тип"
+COLUMN_USER = "Кто"
+COLUMN_COMMENT = "Комментарий"
+
+INSERT_CHUNK = 5_000
+COMMENT_MAX_LENGTH = 255
+
+
+class ImportFormatError(ValueError):
+    """The payload as a whole cannot be read (wrong format, missing columns)."""
+
+
+def read_csv(text: str) -> list[dict]:
+    reader = csv.DictReader(io.StringIO(text.lstrip("\ufeff")))
+    missing = {COLUMN_DATE, COLUMN_CATEGORY, COLUMN_AMOUNT} - set(reader.fieldnames or [])
+    if missing:
+        raise ImportFormatError(f"Missing columns: {', '.join(sorted(missing))}")
+    return list(reader)
+
+
+def read_json(text: str) -> list[dict]:
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ImportFormatError(f"Invalid JSON: {e}") from e
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ImportFormatError("Expected a JSON array of objects")
+    return data
+
+
+def _parse_date(value) -> datetime:
+    raw = str(value or "").strip()
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(raw, fmt)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(raw.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
+class _Lookups:
+    def __init__(self, db: Session):
+        self.by_name_type: dict[tuple[str, str], int] = {}
+        self.by_name: dict[str, list[int]] = {}
+        for c in reference_data.categories.rows(db):
+            key = c.name.strip().lower()
+            self.by_name_type[(key, c.type.value)] = c.id
+            self.by_name.setdefault(key, []).append(c.id)
+        self.users: dict[str, int] = {}
+        for u in db.query(User.id, User.first_name).all():
+            self.users.setdefault((u.first_name or "").strip().lower(), u.id)
+
+    def category_id(self, name: str, type_value: str) -> int:
+        key = name.strip().lower()
+        if type_value:
+            if type_value not in TransactionType.__members__:
+                raise ValueError(f"Unknown type {type_value!r}")
+            category_id = self.by_name_type.get((key, type_value))
+            if category_id is None:
+                raise ValueError(f"Unknown category {name!r} ({type_value})")
+            return category_id
+        ids = self.by_name.get(key, [])
+        if not ids:
+            raise ValueError(f"Unknown category {name!r}")
+        if len(ids) > 1:
+            raise ValueError(f"Ambiguous category {name!r}: set {COLUMN_TYPE}")
+        return ids[0]
+
+    def user_id(self, name: str, default_user_id: int) -> int:
+        if not name.strip():
+            return default_user_id
+        user_id = self.users.get(name.strip().lower())
+        if user_id is None:
+            raise ValueError(f"Unknown user {name!r}")
+        return user_id
+
+
+def validate_rows(db: Session, records: Iterable[dict], default_user_id: int) -> tuple[list[dict], list[dict]]:
+    """Turn export-layout records into ``transactions`` rows; returns ``(rows, errors)``."""
+    lookups = _Lookups(db)
+    rows: list[dict] = []
+    errors: list[dict] = []
+    for number, record in enumerate(records, 1):
+        try:
+            try:
+                transaction_date = _parse_date(record.get(COLUMN_DATE))
+            except ValueError:
+                raise ValueError(f"Invalid date {record.get(COLUMN_DATE)!r}")
+            try:
+                amount = int(str(record.get(COLUMN_AMOUNT, "")).strip())
+            except ValueError:
+                raise ValueError(f"Invalid amount {record.get(COLUMN_AMOUNT)!r}")
+            if amount <= 0:
+                raise ValueError("Amount must be positive")
+            comment = str(record.get(COLUMN_COMMENT) or "").strip() or None
+            if comment and len(comment) > COMMENT_MAX_LENGTH:
+                raise ValueError(f"Comment longer than {COMMENT_MAX_LENGTH} characters")
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": lookups.user_id(str(record.get(COLUMN_USER) or ""), default_user_id),
+                    "category_id": lookups.category_id(
+                        str(record.get(COLUMN_CATEGORY) or ""),
+                        str(record.get(COLUMN_TYPE) or "").strip().upper(),
+                    ),
+                    "amount": amount,
+                    "transaction_date": transaction_date,
+                    "comment": comment,
+                }
+            )
+        except ValueError as e:
+            errors.append({"row": number, "error": str(e)})
+    return rows, errors
+
+
+def insert_rows(db: Session, rows: list[dict]) -> None:
+    """Chunked executemany into ``transactions`` plus one bulk rollup update; caller commits."""
+    table = Transaction.__table__
+    for start in range(0, len(rows), INSERT_CHUNK):
+        db.execute(insert(table), rows[start:start + INSERT_CHUNK])
+    rollup_service.add_rows(db, rows)
+
+
+def import_records(
+    db: Session,
+    records: Iterable[dict],
+    default_user_id: int,
+    dry_run: bool = False,
+) -> dict:
+    """Validate and insert; invalid rows are reported and skipped, valid ones commit together."""
+    rows, errors = validate_rows(db, records, default_user_id)
+    if rows and not dry_run:
+        insert_rows(db, rows)
+        db.commit()
+    return {
+        "total_rows": len(rows) + len(errors),
+        "imported": 0 if dry_run else len(rows),
+        "dry_run": dry_run,
+        "errors": errors,
+    }
+
+
+def read_records(text: str, fmt: Optional[str]) -> list[dict]:
+    if fmt is None:
+        fmt = "json" if text.lstrip().startswith("[") else "csv"
+    return read_json(text) if fmt == "json" else read_csv(text)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from pathlib import Path
+
+    from app.core.config import SessionLocal
+    from app.finance.services.analytics_cache import ANALYTICS_TTL_SECONDS
+
+    parser = argparse.ArgumentParser(description="Import transactions from an export-layout CSV / JSON file")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--user-id", type=int, required=True, help="owner of rows with an empty «Кто»")
+    parser.add_argument("--format", choices=("csv", "json"), default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        started = time.perf_counter()
+        result = import_records(
+            session,
+            read_records(args.path.read_text(encoding="utf-8"), args.format),
+            args.user_id,
+            dry_run=args.dry_run,
+        )
+    finally:
+        session.close()
+
+    for error in result["errors"][:20]:
+        print(f"[import] row {error['row']}: {error['error']}")
+    print(
+        f"[import] {result['imported']} of {result['total_rows']} rows imported"
+        f" ({len(result['errors'])} errors) in {time.perf_counter() - started:.1f}s"
+    )
+    if result["imported"]:
+        # this process cannot reach the API's in-memory cache
+        print(f"[import] a running API shows the new rows once its analytics cache expires ({ANALYTICS_TTL_SECONDS}s)")
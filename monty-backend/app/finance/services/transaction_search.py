@@ -0,0 +1,90 @@
+"""
+Indexed search over transaction comments (plus category names).
+
+Postgres: ``transactions.search_vector`` is a stored ``tsvector`` generated from the
+comment with the ``russian`` configuration (stemming) and GIN-indexed. SQLite (DEV):
+``transactions_fts`` is an FTS5 table kept in sync by triggers; its rowid is the integer
+key of the transaction in ``transactions_fts_keys`` (not ``transactions.rowid``, which
+``VACUUM`` may renumber); FTS5 has no Russian
+stemmer, so words are matched by prefix instead. Both are created by migrations
+(``0005``, ``0013``) and need no application-side maintenance on insert / update.
+"""
+
+import re
+
+from sqlalchemy import false, func, literal_column, or_, select, text
+from sqlalchemy.orm import Query, Session
+
+from app.finance.models import Category, Transaction
+
+SEARCH_CONFIG = "russian"
+FTS_TABLE = "transactions_fts"
+FTS_KEYS_TABLE = "transactions_fts_keys"
+
+# Schema objects managed by the search migration rather than the ORM models;
+# ``migrations/env.py`` skips them when comparing metadata.
+SEARCH_SCHEMA_OBJECTS = {"search_vector", "ix_transactions_search_vector"}
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def search_words(term: str) -> list[str]:
+    return _WORD.findall(term.lower())
+
+
+def _category_ids_matching(db: Session, term: str) -> list[int]:
+    # categories are a handful of rows; ILIKE here does not touch transactions
+    rows = db.query(Category.id).filter(Category.name.ilike(f"%{term}%")).all()
+    return [r.id for r in rows]
+
+
+def _fts_hits(words: list[str]):
+    """Transaction ids (and bm25 rank, lower is better) of FTS5 matches for all ``words`` as prefixes."""
+    fts_query = " ".join('"{}"*'.format(w.replace('"', '""')) for w in words)
+    return (
+        select(
+            literal_column(f"{FTS_KEYS_TABLE}.transaction_id").label("transaction_id"),
+            literal_column(f"bm25({FTS_TABLE})").label("rank"),
+        )
+        .select_from(text(f"{FTS_TABLE} JOIN {FTS_KEYS_TABLE} ON {FTS_KEYS_TABLE}.key = {FTS_TABLE}.rowid"))
+        .where(text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=fts_query))
+        .subquery("fts_hits")
+    )
+
+
+def apply_search(db: Session, query: Query, term: str, by_relevance: bool = False) -> Query:
+    """
+    Restrict ``query`` (over ``Transaction``) to rows whose comment matches every word of
+    ``term`` or whose category name contains ``term``. With ``by_relevance`` the query is
+    ordered by text rank (best first); otherwise ordering is left to the caller.
+    """
+    words = search_words(term)
+    conditions = []
+    rank_order = None
+
+    category_ids = _category_ids_matching(db, term.strip())
+    if category_ids:
+        conditions.append(Transaction.category_id.in_(category_ids))
+
+    dialect = db.get_bind().dialect.name
+    if words and dialect == "postgresql":
+        ts_query = func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{w}:*" for w in words))
+        vector = literal_column("transactions.search_vector")
+        conditions.append(vector.op("@@")(ts_query))
+        rank_order = func.ts_rank(vector, ts_query).desc()
+    elif words and dialect == "sqlite":
+        hits = _fts_hits(words)
+        conditions.append(Transaction.id.in_(select(hits.c.transaction_id)))
+        if by_relevance:
+            query = query.outerjoin(hits, hits.c.transaction_id == Transaction.id)
+            # category-only matches have no bm25 score and sort after text hits
+            rank_order = func.coalesce(hits.c.rank, 0).asc()
+    elif words:
+        conditions.append(Transaction.comment.ilike(f"%{term.strip()}%"))
+
+    if not conditions:
+        return query.filter(false())
+    query = query.filter(or_(*conditions))
+    if by_relevance and rank_order is not None:
+        query = query.order_by(rank_order)
+    return query
@@ -1,6 +1,6 @@
 """Menu slots: calendar view is derived from date range queries."""
 
-from sqlalchemy import Column, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.config import Base
@@ -10,6 +10,7 @@ from app.food.models._constants import MVP_HOUSEHOLD_ID
 
 class FoodMealSlot(Base):
     __tablename__ = "food_meal_slots"
+    __table_args__ = (Index("ix_food_meal_slots_household_id_slot_date", "household_id", "slot_date"),)
 
     id = Column(Integer, primary_key=True, index=True)
     household_id = Column(Integer, nullable=False, default=MVP_HOUSEHOLD_ID, index=True)
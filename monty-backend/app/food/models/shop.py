@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.config import Base
@@ -12,6 +12,9 @@ from app.food.models._constants import MVP_HOUSEHOLD_ID
 
 class FoodShoppingList(Base):
     __tablename__ = "food_shopping_lists"
+    __table_args__ = (
+        Index("ix_food_shopping_lists_household_id_created_at", "household_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     household_id = Column(Integer, nullable=False, default=MVP_HOUSEHOLD_ID, index=True)
@@ -4,7 +4,6 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_db
-from app.finance.models import User
 from app.food.models import FoodDish, FoodDishIngredient, FoodIngredient, FoodUnit, MVP_HOUSEHOLD_ID
 from app.food.schemas import (
     FoodDishIngredientsReplace,
@@ -15,7 +14,8 @@ from app.food.schemas import (
     FoodUnitResponse,
 )
 from app.food.serialization import dish_to_response
-from app.middleware.auth import get_current_user
+from app.food.services import reference_data
+from app.middleware.auth import UserSnapshot, get_current_user
 
 router = APIRouter()
 
@@ -30,34 +30,33 @@ DEFAULT_UNITS = [
 
 
 def _ensure_default_units(db: Session) -> None:
-    if db.query(FoodUnit).count() > 0:
+    if reference_data.units.rows(db):
         return
     for code, name, system in DEFAULT_UNITS:
         db.add(FoodUnit(code=code, name=name, system=system))
     db.commit()
+    reference_data.units.invalidate()
 
 
 def _dish_load_options():
-    return (
-        selectinload(FoodDish.ingredients).selectinload(FoodDishIngredient.ingredient),
-        selectinload(FoodDish.ingredients).selectinload(FoodDishIngredient.unit),
-    )
+    # units are resolved from the reference-data cache by the serializer
+    return (selectinload(FoodDish.ingredients).selectinload(FoodDishIngredient.ingredient),)
 
 
 @router.get("/units", response_model=list[FoodUnitResponse])
 def list_units(
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     _ensure_default_units(db)
-    return db.query(FoodUnit).order_by(FoodUnit.id).all()
+    return reference_data.units.rows(db)
 
 
 @router.get("/ingredients", response_model=list[FoodIngredientResponse])
 def list_ingredients(
     q: str | None = Query(None, max_length=200),
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     _ensure_default_units(db)
     query = db.query(FoodIngredient).filter(FoodIngredient.household_id == MVP_HOUSEHOLD_ID)
@@ -71,11 +70,10 @@ def list_ingredients(
 def create_ingredient(
     body: FoodIngredientCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     _ensure_default_units(db)
-    unit = db.query(FoodUnit).filter(FoodUnit.id == body.default_unit_id).first()
-    if not unit:
+    if not reference_data.units.get(body.default_unit_id, db):
         raise HTTPException(status_code=400, detail="Invalid default_unit_id")
     row = FoodIngredient(
         household_id=MVP_HOUSEHOLD_ID,
@@ -95,7 +93,7 @@ def update_ingredient(
     ingredient_id: int,
     body: FoodIngredientUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodIngredient)
@@ -105,8 +103,7 @@ def update_ingredient(
     if not row:
         raise HTTPException(status_code=404, detail="Ingredient not found")
     if body.default_unit_id is not None:
-        unit = db.query(FoodUnit).filter(FoodUnit.id == body.default_unit_id).first()
-        if not unit:
+        if not reference_data.units.get(body.default_unit_id, db):
             raise HTTPException(status_code=400, detail="Invalid default_unit_id")
         row.default_unit_id = body.default_unit_id
     if body.name is not None:
@@ -124,7 +121,7 @@ def update_ingredient(
 def delete_ingredient(
     ingredient_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodIngredient)
@@ -150,7 +147,7 @@ def replace_dish_ingredients(
     dish_id: int,
     body: FoodDishIngredientsReplace,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     dish = (
         db.query(FoodDish)
@@ -169,8 +166,7 @@ def replace_dish_ingredients(
         )
         if not ing:
             raise HTTPException(status_code=400, detail=f"Invalid ingredient_id: {it.ingredient_id}")
-        unit = db.query(FoodUnit).filter(FoodUnit.id == it.unit_id).first()
-        if not unit:
+        if not reference_data.units.get(it.unit_id, db):
             raise HTTPException(status_code=400, detail=f"Invalid unit_id: {it.unit_id}")
         db.add(
             FoodDishIngredient(
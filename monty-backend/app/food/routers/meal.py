@@ -4,8 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_db
-from app.finance.models import User
-from app.food.models import FoodDish, FoodDishIngredient, FoodIngredient, FoodMealCategory, FoodUnit, MVP_HOUSEHOLD_ID
+from app.food.models import FoodDish, FoodDishIngredient, FoodIngredient, FoodMealCategory, MVP_HOUSEHOLD_ID
 from app.food.schemas import (
     FoodDishCreate,
     FoodDishIngredientItem,
@@ -16,7 +15,8 @@ from app.food.schemas import (
     FoodMealCategoryUpdate,
 )
 from app.food.serialization import dish_to_response
-from app.middleware.auth import get_current_user
+from app.food.services import reference_data
+from app.middleware.auth import UserSnapshot, get_current_user
 
 router = APIRouter()
 
@@ -29,19 +29,17 @@ DEFAULT_CATEGORIES = [
 
 
 def _ensure_default_categories(db: Session) -> None:
-    count = db.query(FoodMealCategory).filter(FoodMealCategory.household_id == MVP_HOUSEHOLD_ID).count()
-    if count > 0:
+    if reference_data.meal_categories.rows(db):
         return
     for name, order in DEFAULT_CATEGORIES:
         db.add(FoodMealCategory(household_id=MVP_HOUSEHOLD_ID, name=name, sort_order=order))
     db.commit()
+    reference_data.meal_categories.invalidate()
 
 
 def _dish_load_options():
-    return (
-        selectinload(FoodDish.ingredients).selectinload(FoodDishIngredient.ingredient),
-        selectinload(FoodDish.ingredients).selectinload(FoodDishIngredient.unit),
-    )
+    # units are resolved from the reference-data cache by the serializer
+    return (selectinload(FoodDish.ingredients).selectinload(FoodDishIngredient.ingredient),)
 
 
 def _validate_and_add_ingredients(
@@ -57,8 +55,7 @@ def _validate_and_add_ingredients(
         )
         if not ing:
             raise HTTPException(status_code=400, detail=f"Invalid ingredient_id: {it.ingredient_id}")
-        unit = db.query(FoodUnit).filter(FoodUnit.id == it.unit_id).first()
-        if not unit:
+        if not reference_data.units.get(it.unit_id, db):
             raise HTTPException(status_code=400, detail=f"Invalid unit_id: {it.unit_id}")
         db.add(
             FoodDishIngredient(
@@ -76,23 +73,17 @@ def _validate_and_add_ingredients(
 @router.get("/meal-categories", response_model=list[FoodMealCategoryResponse])
 def list_meal_categories(
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     _ensure_default_categories(db)
-    rows = (
-        db.query(FoodMealCategory)
-        .filter(FoodMealCategory.household_id == MVP_HOUSEHOLD_ID)
-        .order_by(FoodMealCategory.sort_order, FoodMealCategory.id)
-        .all()
-    )
-    return rows
+    return reference_data.meal_categories.rows(db)
 
 
 @router.post("/meal-categories", response_model=FoodMealCategoryResponse, status_code=status.HTTP_201_CREATED)
 def create_meal_category(
     body: FoodMealCategoryCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = FoodMealCategory(
         household_id=MVP_HOUSEHOLD_ID,
@@ -101,6 +92,7 @@ def create_meal_category(
     )
     db.add(row)
     db.commit()
+    reference_data.meal_categories.invalidate()
     db.refresh(row)
     return row
 
@@ -110,7 +102,7 @@ def update_meal_category(
     category_id: int,
     body: FoodMealCategoryUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodMealCategory)
@@ -127,6 +119,7 @@ def update_meal_category(
     if body.sort_order is not None:
         row.sort_order = body.sort_order
     db.commit()
+    reference_data.meal_categories.invalidate()
     db.refresh(row)
     return row
 
@@ -135,7 +128,7 @@ def update_meal_category(
 def delete_meal_category(
     category_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodMealCategory)
@@ -149,6 +142,7 @@ def delete_meal_category(
         raise HTTPException(status_code=404, detail="Category not found")
     db.delete(row)
     db.commit()
+    reference_data.meal_categories.invalidate()
     return None
 
 
@@ -156,7 +150,7 @@ def delete_meal_category(
 def list_dishes(
     meal_category_id: int | None = None,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     q = (
         db.query(FoodDish)
@@ -173,17 +167,9 @@ def list_dishes(
 def create_dish(
     body: FoodDishCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
-    cat = (
-        db.query(FoodMealCategory)
-        .filter(
-            FoodMealCategory.id == body.meal_category_id,
-            FoodMealCategory.household_id == MVP_HOUSEHOLD_ID,
-        )
-        .first()
-    )
-    if not cat:
+    if not reference_data.meal_categories.get(body.meal_category_id, db):
         raise HTTPException(status_code=400, detail="Invalid meal_category_id")
     row = FoodDish(
         household_id=MVP_HOUSEHOLD_ID,
@@ -215,7 +201,7 @@ def update_dish(
     dish_id: int,
     body: FoodDishUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodDish)
@@ -226,15 +212,7 @@ def update_dish(
     if not row:
         raise HTTPException(status_code=404, detail="Dish not found")
     if body.meal_category_id is not None:
-        cat = (
-            db.query(FoodMealCategory)
-            .filter(
-                FoodMealCategory.id == body.meal_category_id,
-                FoodMealCategory.household_id == MVP_HOUSEHOLD_ID,
-            )
-            .first()
-        )
-        if not cat:
+        if not reference_data.meal_categories.get(body.meal_category_id, db):
             raise HTTPException(status_code=400, detail="Invalid meal_category_id")
         row.meal_category_id = body.meal_category_id
     if body.title is not None:
@@ -265,7 +243,7 @@ def update_dish(
 def delete_dish(
     dish_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodDish)
@@ -4,23 +4,24 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_db
-from app.finance.models import User
-from app.food.models import FoodIngredient, FoodPantryItem, FoodUnit, MVP_HOUSEHOLD_ID
+from app.food.models import FoodIngredient, FoodPantryItem, MVP_HOUSEHOLD_ID
 from app.food.schemas import FoodPantryItemCreate, FoodPantryItemResponse, FoodPantryItemUpdate
 from app.food.serialization_pantry import pantry_item_to_response
-from app.middleware.auth import get_current_user
+from app.food.services import reference_data
+from app.middleware.auth import UserSnapshot, get_current_user
 
 router = APIRouter()
 
 
 def _pantry_options():
-    return selectinload(FoodPantryItem.ingredient), selectinload(FoodPantryItem.unit)
+    # units are resolved from the reference-data cache by the serializer
+    return selectinload(FoodPantryItem.ingredient)
 
 
 @router.get("/pantry", response_model=list[FoodPantryItemResponse])
 def list_pantry(
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     rows = (
         db.query(FoodPantryItem)
@@ -36,7 +37,7 @@ def list_pantry(
 def upsert_pantry_item(
     body: FoodPantryItemCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     ing = (
         db.query(FoodIngredient)
@@ -45,8 +46,7 @@ def upsert_pantry_item(
     )
     if not ing:
         raise HTTPException(status_code=400, detail="Invalid ingredient_id")
-    unit = db.query(FoodUnit).filter(FoodUnit.id == body.unit_id).first()
-    if not unit:
+    if not reference_data.units.get(body.unit_id, db):
         raise HTTPException(status_code=400, detail="Invalid unit_id")
 
     existing = (
@@ -91,7 +91,7 @@ def update_pantry_item(
     item_id: int,
     body: FoodPantryItemUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodPantryItem)
@@ -103,8 +103,7 @@ def update_pantry_item(
     if body.quantity is not None:
         row.quantity = Decimal(str(body.quantity))
     if body.unit_id is not None:
-        u = db.query(FoodUnit).filter(FoodUnit.id == body.unit_id).first()
-        if not u:
+        if not reference_data.units.get(body.unit_id, db):
             raise HTTPException(status_code=400, detail="Invalid unit_id")
         row.unit_id = body.unit_id
     if body.note is not None:
@@ -118,7 +117,7 @@ def update_pantry_item(
 def delete_pantry_item(
     item_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodPantryItem)
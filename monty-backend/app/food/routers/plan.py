@@ -4,11 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_db
-from app.finance.models import User
 from app.food.models import FoodDish, FoodMealSlot, MVP_HOUSEHOLD_ID
 from app.food.schemas import FoodMealSlotCreate, FoodMealSlotResponse, FoodMealSlotUpdate
 from app.food.serialization import slot_to_response
-from app.middleware.auth import get_current_user
+from app.middleware.auth import UserSnapshot, get_current_user
 
 router = APIRouter()
 
@@ -24,7 +23,7 @@ def list_menu_slots(
     date_from: date = Query(..., alias="from"),
     date_to: date = Query(..., alias="to"),
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     if date_to < date_from:
         raise HTTPException(status_code=400, detail="Invalid date range")
@@ -46,7 +45,7 @@ def list_menu_slots(
 def create_menu_slot(
     body: FoodMealSlotCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     if body.slot_key not in ALLOWED_SLOT_KEYS:
         raise HTTPException(status_code=400, detail="Invalid slot_key")
@@ -79,7 +78,7 @@ def update_menu_slot(
     slot_id: int,
     body: FoodMealSlotUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodMealSlot)
@@ -122,7 +121,7 @@ def update_menu_slot(
 def delete_menu_slot(
     slot_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodMealSlot)
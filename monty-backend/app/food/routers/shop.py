@@ -5,7 +5,6 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_db
-from app.finance.models import User
 from app.food.models import FoodShoppingItem, FoodShoppingList, MVP_HOUSEHOLD_ID
 from app.food.schemas import (
     FoodShoppingGenerateBody,
@@ -15,19 +14,20 @@ from app.food.schemas import (
 )
 from app.food.serialization_shop import shopping_list_to_response
 from app.food.services.shopping_generator import generate_shopping_list_from_menu
-from app.middleware.auth import get_current_user
+from app.middleware.auth import UserSnapshot, get_current_user
 
 router = APIRouter()
 
 
 def _list_options():
-    return selectinload(FoodShoppingList.items).selectinload(FoodShoppingItem.unit)
+    # item units are resolved from the reference-data cache by the serializer
+    return selectinload(FoodShoppingList.items)
 
 
 @router.get("/shopping-lists/latest", response_model=FoodShoppingListResponse)
 def get_latest_shopping_list(
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     row = (
         db.query(FoodShoppingList)
@@ -45,7 +45,7 @@ def get_latest_shopping_list(
 def generate_shopping_list(
     body: FoodShoppingGenerateBody,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     if body.date_to < body.date_from:
         raise HTTPException(status_code=400, detail="Invalid date range")
@@ -73,7 +73,7 @@ def add_shopping_item(
     list_id: int,
     body: FoodShoppingItemCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     lst = (
         db.query(FoodShoppingList)
@@ -109,7 +109,7 @@ def patch_shopping_item(
     item_id: int,
     body: FoodShoppingItemPatch,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: UserSnapshot = Depends(get_current_user),
 ):
     it = (
         db.query(FoodShoppingItem)
@@ -4,6 +4,7 @@ from app.food.models.plan import FoodMealSlot
 from app.food.schemas.catalog import FoodDishIngredientLineResponse
 from app.food.schemas.meal import FoodDishResponse
 from app.food.schemas.plan import FoodMealSlotResponse
+from app.food.services import reference_data
 
 
 def dish_to_response(d: FoodDish) -> FoodDishResponse:
@@ -11,7 +12,7 @@ def dish_to_response(d: FoodDish) -> FoodDishResponse:
     raw_lines: list[FoodDishIngredient] = list(d.ingredients) if d.ingredients else []
     for line in sorted(raw_lines, key=lambda x: (x.sort_order, x.id)):
         ing = line.ingredient
-        unit = line.unit
+        unit = reference_data.units.get(line.unit_id)
         lines.append(
             FoodDishIngredientLineResponse(
                 id=line.id,
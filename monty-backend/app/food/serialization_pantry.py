@@ -1,10 +1,11 @@
 from app.food.models.pantry import FoodPantryItem
 from app.food.schemas.pantry import FoodPantryItemResponse
+from app.food.services import reference_data
 
 
 def pantry_item_to_response(row: FoodPantryItem) -> FoodPantryItemResponse:
     ing = row.ingredient
-    unit = row.unit
+    unit = reference_data.units.get(row.unit_id)
     return FoodPantryItemResponse(
         id=row.id,
         household_id=row.household_id,
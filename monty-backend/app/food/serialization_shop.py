@@ -1,15 +1,17 @@
 from app.food.models.shop import FoodShoppingItem, FoodShoppingList
 from app.food.schemas.shop import FoodShoppingItemResponse, FoodShoppingListResponse
+from app.food.services import reference_data
 
 
 def shopping_item_to_response(it: FoodShoppingItem) -> FoodShoppingItemResponse:
+    unit = reference_data.units.get(it.unit_id)
     return FoodShoppingItemResponse(
         id=it.id,
         ingredient_id=it.ingredient_id,
         label=it.label,
         quantity=float(it.quantity) if it.quantity is not None else None,
         unit_id=it.unit_id,
-        unit_code=it.unit.code if it.unit else None,
+        unit_code=unit.code if unit else None,
         checked=bool(it.checked),
         sort_order=it.sort_order,
     )
@@ -0,0 +1,16 @@
+"""Food reference tables cached in process (see ``app.core.reference_data``)."""
+
+from app.core.reference_data import ReferenceTable
+from app.food.models import FoodMealCategory, FoodUnit, MVP_HOUSEHOLD_ID
+
+# invalidated after the default units are seeded (units have no CRUD endpoints)
+units = ReferenceTable("food_units", lambda db: db.query(FoodUnit).order_by(FoodUnit.id).all())
+
+# invalidated by the /food/meal-categories endpoints
+meal_categories = ReferenceTable(
+    "food_meal_categories",
+    lambda db: db.query(FoodMealCategory)
+    .filter(FoodMealCategory.household_id == MVP_HOUSEHOLD_ID)
+    .order_by(FoodMealCategory.sort_order, FoodMealCategory.id)
+    .all(),
+)
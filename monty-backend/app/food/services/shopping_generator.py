@@ -25,9 +25,6 @@ def generate_shopping_list_from_menu(
             selectinload(FoodMealSlot.dish)
             .selectinload(FoodDish.ingredients)
             .selectinload(FoodDishIngredient.ingredient),
-            selectinload(FoodMealSlot.dish)
-            .selectinload(FoodDish.ingredients)
-            .selectinload(FoodDishIngredient.unit),
         )
         .filter(
             FoodMealSlot.household_id == household_id,
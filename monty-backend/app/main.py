@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 
-from app.core.config import Base, engine
+from app.core.migrations import ensure_schema_current
 from app.finance.routers import (
     analytics,
     auth,
@@ -12,7 +12,6 @@ from app.finance.routers import (
     transactions,
 )
 from app.finance.services.scheduler import scheduler, setup_scheduler
-from app.food.db_bootstrap import ensure_food_dish_columns
 from app.food.router import router as food_router
 import app.models  # noqa: F401 — register all ORM tables on Base.metadata
 from fastapi import FastAPI
@@ -21,8 +20,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
-    ensure_food_dish_columns()
+    ensure_schema_current()
 
     setup_scheduler()
     scheduler.start()
@@ -45,6 +43,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Idempotent-Replayed"],
 )
 
 app.include_router(auth.router)
@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_db
 from app.finance.models import User
+from app.finance.services import auth_cache
+from app.finance.services.auth_cache import UserSnapshot
 from app.finance.services.auth_service import verify_token
 
 security = HTTPBearer()
@@ -11,16 +13,23 @@ security = HTTPBearer()
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> UserSnapshot:
+    """
+    The caller as a ``UserSnapshot`` (id, telegram_id, first_name, is_active). Claims and
+    snapshots come from ``auth_cache``, so a warm request does not touch the database.
+    """
     token = credentials.credentials
     
-    payload = verify_token(token)
+    payload = auth_cache.get_claims(token)
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        payload = verify_token(token)
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        auth_cache.put_claims(token, payload)
     
     user_id = payload.get("sub")
     if user_id is None:
@@ -30,13 +39,16 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = auth_cache.get_user(int(user_id))
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        row = db.query(User).filter(User.id == int(user_id)).first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user = auth_cache.put_user(row)
     
     if not user.is_active:
         raise HTTPException(
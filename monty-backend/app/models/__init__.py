@@ -9,10 +9,18 @@ from app.food import models as _food_models  # noqa: F401
 
 from app.finance.models import (
     Category,
+    CategoryBudgetLimit,
+    CategoryBalance,
+    CategoryPurge,
     CategoryGroup,
+    FinancialPeriod,
+    IdempotencyKey,
     MonthlyBudget,
+    NotificationOutbox,
     Settings,
     Transaction,
+    TransactionDailyRollup,
+    TransactionTombstone,
     TransactionType,
     User,
 )
@@ -33,7 +41,15 @@ __all__ = [
     "User",
     "Category",
     "MonthlyBudget",
+    "CategoryBudgetLimit",
+    "CategoryBalance",
+    "CategoryPurge",
+    "IdempotencyKey",
+    "NotificationOutbox",
     "Transaction",
+    "TransactionDailyRollup",
+    "FinancialPeriod",
+    "TransactionTombstone",
     "Settings",
     "CategoryGroup",
     "TransactionType",
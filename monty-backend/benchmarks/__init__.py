@@ -0,0 +1 @@
+"""Performance benchmarks for the finance API (see ``benchmarks/run.py``)."""
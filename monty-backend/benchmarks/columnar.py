@@ -0,0 +1,116 @@
+"""
+Columnar (NumPy) analytics vs. the per-ORM-object loops it replaces, on one long window.
+
+    python -m benchmarks.columnar --size 1000000 --repeat 3
+
+The ORM side loads ``Transaction`` objects with their category and user and folds them
+in Python, as ``/analytics`` used to; the columnar side is ``columnar_analytics``.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from app.core.migrations import upgrade_to_head
+from app.finance.models import CategoryGroup, Transaction, TransactionType
+from app.finance.services import columnar_analytics
+from app.finance.services.analytics_helpers import large_one_off_expense_total
+from app.finance.services.budget_period_service import date_range_to_datetimes
+from benchmarks.seed import seed_database
+
+
+def orm_loop_analytics(db, start, end) -> dict:
+    transactions = (
+        db.query(Transaction)
+        .options(joinedload(Transaction.category), joinedload(Transaction.user))
+        .filter(Transaction.transaction_date >= start, Transaction.transaction_date <= end)
+        .all()
+    )
+    totals = {"income": 0, "expense": 0, "savings": 0}
+    by_category: dict[str, dict] = {}
+    by_user: dict[int, dict] = {}
+    daily: dict[str, dict] = {}
+    expense_amounts = []
+    for t in transactions:
+        if t.category.type == TransactionType.INCOME:
+            kind = "income"
+        elif t.category.group == CategoryGroup.SAVINGS:
+            kind = "savings"
+        else:
+            kind = "expense"
+            expense_amounts.append(t.amount)
+        totals[kind] += t.amount
+        by_category.setdefault(t.category.name, {"income": 0, "expense": 0, "savings": 0})[kind] += t.amount
+        by_user.setdefault(t.user_id, {"income": 0, "expense": 0, "savings": 0})[kind] += t.amount
+        day = daily.setdefault(t.transaction_date.date().isoformat(), {"income": 0, "expense": 0})
+        if kind != "savings":
+            day[kind] += t.amount
+    return {
+        "total_income": totals["income"],
+        "total_expenses": totals["expense"],
+        "large_one_off": large_one_off_expense_total(expense_amounts),
+        "days": len(daily),
+    }
+
+
+def columnar_analytics_pass(db, start, end) -> dict:
+    columns = columnar_analytics.load_window(db, start, end)
+    summary = columnar_analytics.summarize(columns)
+    days = columnar_analytics.series(columns)
+    return {
+        "total_income": summary["total_income"],
+        "total_expenses": summary["total_expenses"],
+        "large_one_off": columnar_analytics.large_one_off_total(columnar_analytics.expense_amounts(columns)),
+        "days": len(days),
+    }
+
+
+def _best_of(fn, repeat: int) -> tuple[float, dict]:
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="monty-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    db_path = workdir / f"columnar_{args.size}.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    if not db_path.exists():
+        upgrade_to_head(engine)
+        with sessionmaker(bind=engine)() as db:
+            print(f"[bench] seeding {args.size} transactions into {db_path}")
+            seed_database(db, args.size, seed=args.seed)
+
+    end_d = date.today()
+    start, end = date_range_to_datetimes(end_d - timedelta(days=730), end_d)
+    with sessionmaker(bind=engine)() as db:
+        orm_ms, orm_result = _best_of(lambda: orm_loop_analytics(db, start, end), args.repeat)
+        db.expunge_all()
+        numpy_ms, numpy_result = _best_of(lambda: columnar_analytics_pass(db, start, end), args.repeat)
+
+    if orm_result != numpy_result:
+        raise SystemExit(f"[bench] results differ: {orm_result} vs {numpy_result}")
+    print(f"[bench] ORM loops  p50 {orm_ms:>10.1f} ms")
+    print(f"[bench] columnar   p50 {numpy_ms:>10.1f} ms  x{orm_ms / numpy_ms:.1f}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare two benchmark result files endpoint by endpoint.
+
+    python -m benchmarks.compare benchmarks/results/before.json benchmarks/results/after.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def _load(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    parser.add_argument("--mode", choices=("cold", "warm"), default="cold")
+    args = parser.parse_args(argv)
+
+    before, after = _load(args.before), _load(args.after)
+    print(f"before: {before.get('git_revision') or args.before.name}  after: {after.get('git_revision') or args.after.name}")
+    for size, after_size in after["sizes"].items():
+        before_size = before["sizes"].get(size)
+        if before_size is None:
+            continue
+        print(f"\n{size} transactions ({args.mode} p50)")
+        for name, a in after_size["endpoints"].items():
+            b = before_size["endpoints"].get(name)
+            if b is None:
+                continue
+            b_ms, a_ms = b[args.mode]["p50_ms"], a[args.mode]["p50_ms"]
+            speedup = b_ms / a_ms if a_ms else float("inf")
+            print(
+                f"  {name:<26} {b_ms:>10.2f} -> {a_ms:>10.2f} ms  x{speedup:<6.2f}"
+                f"  sql {b['sql_statements']} -> {a['sql_statements']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
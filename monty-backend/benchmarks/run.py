@@ -0,0 +1,191 @@
+"""
+Time finance endpoints against seeded SQLite databases and record latency + SQL statement counts.
+
+    python -m benchmarks.run --sizes 10000 100000 1000000 --repeat 5
+
+Each size gets a fresh SQLite file; results are written as JSON (see ``benchmarks/compare.py``).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+
+from app.core.config import SessionLocal, get_db
+from app.core.migrations import upgrade_to_head
+from app.finance.services.analytics_cache import bump_data_version
+from app.finance.services.auth_service import create_access_token
+from app.main import app as fastapi_app
+from benchmarks.seed import seed_database
+
+DEFAULT_SIZES = (10_000, 100_000)
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def _endpoints() -> list[tuple[str, str, dict]]:
+    today = date.today()
+    return [
+        ("analytics_12m", "/analytics", {"months": 12}),
+        (
+            "analytics_period_90d",
+            "/analytics/period",
+            {"start_date": (today - timedelta(days=90)).isoformat(), "end_date": today.isoformat()},
+        ),
+        (
+            "analytics_730d_numpy",
+            "/analytics/period",
+            {
+                "start_date": (today - timedelta(days=730)).isoformat(),
+                "end_date": today.isoformat(),
+                "engine": "numpy",
+            },
+        ),
+        ("budgets_current", "/budgets/current", {}),
+        ("goals", "/goals", {}),
+        ("transactions", "/transactions", {}),
+        ("transactions_export_csv", "/transactions/export/csv", {}),
+    ]
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def _summary(samples_ms: list[float]) -> dict:
+    ordered = sorted(samples_ms)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[p95_index], 3),
+        "min_ms": round(ordered[0], 3),
+    }
+
+
+def _timed_get(client: TestClient, path: str, params: dict, headers: dict) -> float:
+    started = time.perf_counter()
+    response = client.get(path, params=params, headers=headers)
+    _ = response.content
+    elapsed = (time.perf_counter() - started) * 1000
+    if response.status_code != 200:
+        raise RuntimeError(f"{path} -> {response.status_code}: {response.text[:200]}")
+    return elapsed
+
+
+def bench_size(n_transactions: int, repeat: int, seed: int, workdir: Path) -> dict:
+    db_path = workdir / f"bench_{n_transactions}.db"
+    if db_path.exists():
+        db_path.unlink()
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    upgrade_to_head(engine)
+    SessionLocal.configure(bind=engine)
+
+    def _get_bench_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    fastapi_app.dependency_overrides[get_db] = _get_bench_db
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    seeded = seed_database(db, n_transactions, seed=seed)
+    seed_seconds = time.perf_counter() - started
+    db.close()
+
+    counter = StatementCounter(engine)
+    client = TestClient(fastapi_app)
+    token = create_access_token({"sub": str(seeded["user_ids"][0])})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    endpoints: dict[str, dict] = {}
+    for name, path, params in _endpoints():
+        bump_data_version()
+        counter.count = 0
+        _timed_get(client, path, params, headers)
+        statements = counter.count
+
+        cold = []
+        for _ in range(repeat):
+            bump_data_version()
+            cold.append(_timed_get(client, path, params, headers))
+        warm = [_timed_get(client, path, params, headers) for _ in range(repeat)]
+
+        endpoints[name] = {
+            "path": path,
+            "params": params,
+            "sql_statements": statements,
+            "cold": _summary(cold),
+            "warm": _summary(warm),
+        }
+        print(
+            f"  {name:<26} cold p50 {endpoints[name]['cold']['p50_ms']:>10.2f} ms"
+            f"  warm p50 {endpoints[name]['warm']['p50_ms']:>10.2f} ms  sql {statements}"
+        )
+
+    fastapi_app.dependency_overrides.pop(get_db, None)
+    engine.dispose()
+    return {"seed_seconds": round(seed_seconds, 2), "endpoints": endpoints}
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main(argv: list[str] | None = None) -> Path:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, default=None, help="JSON output path")
+    parser.add_argument("--workdir", type=Path, default=None, help="where SQLite files are created")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="monty-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = {
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "sizes": {},
+    }
+    for size in args.sizes:
+        print(f"[bench] {size} transactions")
+        results["sizes"][str(size)] = bench_size(size, args.repeat, args.seed, workdir)
+
+    out = args.out or RESULTS_DIR / f"bench_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+    print(f"[bench] results written to {os.path.relpath(out)}")
+    return out
+
+
+if __name__ == "__main__":
+    main()
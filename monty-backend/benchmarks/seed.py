@@ -0,0 +1,90 @@
+"""Seeded synthetic household data: users, categories, budgets, settings and transactions."""
+
+import random
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.finance.models import (
+    Category,
+    CategoryBudgetLimit,
+    CategoryGroup,
+    MonthlyBudget,
+    Settings,
+    Transaction,
+    TransactionType,
+    User,
+)
+from app.finance.services.rollup_service import rebuild_daily_rollups
+
+CATEGORIES = [
+    ("Продукты", CategoryGroup.BASE, TransactionType.EXPENSE, "🛒", 150_000),
+    ("Аренда", CategoryGroup.BASE, TransactionType.EXPENSE, "🏠", 250_000),
+    ("Транспорт", CategoryGroup.BASE, TransactionType.EXPENSE, "🚕", 40_000),
+    ("Связь", CategoryGroup.BASE, TransactionType.EXPENSE, "📱", 10_000),
+    ("Кафе", CategoryGroup.COMFORT, TransactionType.EXPENSE, "☕", 60_000),
+    ("Развлечения", CategoryGroup.COMFORT, TransactionType.EXPENSE, "🎬", 40_000),
+    ("Одежда", CategoryGroup.COMFORT, TransactionType.EXPENSE, "👕", 50_000),
+    ("Подарки", CategoryGroup.COMFORT, TransactionType.EXPENSE, "🎁", 30_000),
+    ("Депозит", CategoryGroup.SAVINGS, TransactionType.EXPENSE, "💰", 200_000),
+    ("Зарплата", CategoryGroup.INCOME, TransactionType.INCOME, "💵", 0),
+    ("Фриланс", CategoryGroup.INCOME, TransactionType.INCOME, "💻", 0),
+]
+
+COMMENTS = [None, None, "такси домой", "обед", "кофе", "магазин у дома", "подписка", "ужин с друзьями"]
+
+INSERT_CHUNK = 10_000
+
+
+def seed_database(db: Session, n_transactions: int, seed: int = 42, days: int = 730) -> dict:
+    """Fill an empty database; returns ids of the seeded reference rows."""
+    rnd = random.Random(seed)
+
+    users = [User(telegram_id=1000 + i, first_name=name) for i, name in enumerate(("Бекжан", "Енлик"))]
+    db.add_all(users)
+    categories = [Category(name=n, group=g, type=t, icon=i) for n, g, t, i, _ in CATEGORIES]
+    db.add_all(categories)
+    db.flush()
+
+    for category, (_, _, _, _, limit) in zip(categories, CATEGORIES):
+        db.add(MonthlyBudget(category_id=category.id, period=date(2024, 1, 1), limit_amount=limit))
+        db.add(CategoryBudgetLimit(category_id=category.id, limit_amount=limit))
+    for key, value in (
+        ("salary_day", "10"),
+        ("target_amount", "1500000"),
+        ("target_date", (date.today() + timedelta(days=365)).isoformat()),
+        ("total_budget", "800000"),
+    ):
+        db.add(Settings(key=key, value=value))
+    db.commit()
+
+    user_ids = [u.id for u in users]
+    expense_ids = [c.id for c in categories if c.type == TransactionType.EXPENSE]
+    income_ids = [c.id for c in categories if c.type == TransactionType.INCOME]
+    now = datetime.utcnow()
+    table = Transaction.__table__
+
+    remaining = n_transactions
+    while remaining > 0:
+        chunk = min(INSERT_CHUNK, remaining)
+        rows = []
+        for _ in range(chunk):
+            is_income = rnd.random() < 0.05
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": rnd.choice(user_ids),
+                    "category_id": rnd.choice(income_ids if is_income else expense_ids),
+                    "amount": rnd.randint(200_000, 600_000) if is_income else int(rnd.lognormvariate(8.5, 1.0)) + 100,
+                    "transaction_date": now - timedelta(seconds=rnd.randint(0, days * 86_400)),
+                    "comment": rnd.choice(COMMENTS),
+                }
+            )
+        db.execute(insert(table), rows)
+        remaining -= chunk
+    db.commit()
+
+    rebuild_daily_rollups(db)
+    return {"user_ids": user_ids, "category_ids": [c.id for c in categories]}
@@ -0,0 +1,61 @@
+"""Alembic environment: runs against the app engine (or a connection passed in by the caller)."""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+import app.models  # noqa: F401 — register all ORM tables on Base.metadata
+from app.core.config import Base, engine
+from app.finance.services.transaction_search import FTS_TABLE, SEARCH_SCHEMA_OBJECTS
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def _include_object(obj, name, type_, reflected, compare_to) -> bool:
+    # search column / index / FTS5 tables are created by raw DDL in 0005, not by the models
+    if reflected and compare_to is None:
+        return name not in SEARCH_SCHEMA_OBJECTS and not (name or "").startswith(FTS_TABLE)
+    return True
+
+
+def _configure(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+        compare_type=True,
+        include_object=_include_object,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    bind = config.attributes.get("connection")
+    if bind is not None:
+        _configure(bind)
+        return
+    with engine.connect() as connection:
+        _configure(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,322 @@
+"""baseline schema
+
+Creates every table the app had before migrations were introduced. Databases that
+were bootstrapped with ``create_all`` keep their existing tables; this revision only
+fills in what is missing (tables, the v2 ``food_dishes`` columns, the daily rollups)
+and then gets stamped.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+category_group = sa.Enum("BASE", "COMFORT", "SAVINGS", "INCOME", name="categorygroup")
+transaction_type = sa.Enum("EXPENSE", "INCOME", name="transactiontype")
+
+
+def _create_finance_tables(existing: set[str]) -> None:
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("telegram_id", sa.BigInteger(), nullable=False),
+            sa.Column("first_name", sa.String(length=100), nullable=False),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_telegram_id", "users", ["telegram_id"], unique=True)
+
+    if "categories" not in existing:
+        op.create_table(
+            "categories",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(length=50), nullable=False),
+            sa.Column("group", category_group, nullable=False),
+            sa.Column("type", transaction_type, nullable=False),
+            sa.Column("icon", sa.String(length=10), nullable=False),
+        )
+        op.create_index("ix_categories_id", "categories", ["id"])
+
+    if "monthly_budgets" not in existing:
+        op.create_table(
+            "monthly_budgets",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+            sa.Column("period", sa.Date(), nullable=False),
+            sa.Column("limit_amount", sa.Integer(), nullable=False),
+        )
+        op.create_index("ix_monthly_budgets_id", "monthly_budgets", ["id"])
+
+    if "transactions" not in existing:
+        op.create_table(
+            "transactions",
+            sa.Column("id", sa.String(length=36), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+            sa.Column("amount", sa.Integer(), nullable=False),
+            sa.Column("transaction_date", sa.DateTime(), nullable=True),
+            sa.Column("comment", sa.String(length=255), nullable=True),
+        )
+
+    if "transaction_daily_rollups" not in existing:
+        op.create_table(
+            "transaction_daily_rollups",
+            sa.Column("day", sa.Date(), primary_key=True),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("total_amount", sa.BigInteger(), nullable=False),
+            sa.Column("tx_count", sa.Integer(), nullable=False),
+        )
+        if "transactions" in existing:
+            op.execute(
+                "INSERT INTO transaction_daily_rollups (day, category_id, user_id, total_amount, tx_count) "
+                "SELECT date(transaction_date), category_id, user_id, SUM(amount), COUNT(id) "
+                "FROM transactions WHERE transaction_date IS NOT NULL "
+                "GROUP BY date(transaction_date), category_id, user_id"
+            )
+
+    if "settings" not in existing:
+        op.create_table(
+            "settings",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("key", sa.String(length=50), nullable=False, unique=True),
+            sa.Column("value", sa.String(length=255), nullable=False),
+        )
+        op.create_index("ix_settings_id", "settings", ["id"])
+
+
+def _create_food_tables(existing: set[str]) -> None:
+    if "food_meal_categories" not in existing:
+        op.create_table(
+            "food_meal_categories",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("household_id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("sort_order", sa.Integer(), nullable=False),
+        )
+        op.create_index("ix_food_meal_categories_id", "food_meal_categories", ["id"])
+        op.create_index("ix_food_meal_categories_household_id", "food_meal_categories", ["household_id"])
+
+    if "food_dishes" not in existing:
+        op.create_table(
+            "food_dishes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("household_id", sa.Integer(), nullable=False),
+            sa.Column(
+                "meal_category_id", sa.Integer(), sa.ForeignKey("food_meal_categories.id"), nullable=False
+            ),
+            sa.Column("title", sa.String(length=200), nullable=False),
+            sa.Column("recipe_text", sa.Text(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("servings_default", sa.Integer(), nullable=False),
+            sa.Column("prep_minutes", sa.Integer(), nullable=True),
+            sa.Column("cook_minutes", sa.Integer(), nullable=True),
+            sa.Column("is_archived", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_food_dishes_id", "food_dishes", ["id"])
+        op.create_index("ix_food_dishes_household_id", "food_dishes", ["household_id"])
+    else:
+        _add_food_dish_v2_columns()
+
+    if "food_units" not in existing:
+        op.create_table(
+            "food_units",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("code", sa.String(length=32), nullable=False),
+            sa.Column("name", sa.String(length=80), nullable=False),
+            sa.Column("system", sa.String(length=20), nullable=False),
+        )
+        op.create_index("ix_food_units_id", "food_units", ["id"])
+        op.create_index("ix_food_units_code", "food_units", ["code"], unique=True)
+
+    if "food_ingredients" not in existing:
+        op.create_table(
+            "food_ingredients",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("household_id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=200), nullable=False),
+            sa.Column("default_unit_id", sa.Integer(), sa.ForeignKey("food_units.id"), nullable=False),
+            sa.Column("category", sa.String(length=64), nullable=True),
+            sa.Column("notes", sa.String(length=500), nullable=True),
+        )
+        op.create_index("ix_food_ingredients_id", "food_ingredients", ["id"])
+        op.create_index("ix_food_ingredients_household_id", "food_ingredients", ["household_id"])
+
+    if "food_dish_ingredients" not in existing:
+        op.create_table(
+            "food_dish_ingredients",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "dish_id",
+                sa.Integer(),
+                sa.ForeignKey("food_dishes.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column(
+                "ingredient_id",
+                sa.Integer(),
+                sa.ForeignKey("food_ingredients.id", ondelete="RESTRICT"),
+                nullable=False,
+            ),
+            sa.Column("quantity", sa.Numeric(12, 4), nullable=False),
+            sa.Column("unit_id", sa.Integer(), sa.ForeignKey("food_units.id"), nullable=False),
+            sa.Column("is_optional", sa.Boolean(), nullable=False),
+            sa.Column("note", sa.String(length=500), nullable=True),
+            sa.Column("sort_order", sa.Integer(), nullable=False),
+        )
+        op.create_index("ix_food_dish_ingredients_id", "food_dish_ingredients", ["id"])
+        op.create_index("ix_food_dish_ingredients_dish_id", "food_dish_ingredients", ["dish_id"])
+
+    if "food_meal_slots" not in existing:
+        op.create_table(
+            "food_meal_slots",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("household_id", sa.Integer(), nullable=False),
+            sa.Column("slot_date", sa.Date(), nullable=False),
+            sa.Column("slot_key", sa.String(length=32), nullable=False),
+            sa.Column(
+                "dish_id",
+                sa.Integer(),
+                sa.ForeignKey("food_dishes.id", ondelete="SET NULL"),
+                nullable=True,
+            ),
+            sa.Column("custom_title", sa.String(length=200), nullable=True),
+            sa.Column("servings", sa.Integer(), nullable=False),
+            sa.Column("notes", sa.Text(), nullable=True),
+        )
+        op.create_index("ix_food_meal_slots_id", "food_meal_slots", ["id"])
+        op.create_index("ix_food_meal_slots_household_id", "food_meal_slots", ["household_id"])
+        op.create_index("ix_food_meal_slots_slot_date", "food_meal_slots", ["slot_date"])
+        op.create_index("ix_food_meal_slots_slot_key", "food_meal_slots", ["slot_key"])
+
+    if "food_shopping_lists" not in existing:
+        op.create_table(
+            "food_shopping_lists",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("household_id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(length=200), nullable=False),
+            sa.Column("period_start", sa.Date(), nullable=True),
+            sa.Column("period_end", sa.Date(), nullable=True),
+            sa.Column("status", sa.String(length=20), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_food_shopping_lists_id", "food_shopping_lists", ["id"])
+        op.create_index("ix_food_shopping_lists_household_id", "food_shopping_lists", ["household_id"])
+
+    if "food_shopping_items" not in existing:
+        op.create_table(
+            "food_shopping_items",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "list_id",
+                sa.Integer(),
+                sa.ForeignKey("food_shopping_lists.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column(
+                "ingredient_id",
+                sa.Integer(),
+                sa.ForeignKey("food_ingredients.id", ondelete="SET NULL"),
+                nullable=True,
+            ),
+            sa.Column("label", sa.String(length=200), nullable=False),
+            sa.Column("quantity", sa.Numeric(12, 4), nullable=True),
+            sa.Column("unit_id", sa.Integer(), sa.ForeignKey("food_units.id"), nullable=True),
+            sa.Column("checked", sa.Boolean(), nullable=False),
+            sa.Column("sort_order", sa.Integer(), nullable=False),
+            sa.Column("note", sa.Text(), nullable=True),
+        )
+        op.create_index("ix_food_shopping_items_id", "food_shopping_items", ["id"])
+        op.create_index("ix_food_shopping_items_list_id", "food_shopping_items", ["list_id"])
+
+    if "food_pantry_items" not in existing:
+        op.create_table(
+            "food_pantry_items",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("household_id", sa.Integer(), nullable=False),
+            sa.Column(
+                "ingredient_id",
+                sa.Integer(),
+                sa.ForeignKey("food_ingredients.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("quantity", sa.Numeric(12, 4), nullable=False),
+            sa.Column("unit_id", sa.Integer(), sa.ForeignKey("food_units.id"), nullable=False),
+            sa.Column("note", sa.String(length=500), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.UniqueConstraint("household_id", "ingredient_id", name="uq_food_pantry_household_ingredient"),
+        )
+        op.create_index("ix_food_pantry_items_id", "food_pantry_items", ["id"])
+        op.create_index("ix_food_pantry_items_household_id", "food_pantry_items", ["household_id"])
+        op.create_index("ix_food_pantry_items_ingredient_id", "food_pantry_items", ["ingredient_id"])
+
+
+def _add_food_dish_v2_columns() -> None:
+    """Columns that older ``create_all`` databases may lack (formerly ``db_bootstrap``)."""
+    bind = op.get_bind()
+    existing = {c["name"] for c in sa.inspect(bind).get_columns("food_dishes")}
+    sqlite = bind.dialect.name == "sqlite"
+
+    if "description" not in existing:
+        op.execute("ALTER TABLE food_dishes ADD COLUMN description TEXT")
+    if "servings_default" not in existing:
+        op.execute("ALTER TABLE food_dishes ADD COLUMN servings_default INTEGER NOT NULL DEFAULT 4")
+    if "prep_minutes" not in existing:
+        op.execute("ALTER TABLE food_dishes ADD COLUMN prep_minutes INTEGER")
+    if "cook_minutes" not in existing:
+        op.execute("ALTER TABLE food_dishes ADD COLUMN cook_minutes INTEGER")
+    if "is_archived" not in existing:
+        if sqlite:
+            op.execute("ALTER TABLE food_dishes ADD COLUMN is_archived INTEGER NOT NULL DEFAULT 0")
+        else:
+            op.execute("ALTER TABLE food_dishes ADD COLUMN is_archived BOOLEAN NOT NULL DEFAULT FALSE")
+    if "updated_at" not in existing:
+        if sqlite:
+            op.execute("ALTER TABLE food_dishes ADD COLUMN updated_at DATETIME")
+        else:
+            op.execute("ALTER TABLE food_dishes ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE")
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    _create_finance_tables(existing)
+    _create_food_tables(existing)
+
+
+def downgrade() -> None:
+    for table in (
+        "food_pantry_items",
+        "food_shopping_items",
+        "food_shopping_lists",
+        "food_meal_slots",
+        "food_dish_ingredients",
+        "food_ingredients",
+        "food_units",
+        "food_dishes",
+        "food_meal_categories",
+        "settings",
+        "transaction_daily_rollups",
+        "transactions",
+        "monthly_budgets",
+        "categories",
+        "users",
+    ):
+        op.drop_table(table)
+    bind = op.get_bind()
+    transaction_type.drop(bind, checkfirst=True)
+    category_group.drop(bind, checkfirst=True)
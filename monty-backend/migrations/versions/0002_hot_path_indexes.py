@@ -0,0 +1,43 @@
+"""hot-path indexes for transactions and food lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_transactions_transaction_date", "transactions", ["transaction_date"])
+    op.create_index(
+        "ix_transactions_category_id_transaction_date",
+        "transactions",
+        ["category_id", "transaction_date"],
+    )
+    op.create_index(
+        "ix_food_meal_slots_household_id_slot_date",
+        "food_meal_slots",
+        ["household_id", "slot_date"],
+    )
+    op.create_index(
+        "ix_food_shopping_lists_household_id_created_at",
+        "food_shopping_lists",
+        ["household_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_food_shopping_lists_household_id_created_at", table_name="food_shopping_lists")
+    op.drop_index("ix_food_meal_slots_household_id_slot_date", table_name="food_meal_slots")
+    op.drop_index("ix_transactions_category_id_transaction_date", table_name="transactions")
+    op.drop_index("ix_transactions_transaction_date", table_name="transactions")
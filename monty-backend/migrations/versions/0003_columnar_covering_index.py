@@ -0,0 +1,29 @@
+"""covering index for the columnar analytics window fetch
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_transaction_date_columnar",
+        "transactions",
+        ["transaction_date", "category_id", "user_id", "amount"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_transaction_date_columnar", table_name="transactions")
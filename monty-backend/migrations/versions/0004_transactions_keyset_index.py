@@ -0,0 +1,33 @@
+"""keyset index on transactions (transaction_date, id)
+
+Replaces the single-column transaction_date index, which is a prefix of it.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_transaction_date_id",
+        "transactions",
+        ["transaction_date", "id"],
+    )
+    op.drop_index("ix_transactions_transaction_date", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_transactions_transaction_date", "transactions", ["transaction_date"])
+    op.drop_index("ix_transactions_transaction_date_id", table_name="transactions")
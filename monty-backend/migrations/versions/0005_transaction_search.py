@@ -0,0 +1,66 @@
+"""full-text search over transaction comments
+
+Postgres: stored ``tsvector`` column generated from the comment (``russian``
+configuration) with a GIN index. SQLite: external-content FTS5 table plus triggers
+that mirror inserts, updates and deletes. Both backfill existing rows.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(
+            "ALTER TABLE transactions ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('russian', coalesce(comment, ''))) STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_transactions_search_vector ON transactions USING gin (search_vector)"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+            "comment, content='transactions', content_rowid='rowid', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+            "INSERT INTO transactions_fts(rowid, comment) VALUES (new.rowid, new.comment); END"
+        )
+        op.execute(
+            "CREATE TRIGGER transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+            "INSERT INTO transactions_fts(transactions_fts, rowid, comment) "
+            "VALUES ('delete', old.rowid, old.comment); END"
+        )
+        op.execute(
+            "CREATE TRIGGER transactions_fts_au AFTER UPDATE OF comment ON transactions BEGIN "
+            "INSERT INTO transactions_fts(transactions_fts, rowid, comment) "
+            "VALUES ('delete', old.rowid, old.comment); "
+            "INSERT INTO transactions_fts(rowid, comment) VALUES (new.rowid, new.comment); END"
+        )
+        op.execute("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_transactions_search_vector")
+        op.execute("ALTER TABLE transactions DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("transactions_fts_ai", "transactions_fts_ad", "transactions_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS transactions_fts")
@@ -0,0 +1,58 @@
+"""delta sync: transactions.updated_at and transaction_tombstones
+
+``updated_at`` is added in place (no table rebuild on SQLite, which would drop the
+FTS triggers) with a placeholder server default, then backfilled from
+``transaction_date``.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("'1970-01-01 00:00:00'"),
+        ),
+    )
+    op.execute("UPDATE transactions SET updated_at = COALESCE(transaction_date, CURRENT_TIMESTAMP)")
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column("transactions", "updated_at", server_default=None)
+    op.create_index("ix_transactions_updated_at_id", "transactions", ["updated_at", "id"])
+
+    op.create_table(
+        "transaction_tombstones",
+        sa.Column("transaction_id", sa.String(length=36), primary_key=True),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_transaction_tombstones_deleted_at_transaction_id",
+        "transaction_tombstones",
+        ["deleted_at", "transaction_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transaction_tombstones_deleted_at_transaction_id", table_name="transaction_tombstones"
+    )
+    op.drop_table("transaction_tombstones")
+    op.drop_index("ix_transactions_updated_at_id", table_name="transactions")
+    op.drop_column("transactions", "updated_at")
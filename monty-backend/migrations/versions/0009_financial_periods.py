@@ -0,0 +1,97 @@
+"""financial_periods calendar and transaction_daily_rollups.period_id
+
+The calendar is generated here from the stored ``salary_day`` (default 1, as in
+``SettingsService``) and existing rollups are stamped with their period. Afterwards
+the application keeps both in step (``period_calendar``).
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+
+"""
+import calendar
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HORIZON_DAYS = 366
+
+
+def _salary_date(year: int, month: int, salary_day: int) -> date:
+    return date(year, month, min(salary_day, calendar.monthrange(year, month)[1]))
+
+
+def _period_starts(first: date, last: date, salary_day: int) -> list[date]:
+    year, month = first.year, first.month
+    if first < _salary_date(year, month, salary_day):
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    starts = []
+    while True:
+        start = _salary_date(year, month, salary_day)
+        if start > last:
+            return starts
+        starts.append(start)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def upgrade() -> None:
+    periods = op.create_table(
+        "financial_periods",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("start_date", sa.Date(), nullable=False, unique=True),
+        sa.Column("end_date", sa.Date(), nullable=False),
+    )
+    # rollups have no triggers, so the SQLite table rebuild of batch mode is harmless here
+    with op.batch_alter_table("transaction_daily_rollups") as batch_op:
+        batch_op.add_column(sa.Column("period_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_transaction_daily_rollups_period_id",
+            "financial_periods",
+            ["period_id"],
+            ["id"],
+        )
+    op.create_index(
+        "ix_transaction_daily_rollups_period_id_category_id",
+        "transaction_daily_rollups",
+        ["period_id", "category_id"],
+    )
+
+    bind = op.get_bind()
+    raw = bind.execute(sa.text("SELECT value FROM settings WHERE key = 'salary_day'")).scalar()
+    try:
+        salary_day = int(raw) if raw else 1
+    except ValueError:
+        salary_day = 1
+    today = date.today()
+    first = bind.execute(sa.text("SELECT MIN(day) FROM transaction_daily_rollups")).scalar()
+    if isinstance(first, str):
+        first = date.fromisoformat(first)
+    starts = _period_starts(min(first or today, today), today + timedelta(days=HORIZON_DAYS), salary_day)
+    rows = []
+    for start, next_start in zip(starts, starts[1:]):
+        rows.append({"id": start.year * 100 + start.month, "start_date": start, "end_date": next_start - timedelta(days=1)})
+    op.bulk_insert(periods, rows)
+    op.execute(
+        "UPDATE transaction_daily_rollups SET period_id = ("
+        " SELECT p.id FROM financial_periods p"
+        " WHERE transaction_daily_rollups.day BETWEEN p.start_date AND p.end_date)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transaction_daily_rollups_period_id_category_id", table_name="transaction_daily_rollups"
+    )
+    with op.batch_alter_table("transaction_daily_rollups") as batch_op:
+        batch_op.drop_constraint("fk_transaction_daily_rollups_period_id", type_="foreignkey")
+        batch_op.drop_column("period_id")
+    op.drop_table("financial_periods")
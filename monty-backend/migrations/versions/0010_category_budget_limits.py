@@ -0,0 +1,42 @@
+"""category_budget_limits: current limit per category
+
+Backfilled from the latest ``monthly_budgets`` row of every category (lowest id wins
+when a category has several rows for its latest period).
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_budget_limits",
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), primary_key=True),
+        sa.Column("limit_amount", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO category_budget_limits (category_id, limit_amount)"
+        " SELECT b.category_id, b.limit_amount FROM monthly_budgets b"
+        " WHERE b.id = ("
+        "  SELECT b2.id FROM monthly_budgets b2"
+        "  WHERE b2.category_id = b.category_id"
+        "  ORDER BY b2.period DESC, b2.id"
+        "  LIMIT 1)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_budget_limits")
@@ -0,0 +1,38 @@
+"""category_balances: running all-time total per category
+
+Backfilled from ``transactions``; afterwards maintained by the rollup hooks on every
+ledger write. ``GET /goals`` reads the savings balance from here.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_balances",
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), primary_key=True),
+        sa.Column("total_amount", sa.BigInteger(), nullable=False),
+        sa.Column("tx_count", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO category_balances (category_id, total_amount, tx_count)"
+        " SELECT category_id, SUM(amount), COUNT(id) FROM transactions GROUP BY category_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_balances")
@@ -0,0 +1,38 @@
+"""categories.archived_at and category_purges
+
+Deleting a category archives it at once; its transactions are removed by a background
+job in chunks, with progress kept in ``category_purges``.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("categories", sa.Column("archived_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "category_purges",
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), primary_key=True),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.Column("purged_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_purges")
+    op.drop_column("categories", "archived_at")
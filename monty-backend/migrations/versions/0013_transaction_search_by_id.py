@@ -0,0 +1,97 @@
+"""key the SQLite search index by a stable integer, not transactions.rowid
+
+``transactions_fts`` from ``0005`` mirrored ``transactions.rowid``. ``transactions``
+has a string primary key, so its rowid is implicit and ``VACUUM`` may renumber it,
+which leaves the index pointing at the wrong rows. ``transactions_fts_keys`` gives each
+transaction an ``INTEGER PRIMARY KEY`` (an explicit rowid, kept by ``VACUUM``). The
+FTS rowid is that key, so triggers and search reach both tables through primary /
+unique indexes. Postgres is untouched.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGERS = ("transactions_fts_ai", "transactions_fts_ad", "transactions_fts_au")
+KEY_OF = "(SELECT key FROM transactions_fts_keys WHERE transaction_id = {ref}.id)"
+
+
+def _drop_index() -> None:
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS transactions_fts")
+    op.execute("DROP TABLE IF EXISTS transactions_fts_keys")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _drop_index()
+    op.execute(
+        "CREATE TABLE transactions_fts_keys ("
+        "key INTEGER PRIMARY KEY, transaction_id VARCHAR(36) NOT NULL UNIQUE)"
+    )
+    op.execute(
+        "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+        "comment, tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+        "INSERT INTO transactions_fts_keys(transaction_id) VALUES (new.id); "
+        "INSERT INTO transactions_fts(rowid, comment) VALUES ("
+        f"{KEY_OF.format(ref='new')}, new.comment); END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+        f"DELETE FROM transactions_fts WHERE rowid = {KEY_OF.format(ref='old')}; "
+        "DELETE FROM transactions_fts_keys WHERE transaction_id = old.id; END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_au AFTER UPDATE OF comment ON transactions BEGIN "
+        "UPDATE transactions_fts SET comment = new.comment "
+        f"WHERE rowid = {KEY_OF.format(ref='old')}; END"
+    )
+    op.execute("INSERT INTO transactions_fts_keys(transaction_id) SELECT id FROM transactions")
+    op.execute(
+        "INSERT INTO transactions_fts(rowid, comment) "
+        "SELECT k.key, t.comment FROM transactions_fts_keys k "
+        "JOIN transactions t ON t.id = k.transaction_id"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _drop_index()
+    op.execute(
+        "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+        "comment, content='transactions', content_rowid='rowid', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+        "INSERT INTO transactions_fts(rowid, comment) VALUES (new.rowid, new.comment); END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, comment) "
+        "VALUES ('delete', old.rowid, old.comment); END"
+    )
+    op.execute(
+        "CREATE TRIGGER transactions_fts_au AFTER UPDATE OF comment ON transactions BEGIN "
+        "INSERT INTO transactions_fts(transactions_fts, rowid, comment) "
+        "VALUES ('delete', old.rowid, old.comment); "
+        "INSERT INTO transactions_fts(rowid, comment) VALUES (new.rowid, new.comment); END"
+    )
+    op.execute("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
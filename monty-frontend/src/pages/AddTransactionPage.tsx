@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import {
   Container,
@@ -30,6 +30,8 @@ export function AddTransactionPage() {
   const [loading, setLoading] = useState(true);
   const [submitting, setSubmitting] = useState(false);
   const [transactionType, setTransactionType] = useState<'EXPENSE' | 'INCOME'>('EXPENSE');
+  // same entry re-submitted after a dropped response keeps its key and is replayed, not duplicated
+  const submission = useRef<{ signature: string; key: string } | null>(null);
 
   useEffect(() => {
     categoriesApi.getAll()
@@ -58,9 +60,20 @@ export function AddTransactionPage() {
     
     setSubmitting(true);
     haptic('heavy');
+
+    const signature = `${selectedCategory.id}:${amount}:${comment.trim()}`;
+    if (submission.current?.signature !== signature) {
+      submission.current = { signature, key: crypto.randomUUID() };
+    }
+    const idempotencyKey = submission.current.key;
     
     try {
-      await transactionsApi.create(selectedCategory.id, parseInt(amount), comment.trim() || undefined);
+      await transactionsApi.create(
+        selectedCategory.id,
+        parseInt(amount),
+        comment.trim() || undefined,
+        idempotencyKey,
+      );
       navigate('/');
     } catch (error) {
       console.error(error);
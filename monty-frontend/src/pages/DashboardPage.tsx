@@ -466,7 +466,14 @@ function BudgetCard({ budget, onBudgetChange, onOpenHistory }: { budget: Dashboa
           </Text>
         )}
       </Group>
-      <Text size="sm" c="dimmed" mb={8}>Потрачено {formatNumber(budget.spent)} ₸</Text>
+      <Text size="sm" c="dimmed" mb={budget.projected_spend != null ? 2 : 8}>Потрачено {formatNumber(budget.spent)} ₸</Text>
+      {budget.projected_spend != null && (
+        <Text size="xs" c={budget.overspend_date ? 'red' : 'dimmed'} mb={8}>
+          Прогноз {formatNumber(budget.projected_spend)} ₸
+          {budget.overspend_date &&
+            ` · лимит ${isOverBudget ? 'превышен' : 'будет превышен'} ${new Date(budget.overspend_date).toLocaleDateString('ru-RU', { day: 'numeric', month: 'short' })}`}
+        </Text>
+      )}
       <Progress 
         value={Math.min(100, Math.max(0, percent))} 
         color={color} 
@@ -23,7 +23,7 @@ import { IconChevronLeft, IconChevronRight, IconSearch, IconDownload, IconTrash,
 import { transactionsApi, categoriesApi } from '../api';
 import { useTelegram } from '../hooks/useTelegram';
 import { LoadingSkeleton } from '../components/LoadingSkeleton';
-import type { Transaction, Category } from '../types';
+import type { Transaction, TransactionTotals, Category } from '../types';
 import { modalShellResponsive } from '../theme/dashboardChrome';
 
 const TIMEZONE = 'Asia/Almaty';
@@ -64,6 +64,9 @@ export function TransactionsPage() {
   const [viewMode, setViewMode] = useState<'all' | 'day'>('all');
   const [selectedDate, setSelectedDate] = useState<Date>(() => getTodayUTC5());
   const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [totals, setTotals] = useState<TransactionTotals | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [categories, setCategories] = useState<Category[]>([]);
   const [loading, setLoading] = useState(true);
   const [search, setSearch] = useState('');
@@ -80,8 +83,7 @@ export function TransactionsPage() {
     return () => clearTimeout(t);
   }, [search]);
 
-  const loadTransactions = useCallback(() => {
-    setLoading(true);
+  const buildParams = useCallback(() => {
     const params: { category_id?: number; start_date?: string; end_date?: string; search?: string } = {};
     if (categoryId) params.category_id = categoryId;
     if (viewMode === 'day') {
@@ -91,17 +93,40 @@ export function TransactionsPage() {
       params.end_date = toDateString(end);
     }
     if (searchDebounced.trim()) params.search = searchDebounced.trim();
+    return params;
+  }, [categoryId, viewMode, selectedDate, searchDebounced]);
+
+  const loadTransactions = useCallback(() => {
+    setLoading(true);
+    const params = buildParams();
     Promise.all([
-      transactionsApi.getAll(params),
+      transactionsApi.getPage(params),
+      transactionsApi.totals(params),
       categoriesApi.getAll(),
     ])
-      .then(([txs, cats]) => {
-        setTransactions(txs);
+      .then(([page, pageTotals, cats]) => {
+        setTransactions(page.items);
+        setNextCursor(page.nextCursor);
+        setTotals(pageTotals);
         setCategories(cats);
       })
       .catch(console.error)
       .finally(() => setLoading(false));
-  }, [categoryId, viewMode, selectedDate, searchDebounced]);
+  }, [buildParams]);
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    haptic('light');
+    setLoadingMore(true);
+    transactionsApi
+      .getPage({ ...buildParams(), cursor: nextCursor })
+      .then((page) => {
+        setTransactions((prev) => [...prev, ...page.items]);
+        setNextCursor(page.nextCursor);
+      })
+      .catch(console.error)
+      .finally(() => setLoadingMore(false));
+  };
 
   useEffect(() => {
     loadTransactions();
@@ -190,19 +215,11 @@ export function TransactionsPage() {
     ...incomeCategories.map(c => ({ value: String(c.id), label: `${c.icon} ${c.name}` })),
   ];
 
-  const income = transactions.reduce((s, tx) => {
-    const cat = categoryMap[tx.category_id];
-    return s + (cat?.type === 'INCOME' ? tx.amount : 0);
-  }, 0);
-  const expense = transactions.reduce((s, tx) => {
-    const cat = categoryMap[tx.category_id];
-    return s + (cat?.type === 'EXPENSE' && cat?.group !== 'SAVINGS' ? tx.amount : 0);
-  }, 0);
-  const savings = transactions.reduce((s, tx) => {
-    const cat = categoryMap[tx.category_id];
-    return s + (cat?.group === 'SAVINGS' ? tx.amount : 0);
-  }, 0);
-  const balance = income - expense;
+  // server-side totals over every matching row, not just the loaded pages
+  const income = totals?.income ?? 0;
+  const expense = totals?.expense ?? 0;
+  const savings = totals?.savings ?? 0;
+  const balance = totals?.balance ?? 0;
 
   if (loading && transactions.length === 0) {
     return (
@@ -471,6 +488,11 @@ export function TransactionsPage() {
               );
             })
           )}
+          {nextCursor && (
+            <Button variant="light" radius="xl" loading={loadingMore} onClick={loadMore}>
+              Показать ещё
+            </Button>
+          )}
         </Stack>
       </Stack>
 
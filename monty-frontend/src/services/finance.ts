@@ -7,6 +7,8 @@ import type {
   Goal,
   Settings,
   Transaction,
+  TransactionPage,
+  TransactionTotals,
   User,
 } from '../types';
 import api from './http';
@@ -45,16 +47,37 @@ export const categoriesApi = {
 };
 
 export const transactionsApi = {
-  create: async (categoryId: number, amount: number, comment?: string) => {
-    const { data } = await api.post<Transaction>('/transactions', {
-      category_id: categoryId,
-      amount,
-      comment,
-    });
-    return data;
-  },
-  getAll: async (params?: { category_id?: number; start_date?: string; end_date?: string; search?: string }) => {
-    const { data } = await api.get<Transaction[]>('/transactions', { params });
+  create: async (categoryId: number, amount: number, comment?: string, idempotencyKey?: string) => {
+    const { data } = await api.post<Transaction>(
+      '/transactions',
+      {
+        category_id: categoryId,
+        amount,
+        comment,
+      },
+      idempotencyKey ? { headers: { 'Idempotency-Key': idempotencyKey } } : undefined,
+    );
+    return data;
+  },
+  getPage: async (params?: {
+    category_id?: number;
+    start_date?: string;
+    end_date?: string;
+    search?: string;
+    limit?: number;
+    cursor?: string;
+  }): Promise<TransactionPage> => {
+    const { data, headers } = await api.get<Transaction[]>('/transactions', { params });
+    const cursor = headers['x-next-cursor'];
+    return { items: data, nextCursor: typeof cursor === 'string' ? cursor : null };
+  },
+  totals: async (params?: {
+    category_id?: number;
+    start_date?: string;
+    end_date?: string;
+    search?: string;
+  }) => {
+    const { data } = await api.get<TransactionTotals>('/transactions/totals', { params });
     return data;
   },
   update: async (id: string, payload: { category_id?: number; amount?: number; comment?: string }) => {
@@ -80,7 +103,7 @@ export const transactionsApi = {
 
 export const budgetsApi = {
   current: async () => {
-    const { data } = await api.get<DashboardResponse>('/budgets/current');
+    const { data } = await api.get<DashboardResponse>('/budgets/current', { params: { forecast: true } });
     return data;
   },
 };
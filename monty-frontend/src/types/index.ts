@@ -21,6 +21,8 @@ export interface BudgetWithSpent {
   limit_amount: number;
   spent: number;
   remaining: number;
+  projected_spend?: number | null;
+  overspend_date?: string | null;
 }
 
 export interface DashboardResponse {
@@ -48,6 +50,19 @@ export interface Transaction {
   comment: string | null;
 }
 
+export interface TransactionPage {
+  items: Transaction[];
+  nextCursor: string | null;
+}
+
+export interface TransactionTotals {
+  income: number;
+  expense: number;
+  savings: number;
+  balance: number;
+  count: number;
+}
+
 export interface Settings {
   target_amount: string;
   target_date: string;